@@ -0,0 +1,85 @@
+"""
+Compares the generation time and aliasing of the naive ``sawtooth_wave()``
+and ``np.sin`` carriers with the band-limited wavetable carriers, and the
+time of ``Vocoder`` with fewer bands and lower filter orders, which the
+cleaner wavetable carrier allows.
+
+Aliasing is the fraction of the power of one second of a carrier with an
+integer frequency that is not at one of its harmonics.
+
+Run with: ``python benchmarks/carriers.py``
+"""
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import Vocoder, WavetableWave
+from voicebox.effects.vocoder import sawtooth_wave
+
+SAMPLE_RATE = 24_000
+FREQS = (160, 1_001, 3_001)
+SECONDS = 10.0
+REPEATS = 5
+
+
+def best_time(func: Callable[[], object]) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def get_aliasing(signal: np.ndarray, freq: int) -> float:
+    power = np.abs(np.fft.rfft(signal[:SAMPLE_RATE])) ** 2
+    harmonics = np.arange(0, len(power), freq)
+    return max(1 - power[harmonics].sum() / power.sum(), 0.0)
+
+
+def main() -> None:
+    times = np.arange(round(SECONDS * SAMPLE_RATE)) * (1.0 / SAMPLE_RATE)
+
+    carriers = {
+        "np.sin": lambda f: np.sin(2 * np.pi * f * times),
+        "sawtooth_wave": lambda f: sawtooth_wave(2 * np.pi * f * times),
+        "wavetable sawtooth": lambda f: WavetableWave(f)(times),
+        "wavetable square": lambda f: WavetableWave(f, "square")(times),
+    }
+
+    print(f"Carrier generation time per second of audio and aliasing, {SAMPLE_RATE} Hz")
+    print(f"{'carrier':>20} {'time':>8} " + " ".join(f"{f:>9g}Hz" for f in FREQS))
+
+    for name, build in carriers.items():
+        duration = best_time(lambda: build(FREQS[0]))
+        aliasing = [get_aliasing(build(f), f) for f in FREQS]
+        print(
+            f"{name:>20} {duration * 1000 / SECONDS:>6.2f}ms "
+            + " ".join(f"{a:>11.2e}" for a in aliasing)
+        )
+
+    rng = np.random.default_rng(0)
+    audio = Audio(rng.uniform(-0.5, 0.5, len(times)), SAMPLE_RATE)
+    vocoders = {
+        "sawtooth, 40 bands, order 3": Vocoder.build(carrier_cache_max_bytes=0),
+        "wavetable, 20 bands, order 2": Vocoder.build(
+            carrier_wave_builder=WavetableWave,
+            bands=20,
+            bandpass_filter_order=2,
+            carrier_cache_max_bytes=0,
+        ),
+    }
+
+    print()
+    print("Vocoder time per second of audio, without the carrier cache")
+    for name, vocoder in vocoders.items():
+        duration = best_time(lambda: vocoder.get_wet_signal(audio))
+        print(f"{name:>30} {duration * 1000 / SECONDS:>6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares the peak memory allocated while applying a chain of effects with
+``SeriesChain(inplace=False)`` and ``SeriesChain(inplace=True)``, in units of
+the size of the input signal.
+
+Memory is measured with :mod:`tracemalloc`, which tracks numpy arrays.
+
+Run with: ``python benchmarks/effects_memory.py``
+"""
+
+import time
+import tracemalloc
+from typing import Tuple
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import (
+    ConvertDtype,
+    Filter,
+    Flanger,
+    Normalize,
+    ParallelChain,
+    RingMod,
+    SeriesChain,
+)
+
+SAMPLE_RATE = 24_000
+SECONDS = 30.0
+
+CHAINS = {
+    "filter+ringmod+normalize": lambda: [
+        ConvertDtype(),
+        Filter.build("highpass", 100),
+        RingMod(),
+        Normalize(),
+    ],
+    "filter+flanger+ringmod+normalize": lambda: [
+        ConvertDtype(),
+        Filter.build("bandpass", (100, 8000)),
+        Flanger(t_offset_func=None),
+        RingMod(),
+        Normalize(),
+    ],
+    "parallel(ringmod,filter)+normalize": lambda: [
+        ConvertDtype(),
+        ParallelChain(RingMod(), Filter.build("lowpass", 1000), dry_gain=0.5),
+        Normalize(),
+    ],
+}
+
+
+def measure(chain: SeriesChain, audio: Audio) -> Tuple[float, float]:
+    """Returns the peak allocated bytes and the run time in seconds."""
+
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        chain.apply(audio)
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, duration
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    signal = rng.uniform(-0.5, 0.5, round(SECONDS * SAMPLE_RATE)).astype(np.float32)
+
+    print(
+        f"Peak memory allocated by effects on {SECONDS:g}s of float32 audio, "
+        f"in multiples of the signal size ({signal.nbytes / 2**20:.1f} MiB)"
+    )
+    print(f"{'chain':>36} {'copying':>8} {'inplace':>8}")
+
+    for name, build_effects in CHAINS.items():
+        results = []
+        for inplace in (False, True):
+            chain = SeriesChain(*build_effects(), inplace=inplace)
+            peak, _ = measure(chain, Audio(signal.copy(), SAMPLE_RATE))
+            results.append(peak / signal.nbytes)
+
+        print(f"{name:>36} {results[0]:>7.2f}x {results[1]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares the per-utterance latency of ``ESpeakNG``, which starts a new
+``espeak-ng`` process for every utterance, and ``PrewarmedESpeakNG``, which
+starts each process ahead of time.
+
+Utterances are generated back to back, and with a pause between them (like
+prompts arriving one at a time), which gives the prewarmed process time to
+finish starting up.
+
+Run with: ``python benchmarks/espeakng.py [path/to/espeak-ng]``
+"""
+
+import shutil
+import statistics
+import sys
+import time
+from typing import List
+
+from voicebox.tts import ESpeakConfig, ESpeakNG, PrewarmedESpeakNG
+from voicebox.tts.tts import TTS
+
+UTTERANCES = 50
+PAUSE_SECONDS = 0.1
+TEXTS = ["Yes.", "Turning left.", "Battery low.", "Hello there!"]
+
+
+def measure(tts: TTS, pause: float) -> List[float]:
+    # First call is excluded, so every TTS starts warm
+    tts.get_speech(TEXTS[0])
+    time.sleep(pause)
+
+    times = []
+    for i in range(UTTERANCES):
+        start = time.perf_counter()
+        tts.get_speech(TEXTS[i % len(TEXTS)])
+        times.append(time.perf_counter() - start)
+        time.sleep(pause)
+
+    return times
+
+
+def main() -> None:
+    exe_path = sys.argv[1] if len(sys.argv) > 1 else "espeak-ng"
+    if shutil.which(exe_path) is None:
+        print(f"Skipping eSpeak NG benchmark; {exe_path!r} not found.")
+        return
+
+    config = ESpeakConfig(exe_path=exe_path)
+
+    print(f"eSpeak NG latency per utterance; {UTTERANCES} short utterances")
+    print(f"{'engine':>18} {'pause':>7} {'mean':>9} {'median':>9} {'max':>9}")
+
+    for pause in (0.0, PAUSE_SECONDS):
+        for tts in (ESpeakNG(config), PrewarmedESpeakNG(config)):
+            times = measure(tts, pause)
+
+            if isinstance(tts, PrewarmedESpeakNG):
+                tts.close()
+
+            print(
+                f"{type(tts).__name__:>18} {pause:>6.2f}s "
+                f"{statistics.mean(times) * 1000:>7.1f}ms "
+                f"{statistics.median(times) * 1000:>7.1f}ms "
+                f"{max(times) * 1000:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
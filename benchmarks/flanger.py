@@ -0,0 +1,58 @@
+"""
+Compares the block-based ``Flanger`` feedback delay line against the original
+sample-by-sample implementation.
+
+Run with: ``python benchmarks/flanger.py``
+"""
+
+from timeit import timeit
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import Flanger
+
+SAMPLE_RATES = (16_000, 24_000, 48_000)
+SECONDS = 10.0
+REPEAT = 3
+
+
+def sample_by_sample_wet_signal(flanger: Flanger, audio: Audio) -> np.ndarray:
+    delay_offsets = flanger._get_delay_offsets(audio)
+
+    wet = np.zeros_like(audio.signal)
+    for i, (in_sample, delay_offset) in enumerate(zip(audio.signal, delay_offsets)):
+        i_delay = i - delay_offset
+        delay_sample = wet[i_delay] if i_delay >= 0 else 0
+        wet[i] = in_sample + flanger.feedback * delay_sample
+
+    return wet
+
+
+def main() -> None:
+    flanger = Flanger(t_offset_func=None)
+    rng = np.random.default_rng(0)
+
+    print(f"Flanger wet signal, {SECONDS:g} seconds of audio")
+    print(f"{'sample rate':>12} {'original':>10} {'block':>10} {'speedup':>8}")
+
+    for sample_rate in SAMPLE_RATES:
+        signal = rng.uniform(-1, 1, round(SECONDS * sample_rate)).astype(np.float32)
+        audio = Audio(signal, sample_rate)
+
+        np.testing.assert_array_equal(
+            sample_by_sample_wet_signal(flanger, audio),
+            flanger.get_wet_signal(audio),
+        )
+
+        original = timeit(lambda: sample_by_sample_wet_signal(flanger, audio), number=1)
+        block = timeit(lambda: flanger.get_wet_signal(audio), number=REPEAT) / REPEAT
+
+        print(
+            f"{sample_rate:>12} {original:>9.3f}s {block:>9.3f}s "
+            f"{original / block:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
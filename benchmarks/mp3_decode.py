@@ -0,0 +1,82 @@
+"""
+Compares MP3 decoding time per second of audio of pedalboard, which
+``get_audio_from_mp3()`` uses by default, and the audioread fallback.
+
+The MP3 files are encoded with pedalboard, so no audio files are needed.
+audioread needs a backend, e.g. ffmpeg or GStreamer; if none is installed,
+only pedalboard is measured.
+
+Run with: ``python benchmarks/mp3_decode.py``
+"""
+
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Optional
+
+import audioread
+import numpy as np
+from pedalboard.io import AudioFile
+
+from voicebox.tts.utils import (
+    get_audio_from_mp3_audioread,
+    get_audio_from_mp3_pedalboard,
+)
+
+SAMPLE_RATE = 24_000
+DURATIONS = (1.0, 10.0, 60.0)
+REPEATS = 5
+
+
+def write_mp3(path: Path, seconds: float) -> None:
+    rng = np.random.default_rng(0)
+    signal = rng.uniform(-0.5, 0.5, round(seconds * SAMPLE_RATE))
+
+    with AudioFile(str(path), "w", samplerate=SAMPLE_RATE, num_channels=1) as f:
+        f.write(signal.astype(np.float32))
+
+
+def measure(decode: Callable[[], object], seconds: float) -> Optional[float]:
+    """Returns the best decode time in ms per second of audio."""
+
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        try:
+            decode()
+        except audioread.NoBackendError:
+            return None
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000 / seconds
+
+
+def main() -> None:
+    print(f"MP3 decode time per second of audio; best of {REPEATS}")
+    print(f"{'audio':>7} {'pedalboard':>11} {'pb memory':>10} {'audioread':>10}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for seconds in DURATIONS:
+            path = Path(temp_dir) / f"{seconds:g}.mp3"
+            write_mp3(path, seconds)
+            mp3_bytes = path.read_bytes()
+
+            results = [
+                measure(lambda: get_audio_from_mp3_pedalboard(path), seconds),
+                measure(
+                    lambda: get_audio_from_mp3_pedalboard(BytesIO(mp3_bytes)),
+                    seconds,
+                ),
+                measure(lambda: get_audio_from_mp3_audioread(path), seconds),
+            ]
+
+            results = [
+                f"{result:.2f}ms" if result is not None else "no backend"
+                for result in results
+            ]
+            print(f"{seconds:>6g}s {results[0]:>11} {results[1]:>10} {results[2]:>10}")
+
+
+if __name__ == "__main__":
+    main()
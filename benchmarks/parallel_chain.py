@@ -0,0 +1,85 @@
+"""
+Compares the run time and peak memory of a wide ``ParallelChain`` when
+combining the branch outputs in a matrix (any ``combine_func`` other than
+``np.sum``) or summing them one by one, and with branches applied one after
+another or on a thread pool.
+
+Peak memory is measured with :mod:`tracemalloc`, in multiples of the size of
+the input signal. Thread pools only help with more than one CPU.
+
+Run with: ``python benchmarks/parallel_chain.py``
+"""
+
+import os
+import time
+import tracemalloc
+from typing import Optional, Tuple
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import Filter, ParallelChain
+
+SAMPLE_RATE = 24_000
+SECONDS = 30.0
+BRANCHES = 8
+REPEATS = 3
+
+
+def matrix_sum(signals: np.ndarray, axis: int) -> np.ndarray:
+    return np.sum(signals, axis=axis)
+
+
+def build_chain(combine_func, max_workers: Optional[int]) -> ParallelChain:
+    bands = np.geomspace(100, 8000, BRANCHES + 1)
+    effects = [
+        Filter.build("bandpass", (low, high), order=4)
+        for low, high in zip(bands[:-1], bands[1:])
+    ]
+    return ParallelChain(
+        *effects, dry_gain=0.5, combine_func=combine_func, max_workers=max_workers
+    )
+
+
+def measure(chain: ParallelChain, audio: Audio) -> Tuple[float, float]:
+    """Returns the best run time in seconds and the peak allocated bytes."""
+
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        chain.apply(audio)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        chain.apply(audio)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    signal = rng.uniform(-0.5, 0.5, round(SECONDS * SAMPLE_RATE)).astype(np.float32)
+    audio = Audio(signal, SAMPLE_RATE)
+
+    print(
+        f"ParallelChain of {BRANCHES} filters on {SECONDS:g}s of float32 audio; "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(f"{'combine':>8} {'workers':>8} {'time':>9} {'peak memory':>12}")
+
+    for combine_name, combine_func in (("matrix", matrix_sum), ("sum", np.sum)):
+        for max_workers in (1, 4):
+            chain = build_chain(combine_func, max_workers)
+            duration, peak = measure(chain, audio)
+            print(
+                f"{combine_name:>8} {max_workers:>8} {duration * 1000:>7.0f}ms "
+                f"{peak / signal.nbytes:>11.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
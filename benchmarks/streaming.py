@@ -0,0 +1,110 @@
+"""
+Compares time-to-first-audio and end-to-end latency of ``ParallelVoicebox``
+with and without ``streaming=True``.
+
+Uses a synthetic TTS that generates audio incrementally at a fixed multiple
+of real time, and a sink that plays audio in real time, so the results do
+not depend on any TTS engine or audio device being installed.
+
+Run with: ``python benchmarks/streaming.py``
+"""
+
+import time
+from typing import Iterator, List
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import Filter, Normalize, RingMod
+from voicebox.sinks import Sink
+from voicebox.tts import TTS
+from voicebox.voiceboxes.parallel import ParallelVoicebox
+
+SAMPLE_RATE = 22_050
+SECONDS_PER_CHAR = 0.06
+BLOCK_SECONDS = 0.05
+SYNTHESIS_SPEED = 10.0
+"""How many times faster than real time the synthetic TTS generates audio."""
+
+TEXTS = {
+    "short": "Hello there!",
+    "long": (
+        "This is a much longer sentence, which takes quite a bit longer to "
+        "synthesize, so streaming should make a bigger difference here."
+    ),
+}
+
+
+class SyntheticTTS(TTS):
+    def get_speech(self, text: str) -> Audio:
+        signals = [block.signal for block in self.stream_speech(text)]
+        return Audio(np.concatenate(signals), SAMPLE_RATE)
+
+    def stream_speech(self, text: str) -> Iterator[Audio]:
+        rng = np.random.default_rng(0)
+        block_size = round(BLOCK_SECONDS * SAMPLE_RATE)
+        blocks = max(round(len(text) * SECONDS_PER_CHAR / BLOCK_SECONDS), 1)
+
+        for _ in range(blocks):
+            time.sleep(BLOCK_SECONDS / SYNTHESIS_SPEED)
+            signal = rng.uniform(-0.5, 0.5, block_size).astype(np.float32)
+            yield Audio(signal, SAMPLE_RATE)
+
+
+class RealTimeSink(Sink):
+    first_audio_time: float
+    done_time: float
+
+    def play(self, audio: Audio) -> None:
+        if len(audio) and not hasattr(self, "first_audio_time"):
+            self.first_audio_time = time.perf_counter()
+
+        time.sleep(audio.len_seconds)
+        self.done_time = time.perf_counter()
+
+
+def measure(text: str, streaming: bool) -> List[float]:
+    sink = RealTimeSink()
+    effects = [
+        Filter.build("highpass", 100),
+        RingMod(),
+        Normalize(stream_lookahead=BLOCK_SECONDS),
+    ]
+
+    with ParallelVoicebox(
+        SyntheticTTS(),
+        effects,
+        sink,
+        queue_get_timeout=0.01,
+        streaming=streaming,
+    ) as voicebox:
+        start = time.perf_counter()
+        voicebox.say(text)
+        voicebox.wait_until_done()
+
+    return [sink.first_audio_time - start, sink.done_time - start]
+
+
+def main() -> None:
+    print(
+        f"ParallelVoicebox latency; TTS at {SYNTHESIS_SPEED:g}x real time, "
+        f"{BLOCK_SECONDS * 1000:g} ms blocks"
+    )
+    print(
+        f"{'text':>6} {'audio':>7} {'mode':>10} "
+        f"{'first audio':>12} {'end-to-end':>11}"
+    )
+
+    for name, text in TEXTS.items():
+        audio_seconds = len(text) * SECONDS_PER_CHAR
+        for streaming in (False, True):
+            first_audio, end_to_end = measure(text, streaming)
+            mode = "streaming" if streaming else "whole"
+            print(
+                f"{name:>6} {audio_seconds:>6.2f}s {mode:>10} "
+                f"{first_audio * 1000:>10.0f}ms {end_to_end * 1000:>9.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
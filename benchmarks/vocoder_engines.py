@@ -0,0 +1,95 @@
+"""
+Compares the run time of the ``"iir"`` and ``"stft"`` ``Vocoder`` engines
+for different numbers of bands, and how similar their outputs are.
+
+Similarity is the correlation of the log power of the two outputs in each
+band, and of their amplitude envelopes in 20 ms frames.
+
+Run with: ``python benchmarks/vocoder_engines.py``
+"""
+
+import time
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects import Vocoder
+
+SAMPLE_RATE = 24_000
+SECONDS = 10.0
+BANDS = (10, 20, 40, 80, 160)
+REPEATS = 3
+
+
+def build_audio() -> Audio:
+    rng = np.random.default_rng(0)
+    t = np.arange(round(SECONDS * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = (
+        0.25 * np.sin(2 * np.pi * 300 * t) * (1 + np.sin(2 * np.pi * 3 * t))
+        + 0.2 * np.sin(2 * np.pi * 2000 * t)
+        + 0.05 * rng.standard_normal(len(t))
+    )
+    return Audio(signal, SAMPLE_RATE)
+
+
+def measure(vocoder: Vocoder, audio: Audio) -> float:
+    """Returns the best run time in ms per second of audio."""
+
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        vocoder.get_wet_signal(audio)
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000 / SECONDS
+
+
+def similarity(vocoder: Vocoder, a: np.ndarray, b: np.ndarray) -> tuple:
+    freqs = np.fft.rfftfreq(len(a), 1 / SAMPLE_RATE)
+    powers = [np.abs(np.fft.rfft(s)) ** 2 for s in (a, b)]
+    band_powers = [
+        [p[(low <= freqs) & (freqs < high)].sum() + 1e-12 for p in powers]
+        for low, high in (
+            bpf.filter_param_builder.freq for bpf in vocoder.bandpass_filters
+        )
+    ]
+    spectral = np.corrcoef(np.log(np.array(band_powers).T))[0, 1]
+
+    frame = SAMPLE_RATE // 50
+    envelopes = [
+        np.sqrt(np.mean(s[: len(s) // frame * frame].reshape(-1, frame) ** 2, axis=1))
+        for s in (a, b)
+    ]
+    temporal = np.corrcoef(envelopes)[0, 1]
+
+    return spectral, temporal
+
+
+def main() -> None:
+    audio = build_audio()
+
+    print(
+        f"Vocoder time per second of audio at {SAMPLE_RATE} Hz, without the carrier cache"
+    )
+    print(
+        f"{'bands':>6} {'iir':>9} {'stft':>9} "
+        f"{'spectral sim.':>14} {'envelope sim.':>14}"
+    )
+
+    for bands in BANDS:
+        vocoders = [
+            Vocoder.build(bands=bands, engine=engine, carrier_cache_max_bytes=0)
+            for engine in ("iir", "stft")
+        ]
+        durations = [measure(vocoder, audio) for vocoder in vocoders]
+        spectral, temporal = similarity(
+            vocoders[0], *(vocoder.get_wet_signal(audio) for vocoder in vocoders)
+        )
+        print(
+            f"{bands:>6} {durations[0]:>7.2f}ms {durations[1]:>7.2f}ms "
+            f"{spectral:>14.3f} {temporal:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,60 @@
 from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+_default_dtype = np.dtype(np.float32)
+
+_pcm_audio_lock = Lock()
+"""
+Guards the conversion of ``PcmAudio`` samples. Shared by all instances, so
+they stay small and picklable; it is only taken until the first conversion.
+"""
+
+
+def get_default_dtype() -> np.dtype:
+    """
+    Returns the dtype that voiceboxes convert audio signals to before
+    applying effects, unless they are given a ``dtype``. Defaults to float32.
+    """
+
+    return _default_dtype
+
+
+def set_default_dtype(dtype: DTypeLike) -> None:
+    """
+    Sets the dtype returned by ``get_default_dtype()``, e.g. ``np.float64``
+    for more precision at twice the memory use.
+
+    Raises:
+        ValueError:
+            If the dtype is not a floating-point type.
+    """
+
+    global _default_dtype
+    _default_dtype = resolve_dtype(dtype)
+
+
+def resolve_dtype(dtype: Optional[DTypeLike]) -> np.dtype:
+    """
+    Returns the given dtype as a :class:`numpy.dtype`, or the default dtype
+    (see ``get_default_dtype()``) if it is ``None``.
+
+    Raises:
+        ValueError:
+            If the dtype is not a floating-point type.
+    """
+
+    if dtype is None:
+        return get_default_dtype()
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"Audio dtype must be a float type; dtype={dtype}")
+
+    return dtype
 
 
 @dataclass
@@ -19,6 +73,11 @@ class Audio:
     signal: np.ndarray
     sample_rate: int
 
+    @property
+    def dtype(self) -> np.dtype:
+        """The dtype of the signal."""
+        return self.signal.dtype
+
     @property
     def len_bytes(self) -> int:
         """Length of audio signal in bytes."""
@@ -73,3 +132,119 @@ class Audio:
             signal=signal if signal is not None else self.signal.copy(),
             sample_rate=sample_rate if sample_rate is not None else self.sample_rate,
         )
+
+    def astype(self, dtype: DTypeLike = None) -> "Audio":
+        """
+        Returns audio with the signal converted to the given float dtype
+        (see ``resolve_dtype()``), or self if it already has that dtype.
+        """
+
+        dtype = resolve_dtype(dtype)
+        if self.dtype == dtype:
+            return self
+
+        return self.copy(signal=self.signal.astype(dtype))
+
+
+class PcmAudio(Audio):
+    """
+    Audio that keeps its signal as the raw signed integer PCM samples, e.g.
+    int16, until ``signal`` is first used, so audio that is only stored
+    (e.g. in a cache) or never used takes a fraction of the memory of the
+    float32 signal.
+
+    Accessing ``signal`` converts the samples to float32 once (see
+    ``pcm_to_float32()``) and releases them; setting ``signal`` replaces them.
+
+    Args:
+        samples:
+            The raw samples as a 1D numpy array of signed ints.
+        sample_rate:
+            Number of samples per second.
+    """
+
+    samples: Optional[np.ndarray]
+    """The raw samples, or ``None`` once they were converted to ``signal``."""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int):
+        self.samples = samples
+        self._signal = None
+        self.sample_rate = sample_rate
+
+    @property
+    def signal(self) -> np.ndarray:
+        signal = self._signal
+        if signal is not None:
+            return signal
+
+        with _pcm_audio_lock:
+            # Another thread may have converted the samples in the meantime
+            if self._signal is None:
+                self._signal = pcm_to_float32(self.samples)
+                self.samples = None
+
+            return self._signal
+
+    @signal.setter
+    def signal(self, signal: np.ndarray) -> None:
+        with _pcm_audio_lock:
+            self._signal = signal
+            self.samples = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        if self.samples is not None:
+            return np.dtype(np.float32)
+
+        return self.signal.dtype
+
+    @property
+    def len_bytes(self) -> int:
+        samples = self.samples
+        if samples is not None:
+            return samples.nbytes
+
+        return self.signal.nbytes
+
+    def __len__(self) -> int:
+        samples = self.samples
+        if samples is not None:
+            return len(samples)
+
+        return len(self.signal)
+
+    def copy(self, signal: np.ndarray = None, sample_rate: int = None) -> "Audio":
+        samples = self.samples
+        if samples is None or signal is not None:
+            return super().copy(signal, sample_rate)
+
+        return PcmAudio(
+            samples=samples.copy(),
+            sample_rate=sample_rate if sample_rate is not None else self.sample_rate,
+        )
+
+
+def pcm_to_float32(samples: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Converts signed integer PCM samples to a float32 signal in range
+    ``[-1, 1)``, in a single pass without intermediate arrays.
+
+    Args:
+        samples:
+            The raw samples, of any signed int dtype.
+        out:
+            (Optional) A float32 array of the same shape to write the signal
+            to, e.g. to reuse a buffer. A new array is returned by default.
+
+    Raises:
+        ValueError:
+            If the samples are not signed ints.
+    """
+
+    if samples.dtype.kind != "i":
+        raise ValueError(f"samples must be signed ints; dtype={samples.dtype}")
+
+    # Dividing by a power of 2 is exact, so this matches converting via float64
+    scale = np.float32(2.0 ** -(8 * samples.dtype.itemsize - 1))
+
+    return np.multiply(samples, scale, out=out, dtype=np.float32)
@@ -1,5 +1,7 @@
+from voicebox.effects.carriers import *
 from voicebox.effects.chain import *
 from voicebox.effects.dc_offset import *
+from voicebox.effects.dtype import *
 from voicebox.effects.effect import *
 from voicebox.effects.eq import *
 from voicebox.effects.flanger import *
@@ -9,6 +11,7 @@ from voicebox.effects.normalize import *
 from voicebox.effects.pedalboard import *
 from voicebox.effects.tail import *
 from voicebox.effects.vocoder import *
+from voicebox.effects.wavetable import *
 
 
 def default_effects() -> Effects:
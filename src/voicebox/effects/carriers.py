@@ -0,0 +1,283 @@
+"""
+Carrier waves for e.g. ``Vocoder``, which change pitch at random.
+
+Carrier waves take an array of evenly spaced sample times and return the
+corresponding wave samples. The waves here integrate the frequency into the
+phase with ``np.cumsum()``, so the phase is continuous across pitch changes
+(no clicks), and no Python code runs per sample or per pitch.
+
+Each call starts a new wave, with new random pitches. To continue one wave
+across consecutive blocks of times, e.g. when streaming, use
+``RandomPitchWave.get_wave_block()``.
+"""
+
+__all__ = [
+    "RandomPitchState",
+    "RandomPitchWave",
+    "RandomSawtoothWave",
+    "RandomSemitoneWave",
+    "WAVEFORMS",
+]
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import ClassVar, Literal, Optional, Tuple
+
+import numpy as np
+
+from voicebox.effects.utils import Rng, get_generator
+
+Waveform = Literal["sawtooth", "square", "pulse"]
+
+WAVEFORMS: Tuple[str, ...] = ("sawtooth", "square", "pulse")
+"""
+Supported waveforms. ``"square"`` is a ``"pulse"`` with a duty cycle of 0.5.
+"""
+
+
+@dataclass
+class RandomPitchState:
+    """
+    State of a ``RandomPitchWave`` between consecutive blocks of times;
+    see ``RandomPitchWave.get_wave_block()``.
+    """
+
+    dt: float
+    """Seconds between samples."""
+
+    freq: float = 0.0
+    """Current pitch, in Hz."""
+
+    phase: float = 0.0
+    """Phase of the next sample, in cycles."""
+
+    remaining: int = 0
+    """Samples left at the current pitch; at ``0``, the next one is new."""
+
+
+class RandomPitchWave(ABC):
+    """
+    Base class of carrier waves that change to a random pitch every
+    ``pitch_duration`` seconds.
+
+    Subclasses choose the pitches with ``get_frequencies()``, and must have
+    these attributes:
+
+    - ``pitch_duration``: Seconds between pitch changes.
+    - ``rng``: The random number generator to use. Pass e.g.
+      ``np.random.default_rng(seed)`` for repeatable waves.
+    - ``waveform``: One of ``WAVEFORMS``.
+    - ``duty``: Fraction of each cycle that a ``"pulse"`` wave is high.
+    - ``band_limited``: Whether to smooth the waveform discontinuities with
+      PolyBLEP, which reduces aliasing of high harmonics.
+    """
+
+    pitch_duration: float
+    rng: Rng
+    waveform: Waveform
+    duty: float
+    band_limited: bool
+
+    deterministic: ClassVar[bool] = False
+    """See ``Vocoder``."""
+
+    @abstractmethod
+    def get_frequencies(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Returns ``count`` random pitches, in Hz."""
+
+        ...  # pragma: no cover
+
+    def __call__(self, times: np.ndarray) -> np.ndarray:
+        return self.get_wave_block(times)[0]
+
+    def get_wave_block(
+        self,
+        times: np.ndarray,
+        state: Optional[RandomPitchState] = None,
+        dt: Optional[float] = None,
+    ) -> Tuple[np.ndarray, Optional[RandomPitchState]]:
+        """
+        Returns the wave at the given times, and the state to pass along with
+        the next block of times, which must follow on from these. The pitch
+        and phase then carry on across blocks, as in one call on all the times.
+
+        Without a state, the pitch changes at multiples of ``pitch_duration``
+        from time 0, and the phase is the first pitch times ``times[0]``.
+
+        Args:
+            times:
+                Evenly spaced sample times, in seconds.
+            state:
+                The state returned along with the previous block, or ``None``
+                to start a new wave.
+            dt:
+                Seconds between samples. By default, it is taken from the
+                times, the state, or for a single time, ``pitch_duration``.
+        """
+
+        if dt is None:
+            if len(times) > 1:
+                dt = times[1] - times[0]
+            elif state is not None:
+                dt = state.dt
+            else:
+                dt = self.pitch_duration
+
+        if not len(times):
+            return np.zeros(0), state
+
+        chunk_size = max(round(self.pitch_duration / dt), 1)
+        rng = get_generator(self.rng)
+
+        # Samples of the first pitch that come before the first time
+        if state is None:
+            offset = round(times[0] / dt) % chunk_size
+        elif state.remaining:
+            offset = max(chunk_size - state.remaining, 0)
+        else:
+            offset = 0
+
+        chunks = -(-(offset + len(times)) // chunk_size)
+
+        if state is not None and state.remaining:
+            freqs = np.empty(chunks)
+            freqs[0] = state.freq
+            freqs[1:] = self.get_frequencies(rng, chunks - 1)
+        else:
+            freqs = self.get_frequencies(rng, chunks)
+
+        start_phase = freqs[0] * times[0] if state is None else state.phase
+
+        # Phase in cycles, as a (chunks, chunk_size) matrix with one pitch per
+        # row. Each row starts at the phase that the previous row ended at.
+        phase_steps = (freqs * dt)[:, np.newaxis]
+        start_phases = np.empty(chunks)
+        start_phases[0] = start_phase - phase_steps[0, 0] * offset
+        np.cumsum(phase_steps[:-1, 0] * chunk_size, out=start_phases[1:])
+        start_phases[1:] += start_phases[0]
+        start_phases %= 1.0
+
+        end = offset + len(times)
+        last_size = end - (chunks - 1) * chunk_size
+        next_state = RandomPitchState(
+            dt=dt,
+            freq=freqs[-1],
+            phase=(start_phases[-1] + phase_steps[-1, 0] * last_size) % 1.0,
+            remaining=chunks * chunk_size - end,
+        )
+
+        phase = np.multiply(phase_steps, np.arange(chunk_size))
+        phase += start_phases[:, np.newaxis]
+        _wrap(phase)
+
+        out = self._get_wave(phase, phase_steps)
+        return out.reshape(-1)[offset:end], next_state
+
+    def _get_wave(self, phase: np.ndarray, phase_steps: np.ndarray) -> np.ndarray:
+        """
+        Returns the waveform at the given phases. May overwrite ``phase``.
+        ``phase_steps`` must broadcast to the shape of ``phase``.
+        """
+
+        if self.waveform == "sawtooth":
+            blep = _poly_blep(phase, phase_steps) if self.band_limited else 0.0
+
+            out = phase
+            out *= 2
+            out -= 1
+            out -= blep
+            return out
+
+        if self.waveform in ("square", "pulse"):
+            duty = 0.5 if self.waveform == "square" else self.duty
+
+            out = np.where(phase < duty, 1.0, -1.0)
+            if self.band_limited:
+                out += _poly_blep(phase, phase_steps)
+                phase += 1 - duty
+                _wrap(phase)
+                out -= _poly_blep(phase, phase_steps)
+
+            return out
+
+        raise ValueError(
+            f"Unsupported waveform {self.waveform!r}; must be one of {WAVEFORMS}."
+        )
+
+
+@dataclass
+class RandomSawtoothWave(RandomPitchWave):
+    """
+    Carrier wave that changes to a random pitch between ``min_freq`` and
+    ``max_freq`` every ``pitch_duration`` seconds. Pitches are uniformly
+    distributed in octaves (log-frequency). Despite the name, ``waveform``
+    may be any of ``WAVEFORMS``.
+
+    See ``RandomPitchWave`` for the other arguments.
+    """
+
+    min_freq: float
+    max_freq: float
+    pitch_duration: float
+
+    rng: Rng = field(default_factory=np.random.default_rng)
+    waveform: Waveform = "sawtooth"
+    duty: float = 0.5
+    band_limited: bool = False
+
+    def get_frequencies(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        alpha = np.log2(self.max_freq / self.min_freq)
+        return self.min_freq * 2 ** (alpha * rng.random(count))
+
+
+@dataclass
+class RandomSemitoneWave(RandomPitchWave):
+    """
+    Carrier wave that changes to a random pitch every ``pitch_duration``
+    seconds, from ``min_freq`` up to ``max_semitones`` semitones above it,
+    in whole semitones.
+
+    See ``RandomPitchWave`` for the other arguments.
+    """
+
+    min_freq: float
+    max_semitones: int
+    pitch_duration: float
+
+    rng: Rng = field(default_factory=np.random.default_rng)
+    waveform: Waveform = "sawtooth"
+    duty: float = 0.5
+    band_limited: bool = False
+
+    def get_frequencies(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        semitones = rng.integers(0, self.max_semitones, size=count, endpoint=True)
+        return self.min_freq * 2 ** (semitones / 12)
+
+
+def _wrap(phase: np.ndarray) -> None:
+    """Wraps the phase in cycles into ``[0, 1)`` in place (faster than ``%``)."""
+
+    phase -= np.floor(phase)
+
+
+def _poly_blep(phase: np.ndarray, phase_steps: np.ndarray) -> np.ndarray:
+    """
+    Returns the PolyBLEP residual of a step from -1 to +1 at phase 0, for the
+    given phases in cycles and phase steps per sample. Subtracting it from a
+    naive waveform at each of its discontinuities band-limits the waveform.
+    """
+
+    out = np.zeros_like(phase)
+    phase_steps = np.broadcast_to(phase_steps, phase.shape)
+
+    # Just after the step
+    after = phase < phase_steps
+    x = phase[after] / phase_steps[after]
+    out[after] = 2 * x - x * x - 1
+
+    # Just before the step
+    before = phase > 1 - phase_steps
+    x = (phase[before] - 1) / phase_steps[before]
+    out[before] = x * x + 2 * x + 1
+
+    return out
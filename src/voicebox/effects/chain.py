@@ -1,24 +1,103 @@
 __all__ = ["SeriesChain", "ParallelChain"]
 
-from typing import Sequence, Callable
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 
 from voicebox.audio import Audio
 from voicebox.effects.effect import Effect
+from voicebox.fingerprint import fingerprint
 
 
 class SeriesChain(Effect):
-    """Applies a chain of effects serially."""
+    """
+    Applies a chain of effects serially.
+
+    Args:
+        effects:
+            Effects to apply, in order.
+        inplace:
+            If ``True``, once an effect has output a new signal, the effects
+            after it write their output into that signal where they can (see
+            ``Effect.apply_inplace()``), instead of each allocating a new one.
+            The input audio is never written to by this; it is only modified
+            by effects that modify their input anyway. The output is the same
+            either way. Defaults to ``False``.
+    """
 
     effects: Sequence[Effect]
+    inplace: bool
 
-    def __init__(self, *effects: Effect):
+    def __init__(self, *effects: Effect, inplace: bool = False):
         self.effects = effects
+        self.inplace = inplace
 
     def apply(self, audio: Audio) -> Audio:
+        if not self.inplace:
+            for effect in self.effects:
+                audio = effect.apply(audio)
+
+            return audio
+
+        input_signal = audio.signal
+        for effect in self.effects:
+            # Only signals made by the effects are reused, never the input
+            if np.may_share_memory(audio.signal, input_signal):
+                audio = effect.apply(audio)
+            else:
+                audio = effect.apply_inplace(audio)
+
+        return audio
+
+    def apply_inplace(self, audio: Audio) -> Audio:
         for effect in self.effects:
-            audio = effect.apply(audio)
+            audio = effect.apply_inplace(audio)
+
+        return audio
+
+    @property
+    def modifies_input(self) -> bool:
+        return any(effect.modifies_input for effect in self.effects)
+
+    @property
+    def is_deterministic(self) -> bool:
+        return all(effect.is_deterministic for effect in self.effects)
+
+    @property
+    def supports_streaming(self) -> bool:
+        return all(effect.supports_streaming for effect in self.effects)
+
+    def process_block(
+        self, block: Audio, state: Optional[List[Any]] = None
+    ) -> Tuple[Audio, List[Any]]:
+        """The state is a list of the states of each effect."""
+
+        states = list(state) if state is not None else [None] * len(self.effects)
+
+        for i, effect in enumerate(self.effects):
+            # Effects with lookahead may hold back all of their input
+            if not len(block):
+                break
+
+            block, states[i] = effect.process_block(block, states[i])
+
+        return block, states
+
+    def flush(self, state: Optional[List[Any]]) -> Optional[Audio]:
+        if state is None:
+            return None
+
+        audio = None
+        for effect, effect_state in zip(self.effects, state):
+            # Audio flushed from previous effects must go through this one first
+            if audio is not None and len(audio):
+                audio, effect_state = effect.process_block(audio, effect_state)
+
+            audio = _concat(audio, effect.flush(effect_state))
 
         return audio
 
@@ -37,47 +116,171 @@ class ParallelChain(Effect):
             How much of the original audio to include in the output.
             0 (default) is none, 1 is unity.
         combine_func:
-            Function to combine the output signals. Defaults to ``np.sum``.
+            Function to combine the output signals. Defaults to ``np.sum``,
+            in which case the outputs are added into the output signal one
+            by one, instead of being stacked into a matrix first.
+        max_workers:
+            The maximum number of effects to apply at once, on a thread pool.
+            Most effects spend their time in NumPy and SciPy functions which
+            release the GIL, so this can make wide chains faster, at the cost
+            of holding more effect outputs in memory at once. ``None`` uses
+            the number of CPUs. Defaults to 1, which applies the effects
+            one after another in the calling thread. The worker threads are
+            started on first use and kept until ``close()``, or the end of
+            a ``with`` block of the chain.
     """
 
     effects: Sequence[Effect]
     dry_gain: float
     combine_func: Callable[[np.ndarray], np.ndarray]
+    max_workers: Optional[int]
+
+    _executor: Optional[ThreadPoolExecutor]
+    _executor_lock: threading.Lock
 
     def __init__(
         self,
         *effects: Effect,
         dry_gain: float = 0.0,
         combine_func: Callable[..., np.ndarray] = np.sum,
+        max_workers: Optional[int] = 1,
     ):
         self.effects = effects
         self.dry_gain = dry_gain
         self.combine_func = combine_func
+        self.max_workers = max_workers
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self) -> "ParallelChain":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker threads, if they were started."""
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+    @property
+    def is_deterministic(self) -> bool:
+        return all(effect.is_deterministic for effect in self.effects)
+
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
+    def fingerprint(self) -> str:
+        # max_workers does not affect the output
+        return fingerprint(
+            type(self).__qualname__, self.effects, self.dry_gain, self.combine_func
+        )
 
     def apply(self, audio: Audio) -> Audio:
+        apply_effect = partial(_apply_effect, audio)
+
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(self.effects))
+        if max_workers <= 1:
+            return self._combine(audio, map(apply_effect, self.effects))
+
+        executor = self._get_executor(max_workers)
+        return self._combine(audio, executor.map(apply_effect, self.effects))
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=type(self).__name__,
+                )
+
+            return self._executor
+
+    def _combine(self, audio: Audio, effect_audios: Iterable[Audio]) -> Audio:
+        """Combines the dry audio and the effect audios, in effect order."""
+
+        if self.combine_func is np.sum and (self.dry_gain > 0 or self.effects):
+            return self._sum(audio, effect_audios)
+
         audios = []
 
         if self.dry_gain > 0:
-            dry_audio = audio.copy()
-            dry_audio.signal *= self.dry_gain
-            audios.append(dry_audio)
+            audios.append(audio)
 
-        for effect in self.effects:
-            audios.append(effect.apply(audio.copy()))
+        audios.extend(effect_audios)
 
-        sample_rates = set(a.sample_rate for a in audios)
-        if len(sample_rates) != 1:
-            raise RuntimeError(
-                f"All sample rates must be the same; got sample rates: {sample_rates}"
-            )
-        sample_rate = next(iter(sample_rates))
+        sample_rate = _check_sample_rates(set(a.sample_rate for a in audios))
 
         max_length = max(len(a) for a in audios)
-        signals = np.zeros((len(audios), max_length))
+        signals = np.zeros((len(audios), max_length), dtype=audio.signal.dtype)
         for i, a in enumerate(audios):
             signals[i, : len(a)] = a.signal
 
+        if self.dry_gain > 0:
+            signals[0, : len(audio)] *= self.dry_gain
+
         signal = self.combine_func(signals, axis=0)
+        signal = signal.astype(audio.signal.dtype, copy=False)
         assert len(signal) == max_length
 
         return Audio(signal, sample_rate)
+
+    def _sum(self, audio: Audio, effect_audios: Iterable[Audio]) -> Audio:
+        """
+        Adds each audio into the output signal as soon as it is ready, so only
+        the output and the audios still being made exist at the same time.
+        Audios are added in the same order as ``np.sum(axis=0)`` would, so
+        the result is the same.
+        """
+
+        dtype = audio.signal.dtype
+        sample_rates = set()
+        signal = np.zeros(0, dtype=dtype)
+
+        if self.dry_gain > 0:
+            sample_rates.add(audio.sample_rate)
+            signal = np.multiply(audio.signal, self.dry_gain, dtype=dtype)
+
+        for effect_audio in effect_audios:
+            sample_rates.add(effect_audio.sample_rate)
+            _check_sample_rates(sample_rates)
+
+            length = len(effect_audio)
+            if length > len(signal):
+                signal = np.concatenate([signal, np.zeros(length - len(signal), dtype)])
+
+            signal[:length] += effect_audio.signal
+
+        return Audio(signal, _check_sample_rates(sample_rates))
+
+
+def _apply_effect(audio: Audio, effect: Effect) -> Audio:
+    # Only effects that may modify the audio need their own copy
+    return effect.apply(audio.copy() if effect.modifies_input else audio)
+
+
+def _check_sample_rates(sample_rates: Set[int]) -> int:
+    """Returns the only sample rate, or raises if there are several."""
+
+    if len(sample_rates) != 1:
+        raise RuntimeError(
+            f"All sample rates must be the same; got sample rates: {sample_rates}"
+        )
+
+    return next(iter(sample_rates))
+
+
+def _concat(audio: Optional[Audio], other: Optional[Audio]) -> Optional[Audio]:
+    if audio is None or not len(audio):
+        return other
+
+    if other is None or not len(other):
+        return audio
+
+    return audio.copy(signal=np.concatenate([audio.signal, other.signal]))
@@ -1,11 +1,118 @@
+from dataclasses import dataclass, field
+from math import inf
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from voicebox.audio import Audio
 from voicebox.effects.effect import Effect
 
 __all__ = ["RemoveDcOffset"]
 
 
-class RemoveDcOffset(Effect):
-    """Removes any DC offset from the audio signal by subtracting the mean."""
+@dataclass
+class _LookaheadState:
+    sample_rate: int
+    pending: List[np.ndarray] = field(default_factory=list)
+    """
+    Blocks of samples received, but not yet output. They are only concatenated
+    when some of them are output, so buffering a long stream stays linear.
+    """
+
+    pending_len: int = 0
+    """Total number of samples in ``pending``."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = inf
+    max: float = -inf
+    started: bool = False
+    """Whether any samples have been output yet."""
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class _LookaheadStreamMixin:
+    """
+    Streaming for effects that depend on statistics of the whole signal.
+
+    With ``stream_lookahead=None``, the whole stream is buffered and the effect
+    is applied to it on ``flush()``, so the output exactly matches ``apply()``.
+    Otherwise, samples are output once ``stream_lookahead`` seconds of audio
+    have been received after them, using statistics of all audio received
+    so far, as computed by ``_apply_running()``.
+    """
+
+    stream_lookahead: Optional[float]
+
+    def process_block(
+        self, block: Audio, state: Optional[_LookaheadState] = None
+    ) -> Tuple[Audio, _LookaheadState]:
+        if state is None:
+            state = _LookaheadState(block.sample_rate)
+
+        if len(block):
+            state.count += len(block)
+            state.total += float(block.signal.sum())
+            state.min = min(state.min, float(block.signal.min()))
+            state.max = max(state.max, float(block.signal.max()))
+
+            # Copy, since the caller may reuse the block's buffer
+            state.pending.append(block.signal.copy())
+            state.pending_len += len(block)
+
+        if self.stream_lookahead is None:
+            return block.copy(signal=block.signal[:0]), state
+
+        lookahead = round(self.stream_lookahead * block.sample_rate)
+        ready = max(state.pending_len - lookahead, 0)
+        if not ready:
+            return block.copy(signal=block.signal[:0]), state
+
+        pending = np.concatenate(state.pending)
+        signal, rest = pending[:ready], pending[ready:]
+        state.pending, state.pending_len = [rest], len(rest)
+        state.started = True
+
+        return block.copy(signal=self._apply_running(signal, state)), state
+
+    def flush(self, state: Optional[_LookaheadState]) -> Optional[Audio]:
+        if state is None or not state.pending_len:
+            return None
+
+        audio = Audio(np.concatenate(state.pending), state.sample_rate)
+
+        if not state.started:
+            return self.apply(audio)
+
+        return audio.copy(signal=self._apply_running(audio.signal, state))
+
+    def _apply_running(self, signal: np.ndarray, state: _LookaheadState) -> np.ndarray:
+        """Returns a new signal with the effect applied, using running statistics."""
+        raise NotImplementedError  # pragma: no cover
+
+
+@dataclass
+class RemoveDcOffset(_LookaheadStreamMixin, Effect):
+    """
+    Removes any DC offset from the audio signal by subtracting the mean.
+
+    Args:
+        stream_lookahead:
+            Only used when streaming (see ``Effect.process_block()``).
+            ``None`` (default) buffers the whole stream until ``flush()``,
+            so the output exactly matches ``apply()``. Otherwise, samples are
+            output this many seconds after they are received, with the running
+            mean of all samples received so far subtracted.
+    """
+
+    stream_lookahead: Optional[float] = None
 
     def apply(self, audio):
         audio.signal -= audio.signal.mean()
         return audio
+
+    def _apply_running(self, signal: np.ndarray, state: _LookaheadState) -> np.ndarray:
+        return signal - state.mean
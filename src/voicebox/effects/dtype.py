@@ -0,0 +1,41 @@
+__all__ = ["ConvertDtype"]
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from numpy.typing import DTypeLike
+
+from voicebox.audio import Audio, resolve_dtype
+from voicebox.effects.effect import Effect
+from voicebox.fingerprint import fingerprint
+
+
+@dataclass
+class ConvertDtype(Effect):
+    """
+    Converts the audio signal to the given float dtype, so the effects after
+    it process signals of that dtype. Built-in effects keep the dtype of the
+    audio they are given.
+
+    Voiceboxes apply this before their effects; see their ``dtype`` argument.
+
+    Args:
+        dtype:
+            The dtype to convert to. Defaults to
+            :func:`voicebox.audio.get_default_dtype`, i.e. float32.
+    """
+
+    dtype: Optional[DTypeLike] = None
+
+    def apply(self, audio: Audio) -> Audio:
+        return audio.astype(self.dtype)
+
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
+    def fingerprint(self) -> str:
+        return fingerprint(type(self).__qualname__, resolve_dtype(self.dtype).str)
+
+    def process_block(self, block: Audio, state: None = None) -> Tuple[Audio, None]:
+        return block.astype(self.dtype), None
@@ -5,11 +5,12 @@ __all__ = [
 ]
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 
 
 class Effect(ABC):
@@ -28,6 +29,103 @@ class Effect(ABC):
 
         ...  # pragma: no cover
 
+    def apply_inplace(self, audio: Audio) -> Audio:
+        """
+        Applies the effect like ``apply()``, but may write the output into
+        the memory of the audio signal, to avoid allocating a new signal.
+        The given audio must not be used afterward, except as returned.
+
+        By default, this just calls ``apply()``.
+        """
+
+        return self.apply(audio)
+
+    @property
+    def modifies_input(self) -> bool:
+        """
+        Whether ``apply()`` may modify the given ``Audio`` instance or its
+        signal, instead of only returning new ones. Effects that do not can be
+        given audio that is still needed elsewhere without copying it first
+        (e.g. by ``ParallelChain``).
+
+        Defaults to ``True``, which is the safe assumption.
+        """
+
+        return True
+
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        Whether the effect always gives the same output for the same input.
+        Effects that are random or depend on the current time must return
+        ``False``, so their output is never cached.
+        """
+
+        return True
+
+    def fingerprint(self) -> str:
+        """
+        Returns a deterministic fingerprint of the effect settings
+        (see :mod:`voicebox.fingerprint`). By default, it is made from the
+        public attributes of the effect.
+
+        Raises:
+            TypeError:
+                If an attribute cannot be fingerprinted.
+        """
+
+        attrs = {k: v for k, v in vars(self).items() if not k.startswith("_")}
+        return fingerprint(type(self).__qualname__, attrs)
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether this effect implements ``process_block()``."""
+        return type(self).process_block is not Effect.process_block
+
+    def process_block(self, block: Audio, state: Any = None) -> Tuple[Audio, Any]:
+        """
+        Applies the effect to one block of a stream of audio.
+
+        ``state`` must be ``None`` for the first block of a stream; pass the
+        returned state along with the next block, and to ``flush()`` after the
+        last block. The state is opaque, and is specific to this effect.
+
+        Concatenating the output blocks and the output of ``flush()`` gives the
+        same audio as ``apply()`` on the concatenated input blocks, unless
+        documented otherwise by the effect. Effects that need to look ahead may
+        return shorter (even empty) blocks than they are given.
+
+        Raises:
+            NotImplementedError:
+                If the effect does not support streaming.
+        """
+
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming.")
+
+    def flush(self, state: Any) -> Optional[Audio]:
+        """
+        Returns any audio still held in ``state`` at the end of a stream,
+        or ``None`` if there is none.
+        """
+
+        return None
+
+    def process_stream(self, blocks: Iterable[Audio]) -> Iterator[Audio]:
+        """
+        Applies the effect to a stream of audio blocks,
+        yielding non-empty output blocks as they become available.
+        """
+
+        state = None
+        for block in blocks:
+            block, state = self.process_block(block, state)
+            if len(block):
+                yield block
+
+        block = self.flush(state)
+        if block is not None and len(block):
+            yield block
+
 
 Effects = List[Effect]
 
@@ -48,11 +146,60 @@ class EffectWithDryWet(Effect, ABC):
         self.wet = wet
 
     def apply(self, audio: Audio) -> Audio:
-        dry_signal = audio.signal * self.dry
-        wet_signal = self.get_wet_signal(audio) * self.wet
-        return audio.copy(signal=dry_signal + wet_signal)
+        return self._mix(audio, self.get_wet_signal(audio))
+
+    def apply_inplace(self, audio: Audio) -> Audio:
+        """Mixes the wet signal into the audio signal in place."""
+
+        wet_signal = self.get_wet_signal(audio)
+        signal = audio.signal
+
+        if not signal.flags.writeable or np.may_share_memory(signal, wet_signal):
+            return self._mix(audio, wet_signal)
+
+        signal *= self.dry
+
+        if wet_signal.dtype == signal.dtype and wet_signal.flags.writeable:
+            wet_signal *= self.wet
+            signal += wet_signal
+        else:
+            signal += np.multiply(wet_signal, self.wet, dtype=signal.dtype)
+
+        return audio
+
+    @property
+    def supports_streaming(self) -> bool:
+        return (
+            type(self).get_wet_signal_block is not EffectWithDryWet.get_wet_signal_block
+        )
+
+    def process_block(self, block: Audio, state: Any = None) -> Tuple[Audio, Any]:
+        wet_signal, state = self.get_wet_signal_block(block, state)
+        return self._mix(block, wet_signal), state
+
+    def _mix(self, audio: Audio, wet_signal: np.ndarray) -> Audio:
+        # Mix in the dtype of the audio, even if the wet signal has another
+        dtype = audio.signal.dtype
+        signal = np.multiply(audio.signal, self.dry, dtype=dtype)
+        signal += np.multiply(wet_signal, self.wet, dtype=dtype)
+        return audio.copy(signal=signal)
 
     @abstractmethod
     def get_wet_signal(self, audio: Audio) -> np.ndarray:
         """Returns the "wet" signal (i.e. signal with effect applied)."""
         ...  # pragma: no cover
+
+    def get_wet_signal_block(
+        self, block: Audio, state: Any = None
+    ) -> Tuple[np.ndarray, Any]:
+        """
+        Returns the "wet" signal for one block of a stream of audio,
+        and the state to pass along with the next block.
+        See ``Effect.process_block()``.
+
+        Raises:
+            NotImplementedError:
+                If the effect does not support streaming.
+        """
+
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming.")
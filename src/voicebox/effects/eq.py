@@ -12,18 +12,24 @@ Simple example:
 from abc import abstractmethod
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Union, Tuple, Literal, Optional
+from threading import Lock
+from typing import Any, Dict, Union, Tuple, Literal, NamedTuple, Optional
 
 import numpy as np
-from scipy.signal import sosfilt, iirfilter
+from scipy.signal import sosfilt
+from scipy.signal import iirfilter as _iirfilter
 
 from voicebox.audio import Audio
 from voicebox.effects.effect import Effect
+from voicebox.effects.utils import block_slices
 
 __all__ = [
     "center_to_band",
+    "clear_filter_cache",
     "Filter",
+    "FilterCacheInfo",
     "FilterParamBuilder",
+    "get_filter_cache_info",
     "IIRFilterParamBuilder",
 ]
 
@@ -34,8 +40,83 @@ Band = Tuple[Freq, Freq]
 FreqOrBand = Union[Freq, Band]
 SosFilterParam = np.ndarray
 
-# Cache filter parameter building function
-iirfilter = lru_cache(iirfilter)
+FILTER_CACHE_MAX_SIZE: int = 128
+"""
+Maximum number of filter designs kept in the global cache shared by all
+filters. The least recently used ones are dropped first.
+"""
+
+_BUILDER_CACHE_MAX_SIZE: int = 8
+
+
+class FilterCacheInfo(NamedTuple):
+    """
+    Filter design cache statistics; see ``get_filter_cache_info()``.
+
+    Args:
+        hits:
+            Number of builds served from a cache, including ``builder_hits``.
+        misses:
+            Number of builds that designed a new filter.
+        maxsize:
+            Maximum number of designs in the global cache.
+        currsize:
+            Current number of designs in the global cache.
+        builder_hits:
+            Number of builds served from the cache of the
+            ``IIRFilterParamBuilder`` itself.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    builder_hits: int
+
+
+_builder_hits = 0
+_builder_hits_lock = Lock()
+
+
+@lru_cache(maxsize=FILTER_CACHE_MAX_SIZE)
+def iirfilter(*args, **kwargs) -> SosFilterParam:
+    """
+    Cached ``scipy.signal.iirfilter()`` with ``output="sos"``. Filters with
+    the same settings share one array of parameters, so it must not be
+    modified. (It is not made read-only, since ``sosfilt()`` rejects
+    read-only parameters in some SciPy versions.)
+    """
+
+    return _iirfilter(*args, output="sos", **kwargs)
+
+
+def get_filter_cache_info() -> FilterCacheInfo:
+    """
+    Returns statistics of the filter design caches, i.e. the global cache
+    and the caches of all ``IIRFilterParamBuilder`` instances.
+    """
+
+    info = iirfilter.cache_info()
+    return FilterCacheInfo(
+        hits=info.hits + _builder_hits,
+        misses=info.misses,
+        maxsize=info.maxsize,
+        currsize=info.currsize,
+        builder_hits=_builder_hits,
+    )
+
+
+def clear_filter_cache() -> None:
+    """
+    Clears the global filter design cache and resets the statistics.
+    The caches of existing ``IIRFilterParamBuilder`` instances are kept.
+    """
+
+    global _builder_hits
+
+    iirfilter.cache_clear()
+    with _builder_hits_lock:
+        _builder_hits = 0
 
 
 def center_to_band(freq: Freq, bandwidth: Freq) -> Band:
@@ -52,6 +133,17 @@ class FilterParamBuilder:
 
 @dataclass
 class IIRFilterParamBuilder(FilterParamBuilder):
+    """
+    Builds filter parameters with ``scipy.signal.iirfilter()``.
+
+    The parameters for the last few sample rates are kept on the builder, so
+    building them again is a dictionary lookup. Changing any setting clears
+    them. Other builders with the same settings share the parameters through
+    the global cache. ``get_filter_cache_info()`` counts the hits of both.
+
+    A ``freq`` band is stored as a tuple.
+    """
+
     order: int
     freq: FreqOrBand
     rp: Optional[float]
@@ -59,8 +151,29 @@ class IIRFilterParamBuilder(FilterParamBuilder):
     btype: BType
     ftype: FType
 
+    def __post_init__(self):
+        self._cache: Dict[float, SosFilterParam] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "freq" and not np.isscalar(value):
+            # Immutable, so the cached parameters cannot go stale, and
+            # hashable for the global cache
+            value = tuple(value)
+
+        super().__setattr__(name, value)
+        if name != "_cache" and hasattr(self, "_cache"):
+            self._cache.clear()
+
     def build(self, sample_rate: float) -> SosFilterParam:
-        return iirfilter(
+        global _builder_hits
+
+        sos = self._cache.get(sample_rate)
+        if sos is not None:
+            with _builder_hits_lock:
+                _builder_hits += 1
+            return sos
+
+        sos = iirfilter(
             self.order,
             self.freq,
             rp=self.rp,
@@ -68,10 +181,15 @@ class IIRFilterParamBuilder(FilterParamBuilder):
             btype=self.btype,
             analog=False,
             ftype=self.ftype,
-            output="sos",
             fs=sample_rate,
         )
 
+        if len(self._cache) >= _BUILDER_CACHE_MAX_SIZE:
+            self._cache.clear()
+
+        self._cache[sample_rate] = sos
+        return sos
+
 
 @dataclass
 class Filter(Effect):
@@ -128,7 +246,47 @@ class Filter(Effect):
         param_builder = IIRFilterParamBuilder(order, freq, rp, rs, btype, ftype)
         return cls(param_builder)
 
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
     def apply(self, audio: Audio) -> Audio:
-        filter_params = self.filter_param_builder.build(audio.sample_rate)
-        new_signal = sosfilt(filter_params, audio.signal)
+        new_signal = np.empty_like(audio.signal)
+        self._filter(audio, new_signal)
         return audio.copy(signal=new_signal)
+
+    def apply_inplace(self, audio: Audio) -> Audio:
+        if not audio.signal.flags.writeable:
+            return self.apply(audio)
+
+        self._filter(audio, audio.signal)
+        return audio
+
+    def _filter(self, audio: Audio, out: np.ndarray) -> None:
+        """
+        Filters the audio signal into ``out``, which may be the signal itself.
+        Filters block by block, carrying the filter state over, so the float64
+        filter output only exists for one block at a time.
+        """
+
+        filter_params = self.filter_param_builder.build(audio.sample_rate)
+        zi = np.zeros((len(filter_params), 2))
+
+        for block in block_slices(len(audio)):
+            out[block], zi = sosfilt(filter_params, audio.signal[block], zi=zi)
+
+    def process_block(
+        self, block: Audio, state: Optional[np.ndarray] = None
+    ) -> Tuple[Audio, np.ndarray]:
+        """The state is the ``sosfilt`` filter delay values (``zi``)."""
+
+        filter_params = self.filter_param_builder.build(block.sample_rate)
+        if state is None:
+            state = np.zeros((len(filter_params), 2))
+
+        if not len(block):
+            return block.copy(), state
+
+        new_signal, state = sosfilt(filter_params, block.signal, zi=state)
+        new_signal = new_signal.astype(block.signal.dtype, copy=False)
+        return block.copy(signal=new_signal), state
@@ -1,7 +1,8 @@
 __all__ = ["Flanger"]
 
 import time
-from typing import Callable, Optional
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
@@ -61,19 +62,48 @@ class Flanger(EffectWithDryWet):
         self.t_offset = t_offset
         self.t_offset_func = t_offset_func
 
-    def get_wet_signal(self, audio: Audio) -> np.ndarray:
-        delay_offsets = self._get_delay_offsets(audio)
+    @property
+    def is_deterministic(self) -> bool:
+        return self.t_offset_func is None
 
-        wet = np.zeros_like(audio.signal)
-        for i, (in_sample, delay_offset) in enumerate(zip(audio.signal, delay_offsets)):
-            i_delay = i - delay_offset
-            delay_sample = wet[i_delay] if i_delay >= 0 else 0
-            wet[i] = in_sample + self.feedback * delay_sample
+    @property
+    def modifies_input(self) -> bool:
+        return False
 
-        return wet
-
-    def _get_delay_offsets(self, audio: Audio) -> np.ndarray:
-        t = self._get_time_from_lfo(audio)
+    def get_wet_signal(self, audio: Audio) -> np.ndarray:
+        delay_offsets = self._get_delay_offsets(audio)
+        return _feedback_delay(audio.signal, delay_offsets, self.feedback)
+
+    def get_wet_signal_block(
+        self, block: Audio, state: Optional["_FlangerState"] = None
+    ) -> Tuple[np.ndarray, "_FlangerState"]:
+        if state is None:
+            state = _FlangerState(
+                start=0,
+                lfo_offset=self._get_lfo_offset(),
+                history=np.zeros(0, dtype=block.signal.dtype),
+            )
+
+        delay_offsets = self._get_delay_offsets(block, state.start, state.lfo_offset)
+        wet_signal = _feedback_delay(
+            block.signal, delay_offsets, self.feedback, history=state.history
+        )
+
+        # Keep just enough of the delay line for the longest possible delay
+        history_size = round(max(self.min_delay, self.max_delay) * block.sample_rate)
+        history = np.concatenate([state.history, wet_signal])
+        history = history[len(history) - min(history_size, len(history)) :]
+
+        state = _FlangerState(state.start + len(block), state.lfo_offset, history)
+        return wet_signal, state
+
+    def _get_delay_offsets(
+        self,
+        audio: Audio,
+        start: int = 0,
+        lfo_offset: Optional[float] = None,
+    ) -> np.ndarray:
+        t = self._get_time_from_lfo(audio, start, lfo_offset)
 
         delay_times = np.cos(2 * np.pi * self.rate * t)
         delay_times = (delay_times + 1) / 2
@@ -81,10 +111,78 @@ class Flanger(EffectWithDryWet):
 
         return np.round(delay_times * audio.sample_rate).astype(int)
 
-    def _get_time_from_lfo(self, audio: Audio) -> np.ndarray:
-        t = np.arange(len(audio)) * audio.sample_period + self.t_offset
+    def _get_time_from_lfo(
+        self,
+        audio: Audio,
+        start: int = 0,
+        lfo_offset: Optional[float] = None,
+    ) -> np.ndarray:
+        t = np.arange(start, start + len(audio)) * audio.sample_period + self.t_offset
+
+        if lfo_offset is None:
+            lfo_offset = self._get_lfo_offset()
 
-        if self.t_offset_func:
-            t += self.t_offset_func() % (1 / self.rate)
+        if lfo_offset:
+            t += lfo_offset
 
         return t
+
+    def _get_lfo_offset(self) -> float:
+        if self.t_offset_func:
+            return self.t_offset_func() % (1 / self.rate)
+
+        return 0.0
+
+
+@dataclass
+class _FlangerState:
+    start: int
+    """Index of the first sample of the next block."""
+
+    lfo_offset: float
+    """Taken once per stream so the LFO phase is continuous across blocks."""
+
+    history: np.ndarray
+    """Most recent wet samples, as needed by the delay line."""
+
+
+def _feedback_delay(
+    signal: np.ndarray,
+    delay_offsets: np.ndarray,
+    feedback: float,
+    history: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Computes ``out[i] = signal[i] + feedback * out[i - delay_offsets[i]]``,
+    where samples before the start of the signal are taken from the end of
+    ``history`` (the output of previous blocks), or are zero.
+
+    Every sample in a block no longer than the minimum delay only depends on
+    samples from previous blocks, so each block is computed with a single
+    vectorized operation instead of one interpreted iteration per sample.
+    """
+
+    n = len(signal)
+    if not n:
+        return np.zeros_like(signal)
+
+    max_delay = max(int(delay_offsets.max()), 0)
+    block_size = max(int(delay_offsets.min()), 1)
+
+    # Output is stored after max_delay samples of leading silence,
+    # so delayed indices never go negative
+    out = np.zeros(max_delay + n, dtype=signal.dtype)
+    if history is not None and max_delay:
+        history = history[-max_delay:]
+        out[max_delay - len(history) : max_delay] = history
+
+    delayed_indices = np.arange(max_delay, max_delay + n) - delay_offsets
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        delayed = out[delayed_indices[start:stop]]
+        out[max_delay + start : max_delay + stop] = (
+            signal[start:stop] + feedback * delayed
+        )
+
+    return out[max_delay:]
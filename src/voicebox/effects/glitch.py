@@ -1,12 +1,13 @@
 __all__ = ["Glitch"]
 
 from dataclasses import dataclass, field
-from random import Random
+from typing import Optional, Tuple
 
 import numpy as np
 
 from voicebox.audio import Audio
 from voicebox.effects.effect import Effect
+from voicebox.effects.utils import Rng, get_generator
 
 
 @dataclass
@@ -14,6 +15,9 @@ class Glitch(Effect):
     """
     Creates a glitchy sound by randomly repeating small chunks of audio.
 
+    Supports streaming; each stream is held back by up to one chunk, since a
+    chunk can only be repeated once all of it has been received.
+
     Args:
         chunk_time:
             Length of each repeated chunk, in seconds.
@@ -22,30 +26,118 @@ class Glitch(Effect):
         max_repeats:
             Maximum number of times to repeat each chunk.
         rng:
-            Random number generator to use.
-            One will be constructed if not given.
+            Random number generator to use; pass e.g.
+            ``np.random.default_rng(seed)`` for repeatable output.
+            One will be constructed if not given. A ``random.Random`` is also
+            accepted; it is used to seed a NumPy generator on each call.
     """
 
     chunk_time: float = 0.1
     p_repeat: float = 0.07
     max_repeats: int = 3
 
-    rng: Random = field(default_factory=Random)
+    rng: Rng = field(default_factory=np.random.default_rng)
+
+    @property
+    def is_deterministic(self) -> bool:
+        return False
+
+    @property
+    def modifies_input(self) -> bool:
+        return False
 
     def apply(self, audio: Audio) -> Audio:
-        chunk_size = round(self.chunk_time * audio.sample_rate)
+        chunk_size = self._get_chunk_size(audio)
+        repeats = self._get_repeats(-(-len(audio) // chunk_size))
+        new_signal = _repeat_chunks(audio.signal, chunk_size, repeats)
+        return audio.copy(signal=new_signal)
+
+    def process_block(
+        self, block: Audio, state: Optional[Audio] = None
+    ) -> Tuple[Audio, Audio]:
+        """
+        The state is the audio of the last chunk so far, which is not
+        complete yet.
+        """
+
+        if state is not None and len(state):
+            block = block.copy(signal=np.concatenate([state.signal, block.signal]))
+
+        chunk_size = self._get_chunk_size(block)
+        complete_size = len(block) - len(block) % chunk_size
+
+        repeats = self._get_repeats(complete_size // chunk_size)
+        new_signal = _repeat_chunks(block.signal[:complete_size], chunk_size, repeats)
+
+        state = block.copy(signal=block.signal[complete_size:].copy())
+        return block.copy(signal=new_signal), state
+
+    def flush(self, state: Optional[Audio]) -> Optional[Audio]:
+        if state is None or not len(state):
+            return None
+
+        return self.apply(state)
+
+    def _get_chunk_size(self, audio: Audio) -> int:
+        return max(round(self.chunk_time * audio.sample_rate), 1)
+
+    def _get_repeats(self, chunks: int) -> np.ndarray:
+        """
+        Returns how many extra times to repeat each of the given number
+        of chunks, which is 0 for chunks that are not repeated.
+        """
+
+        rng = get_generator(self.rng)
+        repeated = rng.random(chunks) < self.p_repeat
+        repeats = rng.integers(1, self.max_repeats, size=chunks, endpoint=True)
+        return np.where(repeated, repeats, 0)
+
+
+def _repeat_chunks(
+    signal: np.ndarray,
+    chunk_size: int,
+    repeats: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns a new signal, where each chunk of ``chunk_size`` samples of the
+    signal (the last one may be shorter) is followed by ``repeats[i]`` more
+    copies of it. The DC offset of repeated chunks is removed from all their
+    copies, which helps reduce popping.
+
+    The output is filled in a single preallocated buffer; the signal is not
+    modified.
+    """
+
+    full_chunks = len(signal) // chunk_size
+    last_size = len(signal) - full_chunks * chunk_size
+    assert len(repeats) == full_chunks + (last_size > 0)
+
+    counts = repeats + 1
+    full_counts = counts[:full_chunks]
+    full_size = int(full_counts.sum()) * chunk_size
+    last_count = int(counts[-1]) if last_size else 0
 
-        new_signal = []
-        for i in range(0, len(audio.signal), chunk_size):
-            chunk = audio.signal[i : i + chunk_size]
-            new_signal.append(chunk)
+    new_signal = np.empty(full_size + last_count * last_size, dtype=signal.dtype)
 
-            if self.rng.random() < self.p_repeat:
-                chunk -= chunk.mean()  # Removing DC offset helps reduce popping effect
+    # Copies of full chunks, as rows of a matrix
+    chunks = signal[: full_chunks * chunk_size].reshape(full_chunks, chunk_size)
+    new_chunks = new_signal[:full_size].reshape(-1, chunk_size)
+    chunk_indices = np.repeat(np.arange(full_chunks), full_counts)
+    # The indices are known to be valid; with the default mode="raise",
+    # take() would write to a temporary buffer first
+    np.take(chunks, chunk_indices, axis=0, out=new_chunks, mode="clip")
 
-                for _ in range(self.rng.randint(1, self.max_repeats)):
-                    new_signal.append(chunk)
+    repeated_rows = np.flatnonzero(repeats[chunk_indices])
+    if len(repeated_rows):
+        means = new_chunks[repeated_rows].mean(axis=1, keepdims=True)
+        new_chunks[repeated_rows] -= means
 
-        audio.signal = np.concatenate(new_signal)
+    # Copies of the last, shorter chunk
+    if last_size:
+        last_chunk = signal[full_chunks * chunk_size :]
+        new_last_chunks = new_signal[full_size:].reshape(last_count, last_size)
+        new_last_chunks[:] = last_chunk
+        if last_count > 1:
+            new_last_chunks -= last_chunk.mean()
 
-        return audio
+    return new_signal
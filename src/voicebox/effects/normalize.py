@@ -1,32 +1,57 @@
 __all__ = ["Normalize"]
 
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
 
 from voicebox.audio import Audio
 from voicebox.effects import RemoveDcOffset
+from voicebox.effects.dc_offset import _LookaheadState, _LookaheadStreamMixin
 from voicebox.effects.effect import Effect
 
 
 @dataclass
-class Normalize(Effect):
+class Normalize(_LookaheadStreamMixin, Effect):
     """
     Normalizes audio such that any DC offset is removed and
     ``max(abs(signal)) == max_amplitude`` (``1.0`` by default).
+
+    When streaming (see ``Effect.process_block()``), ``stream_lookahead=None``
+    (default) buffers the whole stream until ``flush()``, so the output exactly
+    matches ``apply()``. Otherwise, samples are output ``stream_lookahead``
+    seconds after they are received, normalized by the running mean and peak
+    of all samples received so far.
     """
 
     max_amplitude: float = 1.0
     remove_dc_offset: bool = True
+    stream_lookahead: Optional[float] = None
 
     def apply(self, audio: Audio) -> Audio:
         if self.remove_dc_offset:
             remove_offset = RemoveDcOffset()
             audio = remove_offset(audio)
 
-        max_value = np.abs(audio.signal).max()
+        # Same as np.abs(signal).max(), without the temporary array
+        max_value = max(audio.signal.max(), -audio.signal.min(), 0)
 
         if max_value > 0:
             audio.signal *= self.max_amplitude / max_value
 
         return audio
+
+    def _apply_running(self, signal: np.ndarray, state: _LookaheadState) -> np.ndarray:
+        if self.remove_dc_offset:
+            offset = state.mean
+            max_value = max(state.max - offset, offset - state.min)
+        else:
+            offset = 0.0
+            max_value = max(abs(state.max), abs(state.min))
+
+        signal = signal - offset
+
+        if max_value > 0:
+            signal *= self.max_amplitude / max_value
+
+        return signal
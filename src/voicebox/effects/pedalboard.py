@@ -32,7 +32,8 @@ class PedalboardEffect(Effect):
     plugin: pedalboard.Plugin
 
     def apply(self, audio: Audio) -> Audio:
-        audio.signal = self.plugin.process(audio.signal, audio.sample_rate, reset=True)
+        signal = self.plugin.process(audio.signal, audio.sample_rate, reset=True)
+        audio.signal = signal.astype(audio.signal.dtype, copy=False)
         return audio
 
 
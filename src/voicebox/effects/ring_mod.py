@@ -1,12 +1,13 @@
 __all__ = ["RingMod"]
 
 from math import pi
-from typing import Callable
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
 from voicebox.audio import Audio
 from voicebox.effects.effect import EffectWithDryWet
+from voicebox.effects.utils import block_slices
 
 WaveFunc = Callable[[np.ndarray], np.ndarray]
 
@@ -24,7 +25,10 @@ class RingMod(EffectWithDryWet):
         carrier_freq (float):
             Carrier wave frequency in Hz.
         carrier_wave:
-            Carrier wave function. Defaults to ``np.sin``.
+            Carrier wave function of radians. Defaults to ``np.sin``.
+            See ``WavetableWaveFunc`` for band-limited sawtooth, square and
+            triangle waves. If it has a true ``takes_step`` attribute, it is
+            also passed the radians between samples.
         dry:
             Dry (input) signal level. 0 is none, 1 is unity. Default is .5.
         wet:
@@ -46,7 +50,50 @@ class RingMod(EffectWithDryWet):
         self.carrier_freq = carrier_freq
         self.carrier_wave = carrier_wave
 
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
     def get_wet_signal(self, audio: Audio) -> np.ndarray:
-        t = np.arange(len(audio.signal)) / audio.sample_rate
-        carrier_signal = self.carrier_wave(2 * pi * self.carrier_freq * t)
-        return audio.signal * carrier_signal
+        return self._modulate(audio, 0)
+
+    def apply_inplace(self, audio: Audio) -> Audio:
+        """
+        Modulates and mixes the signal in place, block by block, so the
+        carrier wave only exists for one block at a time.
+        """
+
+        signal = audio.signal
+        if not signal.flags.writeable:
+            return self.apply(audio)
+
+        for block in block_slices(len(signal)):
+            dry_signal = signal[block]
+            wet_signal = self._modulate(audio.copy(signal=dry_signal), block.start)
+
+            dry_signal *= self.dry
+            wet_signal *= self.wet
+            dry_signal += wet_signal
+
+        return audio
+
+    def get_wet_signal_block(
+        self, block: Audio, state: Optional[int] = None
+    ) -> Tuple[np.ndarray, int]:
+        """The state is the index of the first sample of the block."""
+
+        start = state or 0
+        return self._modulate(block, start), start + len(block)
+
+    def _modulate(self, audio: Audio, start: int) -> np.ndarray:
+        t = np.arange(start, start + len(audio.signal)) / audio.sample_rate
+        radians = 2 * pi * self.carrier_freq * t
+
+        if getattr(self.carrier_wave, "takes_step", False):
+            # Short blocks are too short to tell the frequency from
+            radians_step = 2 * pi * self.carrier_freq / audio.sample_rate
+            carrier_signal = self.carrier_wave(radians, radians_step)
+        else:
+            carrier_signal = self.carrier_wave(radians)
+
+        return audio.signal * carrier_signal.astype(audio.signal.dtype, copy=False)
@@ -1,6 +1,7 @@
 __all__ = ["Tail"]
 
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -21,7 +22,21 @@ class Tail(Effect):
     seconds: float = 1.0
 
     def apply(self, audio: Audio) -> Audio:
-        samples = round(self.seconds * audio.sample_rate)
-        tail = np.zeros(samples, dtype=audio.signal.dtype)
-        audio.signal = np.concatenate([audio.signal, tail])
+        audio.signal = np.concatenate([audio.signal, self._get_tail(audio)])
         return audio
+
+    def process_block(
+        self, block: Audio, state: Optional[Audio] = None
+    ) -> Tuple[Audio, Audio]:
+        """Blocks pass through unchanged; the silence is output by ``flush()``."""
+        return block, block.copy(signal=block.signal[:0])
+
+    def flush(self, state: Optional[Audio]) -> Optional[Audio]:
+        if state is None:
+            return None
+
+        return state.copy(signal=self._get_tail(state))
+
+    def _get_tail(self, audio: Audio) -> np.ndarray:
+        samples = round(self.seconds * audio.sample_rate)
+        return np.zeros(samples, dtype=audio.signal.dtype)
@@ -1,3 +1,21 @@
+from random import Random
+from typing import Iterator, Union
+
+import numpy as np
+
+Rng = Union[np.random.Generator, Random]
+"""
+Random number generator accepted by random effects. A NumPy ``Generator``
+is preferred; a ``random.Random`` is supported for backwards compatibility.
+"""
+
+BLOCK_SIZE: int = 2**16
+"""
+Number of samples that effects process at a time when they work through
+a signal in blocks, to bound the size of their temporary arrays.
+"""
+
+
 def db(db_: float) -> float:
     """
     Convert decibels to gain. Examples:
@@ -8,3 +26,22 @@ def db(db_: float) -> float:
     """
 
     return 10 ** (db_ / 20)
+
+
+def block_slices(length: int, block_size: int = BLOCK_SIZE) -> Iterator[slice]:
+    """Yields consecutive slices of up to ``block_size`` over ``length`` samples."""
+
+    for start in range(0, length, block_size):
+        yield slice(start, min(start + block_size, length))
+
+
+def get_generator(rng: Rng) -> np.random.Generator:
+    """
+    Returns the NumPy generator, or a new one seeded from the
+    ``random.Random``, so the output still only depends on its state.
+    """
+
+    if isinstance(rng, Random):
+        return np.random.default_rng(rng.getrandbits(128))
+
+    return rng
@@ -1,15 +1,18 @@
-__all__ = ["Vocoder"]
+__all__ = ["clear_carrier_cache", "Vocoder"]
 
 import warnings
-from dataclasses import dataclass, field
-from random import Random
-from typing import Callable, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, ClassVar, List, Literal, Optional, Sequence, Tuple
 
 import numpy as np
+from cachetools import LRUCache
+from scipy.signal import get_window, istft, sosfilt, stft
 
 from voicebox.audio import Audio
+from voicebox.effects.carriers import RandomSawtoothWave  # Moved; kept importable
 from voicebox.effects.effect import Effect, EffectWithDryWet
-from voicebox.effects.eq import Filter, center_to_band
+from voicebox.effects.eq import Filter, SosFilterParam, center_to_band
 from voicebox.types import KWArgs
 
 
@@ -23,33 +26,38 @@ def sawtooth_wave(radians: np.ndarray) -> np.ndarray:
 class SawtoothWave:
     freq: float
 
+    deterministic: ClassVar[bool] = True
+    """Same input times always produce the same output; see ``Vocoder``."""
+
     def __call__(self, times: np.ndarray) -> np.ndarray:
         radians = 2 * np.pi * self.freq * times
         return sawtooth_wave(radians)
 
 
-@dataclass
-class RandomSawtoothWave:
-    min_freq: float
-    max_freq: float
-    pitch_duration: float
+CARRIER_CACHE_MAX_BYTES: int = 8 * 2**20
+"""
+Memory budget of the band-filtered carrier cache shared by all ``Vocoder``
+instances. The least recently used carriers are dropped first. Bands are
+kept in the dtype of the audio, so the 40 default bands of float32 audio take
+7.7 MB per second at 48 kHz, or 3.5 MB per second at 22.05 kHz.
+"""
 
-    rng: Random = field(default_factory=Random)
+_carrier_cache: LRUCache = LRUCache(
+    maxsize=CARRIER_CACHE_MAX_BYTES,
+    getsizeof=lambda carrier_bands: carrier_bands.nbytes,
+)
+_carrier_cache_lock = Lock()
 
-    def __call__(self, times: np.ndarray) -> np.ndarray:
-        dt = times[1] - times[0]
-        chunk_size = round(self.pitch_duration / dt)
 
-        alpha = np.log2(self.max_freq / self.min_freq)
+def clear_carrier_cache() -> None:
+    """Clears the band-filtered carrier cache shared by all vocoders."""
 
-        out = np.zeros_like(times)
-        for i in range(0, len(times), chunk_size):
-            f = self.min_freq * 2 ** (alpha * self.rng.random())
-            time_chunk = times[i : i + chunk_size]
-            radians = 2 * np.pi * f * time_chunk
-            out[i : i + chunk_size] = sawtooth_wave(radians)
+    with _carrier_cache_lock:
+        _carrier_cache.clear()
 
-        return out
+
+VocoderEngine = Literal["iir", "stft"]
+VOCODER_ENGINES: Tuple[str, ...] = ("iir", "stft")
 
 
 @dataclass
@@ -75,21 +83,93 @@ class EnvelopeFollower(Effect):
         audio = self.lpf(audio)
         return audio
 
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
+    def get_envelopes(self, signals: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Returns the envelopes of all signals in the ``(..., samples)`` array
+        with a single filter pass. ``signals`` is rectified in place.
+        """
+
+        filter_params = self.lpf.filter_param_builder.build(sample_rate)
+        np.abs(signals, out=signals)
+        return sosfilt(filter_params, signals, axis=-1)
+
+    def get_envelopes_block(
+        self,
+        signals: np.ndarray,
+        sample_rate: int,
+        zi: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Streaming version of ``get_envelopes()``. Also returns the filter
+        delay values to pass as ``zi`` along with the next block.
+        """
+
+        filter_params = self.lpf.filter_param_builder.build(sample_rate)
+        if zi is None:
+            zi = np.zeros((len(filter_params),) + signals.shape[:-1] + (2,))
+
+        np.abs(signals, out=signals)
+        return sosfilt(filter_params, signals, axis=-1, zi=zi)
+
 
 class Vocoder(EffectWithDryWet):
     """
     Vocoder effect. Useful for making monotone, robotic voices.
 
     See ``Vocoder.build()`` to easily construct a Vocoder instance.
+
+    The band-filtered carrier only depends on the sample rate and the number of
+    samples, so it is computed once into a longer buffer that is sliced to the
+    length of each audio. This is only done for carrier waves with a
+    ``deterministic`` attribute set to ``True`` (e.g. ``SawtoothWave``);
+    carrier waves that are random or do not declare the attribute are
+    regenerated for every audio.
+
+    There are two engines, selected with ``engine``:
+
+    - ``"iir"`` (default): Filters the modulator and carrier with one
+      bandpass filter per band, and follows the modulator band levels with
+      ``envelope_follower``. Cost grows linearly with the number of bands.
+      Supports streaming, if the carrier wave is deterministic or can be
+      continued across blocks (e.g. ``RandomSawtoothWave``).
+    - ``"stft"``: Works on short-time Fourier transform frames of
+      ``stft_frame_size`` samples. Each carrier frequency bin in a band is
+      scaled by the modulator level in that band, and the output is
+      resynthesized by overlap-add. The bands come from the frequency bands
+      of ``bandpass_filters``, and the frame hop sets the envelope
+      smoothing, so ``envelope_follower`` is not used. Cost is almost
+      independent of the number of bands, but bands narrower than one
+      frequency bin are coarser than with IIR filters, and streaming is
+      not supported.
     """
 
     carrier_wave: Callable[[np.ndarray], np.ndarray]
-    """Takes in an array of sample times and outputs corresponding wave samples."""
+    """
+    Takes in an array of sample times and outputs corresponding wave samples.
+    If it has a ``takes_step`` attribute set to ``True`` (e.g. ``WavetableWave``),
+    it is also passed the time between samples.
+    """
 
     bandpass_filters: Sequence[Filter]
     envelope_follower: EnvelopeFollower
     max_freq: float
 
+    carrier_cache_max_bytes: int
+    """
+    Largest band-filtered carrier this vocoder adds to the shared carrier cache
+    (see ``CARRIER_CACHE_MAX_BYTES``), in bytes. ``0`` disables caching.
+    """
+
+    engine: VocoderEngine
+    """``"iir"`` or ``"stft"``; see above."""
+
+    stft_frame_size: int
+    """Samples per frame of the ``"stft"`` engine."""
+
     def __init__(
         self,
         carrier_wave: Callable[[np.ndarray], np.ndarray],
@@ -98,14 +178,27 @@ class Vocoder(EffectWithDryWet):
         max_freq: float,
         dry: float,
         wet: float,
+        carrier_cache_max_bytes: int = CARRIER_CACHE_MAX_BYTES,
+        engine: VocoderEngine = "iir",
+        stft_frame_size: int = 1024,
     ):
         super().__init__(dry, wet)
 
+        if engine not in VOCODER_ENGINES:
+            raise ValueError(
+                f"Unsupported engine {engine!r}; must be one of {VOCODER_ENGINES}."
+            )
+
         self.carrier_wave = carrier_wave
         self.bandpass_filters = bandpass_filters
         self.envelope_follower = envelope_follower
         self.max_freq = max_freq
 
+        self.carrier_cache_max_bytes = carrier_cache_max_bytes
+
+        self.engine = engine
+        self.stft_frame_size = stft_frame_size
+
     @classmethod
     def build(
         cls,
@@ -122,6 +215,9 @@ class Vocoder(EffectWithDryWet):
         envelope_follower_kwargs: KWArgs = None,
         dry: float = 0.0,
         wet: float = 1.0,
+        carrier_cache_max_bytes: int = CARRIER_CACHE_MAX_BYTES,
+        engine: VocoderEngine = "iir",
+        stft_frame_size: int = 1024,
     ) -> "Vocoder":
         """
         Builds a Vocoder instance.
@@ -130,7 +226,8 @@ class Vocoder(EffectWithDryWet):
             carrier_freq (float):
                 Frequency of the carrier wave in Hz.
             carrier_wave_builder:
-                Defaults to ``SawtoothWave``.
+                Defaults to ``SawtoothWave``. ``WavetableWave`` is a
+                band-limited alternative, which aliases much less.
             carrier_wave:
                 Optional pre-built carrier wave. If provided, this will
                 override ``carrier_freq`` and ``carrier_wave_builder``.
@@ -159,6 +256,17 @@ class Vocoder(EffectWithDryWet):
                 Dry (input) signal level. 0 is none, 1 is unity.
             wet:
                 Wet (affected) signal level. 0 is none, 1 is unity.
+            carrier_cache_max_bytes (int):
+                Largest band-filtered carrier wave in bytes that this vocoder
+                adds to the carrier cache shared by all vocoders. Set to ``0``
+                to disable caching. Defaults to ``CARRIER_CACHE_MAX_BYTES``
+                (8 MiB), the budget of the whole cache.
+            engine (str):
+                ``"iir"`` (default) or ``"stft"``. See ``Vocoder``.
+            stft_frame_size (int):
+                Samples per frame of the ``"stft"`` engine. Larger frames
+                resolve narrower bands, but smear the envelopes over more
+                time. Default is 1024.
         """
 
         carrier_wave = carrier_wave or carrier_wave_builder(carrier_freq)
@@ -191,45 +299,339 @@ class Vocoder(EffectWithDryWet):
             max_freq,
             dry,
             wet,
+            carrier_cache_max_bytes=carrier_cache_max_bytes,
+            engine=engine,
+            stft_frame_size=stft_frame_size,
+        )
+
+    @property
+    def is_deterministic(self) -> bool:
+        return getattr(self.carrier_wave, "deterministic", False)
+
+    @property
+    def modifies_input(self) -> bool:
+        return False
+
+    @property
+    def supports_streaming(self) -> bool:
+        return (
+            self.engine == "iir"
+            and super().supports_streaming
+            and self._carrier_supports_streaming
+        )
+
+    @property
+    def _carrier_supports_streaming(self) -> bool:
+        """
+        Whether the carrier wave can be continued across blocks: it is either
+        deterministic, or has a ``get_wave_block()`` method to carry its state
+        (e.g. ``RandomSawtoothWave``).
+        """
+
+        return getattr(self.carrier_wave, "deterministic", False) or hasattr(
+            self.carrier_wave, "get_wave_block"
         )
 
     def get_wet_signal(self, audio: Audio) -> np.ndarray:
-        carrier = self._get_carrier(audio)
+        if self.engine == "stft":
+            return self._get_wet_signal_stft(audio)
+
+        band_filter_params = self._get_band_filter_params(audio.sample_rate)
+        if not band_filter_params:
+            return np.zeros_like(audio.signal)
+
+        carrier_bands = self._get_carrier_bands(audio, band_filter_params)
+        modulator_bands = _filter_bank(band_filter_params, audio.signal)
+
+        modulator_levels = self.envelope_follower.get_envelopes(
+            modulator_bands, audio.sample_rate
+        )
+
+        modulator_levels *= carrier_bands
+        return modulator_levels.sum(axis=0)
+
+    def get_wet_signal_block(
+        self, block: Audio, state: Optional["_VocoderState"] = None
+    ) -> Tuple[np.ndarray, "_VocoderState"]:
+        """
+        The carrier is generated and filtered per block (i.e. it is not taken
+        from the carrier cache), with filter states carried over between blocks.
+        Random carrier waves are continued with their ``get_wave_block()``, so
+        their pitches and phase carry on across blocks.
+        """
+
+        if self.engine != "iir":
+            raise NotImplementedError(
+                f"Vocoder engine {self.engine!r} does not support streaming."
+            )
+
+        if not self._carrier_supports_streaming:
+            raise NotImplementedError(
+                f"Vocoder carrier wave {self.carrier_wave!r} does not support "
+                f"streaming; it must be deterministic or have get_wave_block()."
+            )
+
+        band_filter_params = self._get_band_filter_params(block.sample_rate)
+
+        if state is None:
+            state = _VocoderState(start=0)
+
+        if not band_filter_params or not len(block):
+            state.start += len(block)
+            return np.zeros_like(block.signal), state
+
+        carrier = self._get_carrier_signal_block(len(block), block.sample_rate, state)
+        carrier_bands, state.carrier_zi = _filter_bank_block(
+            band_filter_params, carrier, state.carrier_zi
+        )
+        modulator_bands, state.modulator_zi = _filter_bank_block(
+            band_filter_params, block.signal, state.modulator_zi
+        )
+
+        modulator_levels, state.envelope_zi = (
+            self.envelope_follower.get_envelopes_block(
+                modulator_bands, block.sample_rate, state.envelope_zi
+            )
+        )
+
+        modulator_levels *= carrier_bands
+        state.start += len(block)
+        return modulator_levels.sum(axis=0), state
+
+    def _get_wet_signal_stft(self, audio: Audio) -> np.ndarray:
+        frame_size = self.stft_frame_size
+        stft_kwargs = dict(
+            fs=audio.sample_rate,
+            window="hann",
+            nperseg=frame_size,
+            noverlap=frame_size * 3 // 4,
+        )
 
-        new_signals = [
-            self._get_carrier_signal_for_band(audio, carrier, bpf)
-            for bpf in self.bandpass_filters
-        ]
+        bin_freqs = np.fft.rfftfreq(frame_size, 1 / audio.sample_rate)
+        bin_bands = self._get_bin_bands(bin_freqs, audio.sample_rate)
+        if not len(audio) or not np.any(bin_bands >= 0):
+            return np.zeros_like(audio.signal)
 
-        return np.sum(new_signals, axis=0)
+        # Frames must not be longer than the signal
+        length = max(len(audio), frame_size)
+        modulator = np.zeros(length)
+        modulator[: len(audio)] = audio.signal
+        carrier = self._get_carrier_signal(length, audio.sample_rate)
 
-    def _get_carrier(self, audio: Audio) -> Audio:
-        t = np.arange(len(audio)) * audio.sample_period
-        carrier = self.carrier_wave(t)
-        return audio.copy(signal=carrier)
+        _, _, modulator_spectrum = stft(modulator, **stft_kwargs)
+        _, _, spectrum = stft(carrier, **stft_kwargs)
 
-    def _get_carrier_signal_for_band(
-        self, modulator: Audio, carrier: Audio, bpf: Filter
+        # Runs of neighboring bins in the same band, as (bins, frames) arrays
+        bins = np.flatnonzero(bin_bands >= 0)
+        run_starts = np.flatnonzero(
+            np.diff(bin_bands[bins], prepend=-1) | (np.diff(bins, prepend=-2) > 1)
+        )
+        run_lengths = np.diff(run_starts, append=len(bins))
+
+        band_power = np.add.reduceat(
+            np.abs(modulator_spectrum[bins]) ** 2, run_starts, axis=0
+        )
+
+        # Match the level of the "iir" engine, which follows the mean of the
+        # rectified band signal, i.e. 2 / pi times the amplitude of a sine wave
+        window = get_window("hann", frame_size)
+        sine_power = frame_size * np.sum(window**2) / np.sum(window) ** 2 / 4
+        band_levels = np.sqrt(band_power / sine_power)
+        band_levels *= 2 / np.pi
+
+        out_spectrum = np.zeros_like(spectrum)
+        out_spectrum[bins] = spectrum[bins] * np.repeat(
+            band_levels, run_lengths, axis=0
+        )
+
+        _, out = istft(out_spectrum, **stft_kwargs)
+        return out[: len(audio)]
+
+    def _get_bin_bands(self, bin_freqs: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Returns the index of the band of each frequency bin, or -1 for bins
+        in no band. Every band gets at least one bin; where narrow bands share
+        a bin, it goes to the higher band.
+        """
+
+        bin_bands = np.full(len(bin_freqs), -1)
+        nyquist = sample_rate / 2
+        dropped_bands = False
+
+        for band, bpf in enumerate(self.bandpass_filters):
+            low, high = bpf.filter_param_builder.freq
+            if high >= nyquist:
+                dropped_bands = True
+                continue
+
+            start, stop = np.searchsorted(bin_freqs, [low, high])
+            bin_bands[start : max(stop, start + 1)] = band
+
+        if dropped_bands:
+            self._warn_sample_rate_too_low(sample_rate)
+
+        return bin_bands
+
+    def _get_carrier_bands(
+        self,
+        audio: Audio,
+        band_filter_params: Sequence[SosFilterParam],
     ) -> np.ndarray:
-        try:
-            filtered_modulator = bpf(modulator.copy())
-        except ValueError:
-            sample_rate = modulator.sample_rate
-            warnings.warn(
-                f"Received audio with sample_rate={sample_rate}, which is too "
-                f"low for Vocoder with max_freq={self.max_freq}; "
-                f"band(s) will be dropped, reducing quality. "
-                f"To fix, either 1) build the Vocoder with "
-                f"max_freq <= sample_rate / 2 = {sample_rate / 2}, "
-                f"or 2) use a TTS engine with a "
-                f"sample_rate >= 2 * max_freq = {2 * self.max_freq}."
+        if not (
+            self.carrier_cache_max_bytes > 0
+            and getattr(self.carrier_wave, "deterministic", False)
+        ):
+            return self._build_carrier_bands(len(audio), audio, band_filter_params)
+
+        dtype = _get_carrier_dtype(audio)
+        key = (
+            audio.sample_rate,
+            dtype.str,
+            repr(self.carrier_wave),
+            b"".join(p.tobytes() for p in band_filter_params),
+        )
+
+        with _carrier_cache_lock:
+            carrier_bands = _carrier_cache.get(key)
+
+        if carrier_bands is None or carrier_bands.shape[1] < len(audio):
+            max_length = min(self.carrier_cache_max_bytes, _carrier_cache.maxsize) // (
+                len(band_filter_params) * dtype.itemsize
             )
+            if len(audio) > max_length:
+                return self._build_carrier_bands(len(audio), audio, band_filter_params)
+
+            # Round up to whole seconds so short audios share a buffer,
+            # and double the old buffer to amortize regrowth, within budget
+            length = -(-len(audio) // audio.sample_rate) * audio.sample_rate
+            if carrier_bands is not None:
+                length = max(length, 2 * carrier_bands.shape[1])
+            length = min(length, max_length)
+
+            carrier_bands = self._build_carrier_bands(length, audio, band_filter_params)
+
+            # Cached buffer is shared by all calls, so guard against modification
+            carrier_bands.flags.writeable = False
+
+            with _carrier_cache_lock:
+                _carrier_cache[key] = carrier_bands
+
+        return carrier_bands[:, : len(audio)]
+
+    def _build_carrier_bands(
+        self,
+        length: int,
+        audio: Audio,
+        band_filter_params: Sequence[SosFilterParam],
+    ) -> np.ndarray:
+        carrier = self._get_carrier_signal(length, audio.sample_rate)
+        return _filter_bank(band_filter_params, carrier, _get_carrier_dtype(audio))
+
+    def _get_carrier_signal(
+        self, length: int, sample_rate: int, start: int = 0
+    ) -> np.ndarray:
+        t = np.arange(start, start + length) * (1.0 / sample_rate)
 
-            return np.zeros_like(modulator.signal)
+        if getattr(self.carrier_wave, "takes_step", False):
+            # Short blocks are too short to tell the sample rate from
+            return self.carrier_wave(t, 1.0 / sample_rate)
 
-        modulator_level = self.envelope_follower(filtered_modulator).signal
+        return self.carrier_wave(t)
+
+    def _get_carrier_signal_block(
+        self, length: int, sample_rate: int, state: "_VocoderState"
+    ) -> np.ndarray:
+        get_wave_block = getattr(self.carrier_wave, "get_wave_block", None)
+        if get_wave_block is None:
+            return self._get_carrier_signal(length, sample_rate, state.start)
+
+        t = np.arange(state.start, state.start + length) * (1.0 / sample_rate)
+        carrier, state.carrier_wave_state = get_wave_block(
+            t, state.carrier_wave_state, dt=1.0 / sample_rate
+        )
+        return carrier
+
+    def _get_band_filter_params(self, sample_rate: int) -> List[SosFilterParam]:
+        band_filter_params = []
+
+        for bpf in self.bandpass_filters:
+            try:
+                band_filter_params.append(bpf.filter_param_builder.build(sample_rate))
+            except ValueError:
+                self._warn_sample_rate_too_low(sample_rate)
+
+        return band_filter_params
+
+    def _warn_sample_rate_too_low(self, sample_rate: int) -> None:
+        warnings.warn(
+            f"Received audio with sample_rate={sample_rate}, which is too "
+            f"low for Vocoder with max_freq={self.max_freq}; "
+            f"band(s) will be dropped, reducing quality. "
+            f"To fix, either 1) build the Vocoder with "
+            f"max_freq <= sample_rate / 2 = {sample_rate / 2}, "
+            f"or 2) use a TTS engine with a "
+            f"sample_rate >= 2 * max_freq = {2 * self.max_freq}."
+        )
+
+
+def _filter_bank(
+    band_filter_params: Sequence[SosFilterParam],
+    signals: np.ndarray,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """
+    Filters the ``(..., samples)`` array of signals through every band filter,
+    returning an array of shape ``(bands, ..., samples)`` of the given dtype.
+    """
+
+    out = np.empty((len(band_filter_params),) + signals.shape, dtype=dtype)
+
+    for band_out, filter_params in zip(out, band_filter_params):
+        band_out[...] = sosfilt(filter_params, signals, axis=-1)
+
+    return out
+
+
+def _get_carrier_dtype(audio: Audio) -> np.dtype:
+    """
+    Carrier bands are kept in the working dtype of the audio, e.g. halving the
+    size of cached carriers for float32 audio.
+    """
+
+    return np.result_type(audio.signal.dtype, np.float32)
+
+
+def _filter_bank_block(
+    band_filter_params: Sequence[SosFilterParam],
+    signal: np.ndarray,
+    zi: Optional[List[np.ndarray]] = None,
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Streaming version of ``_filter_bank()`` for a 1D signal. Also returns the
+    per-band filter delay values to pass as ``zi`` along with the next block.
+    """
+
+    if zi is None:
+        zi = [np.zeros((len(p), 2)) for p in band_filter_params]
+
+    out = np.empty((len(band_filter_params), len(signal)))
+    zf = []
+
+    for band_out, filter_params, band_zi in zip(out, band_filter_params, zi):
+        band_out[:], band_zf = sosfilt(filter_params, signal, zi=band_zi)
+        zf.append(band_zf)
+
+    return out, zf
+
+
+@dataclass
+class _VocoderState:
+    start: int
+    """Index of the first sample of the next block."""
 
-        carrier_signal = bpf(carrier.copy()).signal
-        carrier_signal *= modulator_level
+    carrier_wave_state: Any = None
+    """State of a carrier wave with ``get_wave_block()``."""
 
-        return carrier_signal
+    carrier_zi: Optional[List[np.ndarray]] = None
+    modulator_zi: Optional[List[np.ndarray]] = None
+    envelope_zi: Optional[np.ndarray] = None
@@ -0,0 +1,247 @@
+"""
+Band-limited (anti-aliased) oscillators, for use as ``Vocoder`` and
+``RingMod`` carrier waves.
+
+Naive waveforms like ``sawtooth_wave()`` have harmonics above the Nyquist
+frequency, which alias back down as inharmonic noise. The oscillators here
+look up precomputed wavetables instead: one table per octave (a "mipmap"),
+each holding only the harmonics that fit below the Nyquist frequency for the
+pitches it is used for. Lookup is vectorized, with linear interpolation.
+"""
+
+__all__ = [
+    "Wavetable",
+    "WavetableWave",
+    "WavetableWaveFunc",
+    "get_wavetable",
+]
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, Literal, Optional, Union
+
+import numpy as np
+
+WavetableWaveform = Literal["sine", "sawtooth", "square", "triangle"]
+
+DEFAULT_TABLE_SIZE: int = 2048
+"""Samples per cycle in each table; also limits the number of harmonics."""
+
+
+@dataclass(frozen=True)
+class Wavetable:
+    """
+    Mipmapped wavetables of one cycle of a waveform, starting at phase 0.
+
+    Row ``i`` of ``tables`` holds the first ``2**i`` harmonics, and has one
+    extra sample at the end (a copy of the first), for interpolation.
+    Use ``get_wavetable()`` to get a shared, cached instance.
+    """
+
+    tables: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """Samples per cycle."""
+        return self.tables.shape[1] - 1
+
+    @classmethod
+    def build(
+        cls,
+        waveform: WavetableWaveform,
+        size: int = DEFAULT_TABLE_SIZE,
+    ) -> "Wavetable":
+        """
+        Builds the tables from the Fourier series of the waveform. The
+        waveforms have the same phase and range as the naive ones, e.g. the
+        sawtooth rises from -1 to 1, like ``sawtooth_wave()``, except that
+        waveforms with jumps overshoot by up to about 12% next to them
+        (the Gibbs phenomenon).
+        """
+
+        harmonics = np.arange(1, size // 2)
+        amplitudes = _get_sine_amplitudes(waveform, harmonics)
+
+        levels = int(np.log2(len(harmonics))) + 1
+        tables = np.empty((levels, size + 1))
+
+        for level, table in enumerate(tables):
+            spectrum = np.zeros(size // 2 + 1, dtype=complex)
+            max_harmonic = 2**level
+            # irfft() of -i * N/2 at bin k is a sine wave of amplitude 1
+            spectrum[1 : max_harmonic + 1] = -0.5j * size * amplitudes[:max_harmonic]
+            table[:-1] = np.fft.irfft(spectrum, n=size)
+            table[-1] = table[0]
+
+        # Tables are shared, so guard against modification
+        tables.flags.writeable = False
+        return cls(tables)
+
+    def lookup(
+        self,
+        phase: np.ndarray,
+        phase_step: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns the waveform at the given phases, in cycles.
+
+        Args:
+            phase:
+                Phases in cycles. Any value is allowed; only the fractional
+                part is used.
+            phase_step:
+                How many cycles the phase advances per sample, i.e. the
+                frequency divided by the sample rate; either one value, or
+                one per phase. It selects the table with the most harmonics
+                that are all below the Nyquist frequency. ``0`` selects the
+                table with only the fundamental.
+        """
+
+        level = self._get_level(phase_step)
+
+        position = phase - np.floor(phase)
+        position *= self.size
+        index = position.astype(np.intp)
+        # Guards against positions rounding up to exactly ``size``
+        np.minimum(index, self.size - 1, out=index)
+        position -= index
+
+        if np.ndim(level):
+            # Index into all tables at once
+            tables = self.tables.reshape(-1)
+            index += level * self.tables.shape[1]
+        else:
+            tables = self.tables[level]
+
+        out = tables[index + 1]
+        left = tables[index]
+        out -= left
+        out *= position
+        out += left
+        return out
+
+    def _get_level(
+        self, phase_step: Union[float, np.ndarray]
+    ) -> Union[int, np.ndarray]:
+        """Returns the index of the table to use for each phase step."""
+
+        phase_step = np.abs(phase_step)
+        with np.errstate(divide="ignore"):
+            max_harmonics = np.where(phase_step > 0, 0.5 / phase_step, 1.0)
+
+        level = np.floor(np.log2(np.maximum(max_harmonics, 1.0))).astype(np.intp)
+        level = np.minimum(level, len(self.tables) - 1)
+        return int(level) if np.ndim(level) == 0 else level
+
+
+@lru_cache(maxsize=None)
+def get_wavetable(
+    waveform: WavetableWaveform,
+    size: int = DEFAULT_TABLE_SIZE,
+) -> Wavetable:
+    """Returns a cached ``Wavetable`` of the waveform."""
+    return Wavetable.build(waveform, size)
+
+
+@dataclass
+class WavetableWave:
+    """
+    Band-limited carrier wave of a fixed frequency, for e.g. ``Vocoder``.
+    Takes in an array of evenly spaced sample times, like ``SawtoothWave``.
+
+    Use e.g. ``Vocoder.build(carrier_wave_builder=WavetableWave)``.
+    Band-limited carriers alias much less than ``SawtoothWave``, so fewer
+    bands and lower filter orders can give similarly clean output.
+
+    Args:
+        freq:
+            Frequency in Hz.
+        waveform:
+            One of ``"sine"``, ``"sawtooth"`` (default), ``"square"``
+            or ``"triangle"``.
+    """
+
+    freq: float
+    waveform: WavetableWaveform = "sawtooth"
+
+    deterministic: ClassVar[bool] = True
+    """Same input times always produce the same output; see ``Vocoder``."""
+
+    takes_step: ClassVar[bool] = True
+    """Takes the time between samples as its second argument; see ``Vocoder``."""
+
+    def __call__(self, times: np.ndarray, dt: Optional[float] = None) -> np.ndarray:
+        """
+        Args:
+            times:
+                Evenly spaced sample times, in seconds.
+            dt:
+                Seconds between samples, which selects the table. By default,
+                it is taken from the times; a single time is looked up in the
+                table with only the fundamental.
+        """
+
+        if dt is None:
+            dt = times[1] - times[0] if len(times) > 1 else 0.0
+
+        phase = self.freq * times
+        return get_wavetable(self.waveform).lookup(phase, self.freq * dt)
+
+
+@dataclass
+class WavetableWaveFunc:
+    """
+    Band-limited wave function of radians, for e.g. ``RingMod``, like
+    ``np.sin``. E.g. ``RingMod(carrier_wave=WavetableWaveFunc("square"))``.
+
+    The frequency is given by the spacing of the radians, which must be evenly
+    spaced. ``RingMod`` passes it along; otherwise, it is taken from the first
+    two radians, and a single sample is looked up in the table with only the
+    fundamental.
+
+    Args:
+        waveform:
+            One of ``"sine"``, ``"sawtooth"`` (default), ``"square"``
+            or ``"triangle"``.
+    """
+
+    waveform: WavetableWaveform = "sawtooth"
+
+    takes_step: ClassVar[bool] = True
+    """Takes the radians between samples as its second argument; see ``RingMod``."""
+
+    def __call__(
+        self, radians: np.ndarray, radians_step: Optional[float] = None
+    ) -> np.ndarray:
+        if radians_step is None:
+            radians_step = radians[1] - radians[0] if len(radians) > 1 else 0.0
+
+        phase = radians * (1 / (2 * np.pi))
+        return get_wavetable(self.waveform).lookup(phase, radians_step / (2 * np.pi))
+
+
+def _get_sine_amplitudes(
+    waveform: WavetableWaveform,
+    harmonics: np.ndarray,
+) -> np.ndarray:
+    """Returns the sine amplitude of each harmonic of the waveform."""
+
+    if waveform == "sine":
+        return np.where(harmonics == 1, 1.0, 0.0)
+
+    if waveform == "sawtooth":
+        # Rising from -1 at phase 0 to 1, like sawtooth_wave()
+        return -2 / (np.pi * harmonics)
+
+    odd = harmonics % 2 == 1
+
+    if waveform == "square":
+        # +1 for the first half of the cycle, -1 for the second
+        return np.where(odd, 4 / (np.pi * harmonics), 0.0)
+
+    if waveform == "triangle":
+        # Rising from 0 at phase 0 to 1 at phase .25
+        signs = (-1.0) ** ((harmonics - 1) // 2)
+        return np.where(odd, 8 / (np.pi**2) * signs / harmonics**2, 0.0)
+
+    raise ValueError(f"Unsupported waveform {waveform!r}.")
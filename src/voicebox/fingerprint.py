@@ -0,0 +1,106 @@
+"""
+Deterministic fingerprints of configuration values, used to build cache keys
+that change whenever a setting that affects the output changes.
+
+Fingerprints only depend on the given values, so they are the same across
+processes and interpreter runs (unlike e.g. ``hash()``).
+"""
+
+__all__ = ["fingerprint", "stable_repr"]
+
+import hashlib
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from types import ModuleType
+from typing import Any
+
+import numpy as np
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Returns a SHA-256 hex digest of the given values.
+
+    Raises:
+        TypeError:
+            If a value is of a type that cannot be represented stably.
+            See ``stable_repr()``.
+    """
+
+    return hashlib.sha256(stable_repr(values).encode("utf-8")).hexdigest()
+
+
+def stable_repr(value: Any) -> str:
+    """
+    Returns a string representation of the value that only depends on its
+    contents (e.g. not on memory addresses or dict insertion order).
+
+    Supports ``None``, bools, numbers, strings, bytes, enums, lists, tuples,
+    sets, dicts, numpy arrays and scalars, dataclass instances, module-level
+    functions and classes (including builtins and numpy functions), and
+    objects with a ``fingerprint()`` method.
+
+    Raises:
+        TypeError:
+            If the value (or a value contained in it) is not supported.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        # Include the type name so e.g. SSML("a") and "a" differ
+        return f"{type(value).__qualname__}:{value!r}"
+
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+
+    if isinstance(value, (list, tuple)):
+        items = ",".join(stable_repr(item) for item in value)
+        return f"{type(value).__qualname__}[{items}]"
+
+    if isinstance(value, (set, frozenset)):
+        items = ",".join(sorted(stable_repr(item) for item in value))
+        return f"{type(value).__qualname__}{{{items}}}"
+
+    if isinstance(value, dict):
+        items = ",".join(
+            sorted(f"{stable_repr(k)}={stable_repr(v)}" for k, v in value.items())
+        )
+        return f"dict{{{items}}}"
+
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return f"ndarray({value.dtype.str},{value.shape},{digest})"
+
+    if isinstance(value, np.generic):
+        return stable_repr(value.item())
+
+    if hasattr(value, "fingerprint") and callable(value.fingerprint):
+        return f"{type(value).__qualname__}({value.fingerprint()})"
+
+    if is_dataclass(value) and not isinstance(value, type):
+        items = ",".join(
+            f"{f.name}={stable_repr(getattr(value, f.name))}" for f in fields(value)
+        )
+        return f"{type(value).__qualname__}({items})"
+
+    if _is_global_function(value):
+        module = getattr(value, "__module__", None) or "numpy"
+        name = value.__qualname__
+        if "<lambda>" in name or "<locals>" in name:
+            raise TypeError(f"Cannot fingerprint local function {name}.")
+
+        return f"function:{module}.{name}"
+
+    raise TypeError(f"Cannot fingerprint value of type {type(value).__qualname__}.")
+
+
+def _is_global_function(value: Any) -> bool:
+    """
+    Whether the value is a function or class, identified by its name (e.g.
+    functions, builtins, numpy ufuncs), and not bound to an object.
+    """
+
+    return (
+        callable(value)
+        and hasattr(value, "__qualname__")
+        and isinstance(getattr(value, "__self__", None), (ModuleType, type(None)))
+    )
@@ -1,6 +1,6 @@
 from voicebox.sinks.distributor import Distributor
 from voicebox.sinks.sink import Sink
-from voicebox.sinks.sounddevice import SoundDevice
+from voicebox.sinks.sounddevice import SoundDevice, SoundDeviceStream
 from voicebox.sinks.wavefile import WaveFile
 
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from voicebox.audio import Audio
 
@@ -11,3 +12,14 @@ class Sink(ABC):
 
     @abstractmethod
     def play(self, audio: Audio) -> None: ...  # pragma: no cover
+
+    def play_stream(self, blocks: Iterable[Audio]) -> None:
+        """
+        Plays a stream of consecutive audio blocks as they arrive.
+
+        By default, each block is played with ``play()``; sinks that can play
+        blocks back-to-back without gaps override this.
+        """
+
+        for block in blocks:
+            self.play(block)
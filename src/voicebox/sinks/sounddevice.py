@@ -1,6 +1,11 @@
+import time
 import warnings
-from dataclasses import dataclass
-from typing import Union, Literal
+from dataclasses import dataclass, field
+from itertools import chain
+from threading import Lock
+from typing import Any, Callable, ClassVar, Iterable, Optional, Union, Literal
+
+import numpy as np
 
 from voicebox.audio import Audio
 from voicebox.sinks.sink import Sink
@@ -34,12 +39,27 @@ class SoundDevice(Sink):
             select the device's default low and high latency, respectively.
             Lower latency reduces time to playback; higher latency improves
             stability.
+
+    ``play_stream()`` keeps its output stream open afterward, so the streams
+    of consecutive text chunks play without reopening the device. Call
+    ``close()`` (or exit the ``with`` block) to release it.
     """
 
     device: Device = None
     blocking: bool = True
     latency: Latency = 0.1
 
+    _stream: Any = field(default=None, init=False, repr=False, compare=False)
+    _stream_lock: Lock = field(
+        default_factory=Lock, init=False, repr=False, compare=False
+    )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def play(self, audio: Audio) -> None:
         sd.play(
             audio.signal,
@@ -48,3 +68,373 @@ class SoundDevice(Sink):
             device=self.device,
             latency=self.latency,
         )
+
+    def play_stream(self, blocks: Iterable[Audio]) -> None:
+        """
+        Writes the blocks to an output stream as they arrive, so they play
+        back-to-back without gaps. All blocks must have the sample rate of the
+        first block. The stream is reused by the next call with the same
+        sample rate. If ``blocking``, waits for the stream's output latency
+        after the last block is written, so it has played.
+        """
+
+        blocks = iter(blocks)
+
+        try:
+            first = next(blocks)
+        except StopIteration:
+            return
+
+        with self._stream_lock:
+            stream = self._get_stream(first.sample_rate)
+
+            try:
+                for block in chain([first], blocks):
+                    signal = block.signal.astype(np.float32, copy=False)
+                    stream.write(signal.reshape(-1, 1))
+            except BaseException:
+                self._close_stream()
+                raise
+
+            if self.blocking:
+                time.sleep(stream.latency)
+
+    def close(self) -> None:
+        """Closes the output stream of ``play_stream()``, if it is open."""
+
+        with self._stream_lock:
+            self._close_stream()
+
+    def _get_stream(self, sample_rate: int):
+        stream = self._stream
+        if stream is not None and stream.samplerate == sample_rate and stream.active:
+            return stream
+
+        self._close_stream()
+
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+            device=self.device,
+            latency=self.latency,
+        )
+        self._stream.start()
+        return self._stream
+
+    def _close_stream(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+@dataclass
+class SoundDeviceStream(Sink):
+    """
+    An audio sink that keeps a single
+    `sounddevice <https://python-sounddevice.readthedocs.io/en/0.4.6/>`_
+    output stream open, and plays audio from a ring buffer that ``play()``
+    writes into. Unlike :class:`SoundDevice`, no stream is opened per audio,
+    so there is no startup latency and consecutive audios play back-to-back
+    without gaps.
+
+    The stream is opened on the first call to ``play()``, and stays open
+    until ``close()`` is called (or the ``with`` block is exited). By default,
+    ``play()`` returns as soon as the audio is queued, so the next audio can
+    be queued while it plays; ``close()`` waits for the queued audio to
+    finish playing.
+
+    Args:
+        sample_rate (int):
+            Sample rate of the output stream. Audio with a different sample
+            rate is resampled on the fly (by linear interpolation).
+            If ``None`` (default), the sample rate of the first audio is used.
+        device (Device):
+            Device index or query string specifying the device to be used.
+            If ``None`` (default), a device will be selected automatically.
+            See :func:`sounddevice.query_devices()` for valid choices.
+        blocking (bool):
+            Whether to wait for playback to finish before returning.
+            Default is ``False``, which keeps back-to-back audio gapless.
+            ``play()`` always waits while the ring buffer is full.
+        latency (float | 'low' | 'high'):
+            The desired latency in seconds. The special values 'low' and 'high'
+            select the device's default low and high latency, respectively.
+        buffer_seconds (float):
+            Capacity of the ring buffer in seconds.
+        stall_timeout (float):
+            Seconds to wait for the stream to read any audio from a full ring
+            buffer, or from a buffer being played to the end, before raising
+            ``TimeoutError``. Waiting also stops if the stream stops, e.g.
+            because of a device error.
+        stream_factory:
+            Called with the keyword arguments of
+            :class:`sounddevice.OutputStream` to create the output stream.
+            Defaults to :class:`sounddevice.OutputStream`; can be replaced
+            with e.g. a fake stream for testing.
+    """
+
+    sample_rate: Optional[int] = None
+    device: Device = None
+    blocking: bool = False
+    latency: Latency = 0.1
+    buffer_seconds: float = 2.0
+    stall_timeout: float = 5.0
+    stream_factory: Optional[Callable[..., Any]] = None
+
+    underrun_count: int = field(default=0, init=False, compare=False)
+    """
+    Number of callbacks that ran out of audio while audio was still being
+    written by ``play()``, i.e. audio was not produced fast enough.
+    """
+
+    underrun_frames: int = field(default=0, init=False, compare=False)
+    """Number of frames of silence output because of underruns."""
+
+    output_underflow_count: int = field(default=0, init=False, compare=False)
+    """Number of callbacks where PortAudio reported an output underflow."""
+
+    _stream: Any = field(default=None, init=False, repr=False, compare=False)
+    _ring_buffer: Optional["_RingBuffer"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _producer_lock: Lock = field(
+        default_factory=Lock, init=False, repr=False, compare=False
+    )
+    _producing: bool = field(default=False, init=False, repr=False, compare=False)
+    _output_sample_rate: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _poll_interval: ClassVar[float] = 0.005
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def play(self, audio: Audio) -> None:
+        self.play_stream([audio])
+
+    def play_stream(self, blocks: Iterable[Audio]) -> None:
+        with self._producer_lock:
+            resampler = None
+            self._producing = True
+
+            try:
+                for block in blocks:
+                    self._open(block.sample_rate)
+
+                    if resampler is None or resampler.in_rate != block.sample_rate:
+                        resampler = _LinearResampler(
+                            block.sample_rate, self._output_sample_rate
+                        )
+
+                    self._write(resampler.process(block.signal))
+            finally:
+                self._producing = False
+
+            if self.blocking and self._ring_buffer is not None:
+                self._wait_until_played(self._ring_buffer.write_count)
+
+    def close(self) -> None:
+        """Waits for buffered audio to finish playing, then closes the stream."""
+
+        with self._producer_lock:
+            if self._stream is None:
+                return
+
+            try:
+                self._wait_until_played(self._ring_buffer.write_count)
+            finally:
+                self._close_stream()
+
+    def _close_stream(self) -> None:
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+        self._ring_buffer = None
+
+    def _open(self, sample_rate: int) -> None:
+        if self._stream is not None:
+            return
+
+        sample_rate = self.sample_rate or sample_rate
+        self._output_sample_rate = sample_rate
+        self._ring_buffer = _RingBuffer(round(self.buffer_seconds * sample_rate))
+
+        stream_factory = self.stream_factory or sd.OutputStream
+        self._stream = stream_factory(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="float32",
+            device=self.device,
+            latency=self.latency,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def _write(self, signal: np.ndarray) -> None:
+        signal = signal.astype(np.float32, copy=False)
+        ring_buffer = self._ring_buffer
+
+        while True:
+            written = ring_buffer.write(signal)
+            signal = signal[written:]
+            if not len(signal):
+                return
+
+            if not self._wait_for_stream(
+                lambda: ring_buffer.readable() < ring_buffer.capacity
+            ):
+                # Reopened by the next play()
+                self._close_stream()
+                raise RuntimeError("The output stream stopped during playback.")
+
+    def _wait_until_played(self, write_count: int) -> None:
+        ring_buffer = self._ring_buffer
+        self._wait_for_stream(lambda: ring_buffer.read_count >= write_count)
+
+    def _wait_for_stream(self, done: Callable[[], bool]) -> bool:
+        """
+        Waits until ``done()`` returns ``True`` as the stream reads from the
+        ring buffer. Returns ``False`` early if the stream is no longer active.
+
+        Raises:
+            TimeoutError:
+                If the stream reads nothing for ``stall_timeout`` seconds.
+        """
+
+        ring_buffer = self._ring_buffer
+        read_count = ring_buffer.read_count
+        deadline = time.monotonic() + self.stall_timeout
+
+        while not done():
+            if not self._stream.active:
+                return False
+
+            if ring_buffer.read_count != read_count:
+                read_count = ring_buffer.read_count
+                deadline = time.monotonic() + self.stall_timeout
+            elif time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"The output stream read no audio for {self.stall_timeout} s."
+                )
+
+            time.sleep(self._poll_interval)
+
+        return True
+
+    def _callback(self, outdata: np.ndarray, frames: int, time_, status) -> None:
+        out = outdata[:, 0]
+        read = self._ring_buffer.read_into(out)
+
+        if read < frames:
+            out[read:] = 0
+
+            if self._producing:
+                self.underrun_count += 1
+                self.underrun_frames += frames - read
+
+        if status and status.output_underflow:
+            self.output_underflow_count += 1
+
+
+class _RingBuffer:
+    """
+    Single-producer, single-consumer ring buffer of float32 samples.
+
+    The producer only advances ``write_count`` and the consumer only advances
+    ``read_count``, each after copying its samples, so neither side needs a
+    lock. The counts are totals, so a full buffer is never mistaken for an
+    empty one.
+    """
+
+    write_count: int
+    read_count: int
+
+    _buffer: np.ndarray
+
+    def __init__(self, capacity: int):
+        self._buffer = np.zeros(max(capacity, 1), dtype=np.float32)
+        self.write_count = 0
+        self.read_count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def readable(self) -> int:
+        return self.write_count - self.read_count
+
+    def write(self, samples: np.ndarray) -> int:
+        """Writes as many samples as fit, and returns the number written."""
+
+        n = min(len(samples), self.capacity - self.readable())
+        self._copy(samples[:n], self.write_count, to_buffer=True)
+        self.write_count += n
+        return n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Reads as many samples as available into ``out``, and returns the number read."""
+
+        n = min(len(out), self.readable())
+        self._copy(out[:n], self.read_count, to_buffer=False)
+        self.read_count += n
+        return n
+
+    def _copy(self, samples: np.ndarray, count: int, to_buffer: bool) -> None:
+        start = count % self.capacity
+        first = min(len(samples), self.capacity - start)
+
+        for buffer_slice, samples_slice in (
+            (slice(start, start + first), slice(0, first)),
+            (slice(0, len(samples) - first), slice(first, len(samples))),
+        ):
+            if to_buffer:
+                self._buffer[buffer_slice] = samples[samples_slice]
+            else:
+                samples[samples_slice] = self._buffer[buffer_slice]
+
+
+class _LinearResampler:
+    """
+    Resamples consecutive blocks of a signal by linear interpolation,
+    carrying the position between blocks so they join seamlessly.
+    """
+
+    in_rate: int
+    out_rate: int
+
+    _step: float
+    _position: float
+    """Position of the next output sample, in input samples from the start of the next block."""
+
+    _last_sample: float
+
+    def __init__(self, in_rate: int, out_rate: int):
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self._step = in_rate / out_rate
+        self._position = 0.0
+        self._last_sample = 0.0
+
+    def process(self, signal: np.ndarray) -> np.ndarray:
+        if self.in_rate == self.out_rate or not len(signal):
+            return signal
+
+        # Position -1 is the last sample of the previous block
+        last_index = len(signal) - 1
+        count = max(int(np.floor((last_index - self._position) / self._step)) + 1, 0)
+        positions = self._position + np.arange(count) * self._step
+
+        signal_with_last = np.concatenate([[self._last_sample], signal])
+        out = np.interp(
+            positions + 1, np.arange(len(signal_with_last)), signal_with_last
+        )
+
+        self._position += count * self._step - len(signal)
+        self._last_sample = signal[-1]
+
+        return out
@@ -73,10 +73,11 @@ def write_audio_to_wav(
 
     dtype = sample_width_to_dtype[sample_width]
 
-    # Assuming signal is in range[-1, 1], scale to [-max_value, max_value)
+    # Assuming signal is in range[-1, 1], scale to [-max_value, max_value).
+    # float32 is precise enough for 8- and 16-bit samples.
     max_value = 2 ** (8 * sample_width - 1) - 1
-    signal = signal.astype(np.float64)
-    signal *= max_value
+    scale_dtype = np.float64 if sample_width > 2 else np.float32
+    signal = np.multiply(signal, max_value, dtype=scale_dtype)
     signal = signal.astype(dtype)
     signal_bytes = signal.tobytes()
 
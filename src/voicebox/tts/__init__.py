@@ -3,6 +3,7 @@ from voicebox.tts.tts import (
     AudioFileTTS,
     WavFileTTS,
     FallbackTTS,
+    PooledTTS,
     RetryTTS,
 )
 
@@ -16,8 +17,8 @@ try:
 except ImportError:
     pass
 
-from voicebox.tts.cache import CachedTTS, PrerecordedTTS
-from voicebox.tts.espeakng import ESpeakConfig, ESpeakNG
+from voicebox.tts.cache import CachedTTS, DiskCache, PrerecordedTTS
+from voicebox.tts.espeakng import ESpeakConfig, ESpeakNG, PrewarmedESpeakNG
 
 try:
     from voicebox.tts.elevenlabs import ElevenLabsTTS
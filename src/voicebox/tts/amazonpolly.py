@@ -1,15 +1,20 @@
 from contextlib import closing
 from dataclasses import dataclass
-from typing import Literal, Sequence
+from typing import Iterator, Literal, Sequence
 
 import numpy as np
 from mypy_boto3_polly.client import PollyClient
 from mypy_boto3_polly.literals import LanguageCodeType, EngineType, VoiceIdType
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.ssml import SSML
 from voicebox.tts.tts import TTS
-from voicebox.tts.utils import add_optional_items, get_audio_from_samples
+from voicebox.tts.utils import (
+    add_optional_items,
+    get_audio_from_samples,
+    iter_audio_from_pcm_chunks,
+)
 from voicebox.types import StrOrSSML
 
 
@@ -55,7 +60,45 @@ class AmazonPolly(TTS):
     sample_rate: Literal[8000, 16000] = 16000
     """Sample rate of returned audio. Must be ``8000`` or ``16000``."""
 
+    stream_chunk_size: int = 4096
+    """Number of samples per chunk yielded by ``stream_speech()``."""
+
+    lazy_audio: bool = False
+    """
+    If ``True``, ``get_speech()`` returns a :class:`PcmAudio`, which keeps
+    the int16 samples until its signal is first used, e.g. by an effect.
+    """
+
     def get_speech(self, text: StrOrSSML) -> Audio:
+        response = self._synthesize_speech(text)
+
+        with closing(response["AudioStream"]) as audio_stream:
+            signal_bytes = audio_stream.read()
+
+        samples = np.frombuffer(signal_bytes, dtype=np.int16)
+
+        return get_audio_from_samples(samples, self.sample_rate, lazy=self.lazy_audio)
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        response = self._synthesize_speech(text)
+
+        with closing(response["AudioStream"]) as audio_stream:
+            chunks = audio_stream.iter_chunks(self.stream_chunk_size * 2)
+            yield from iter_audio_from_pcm_chunks(
+                chunks, self.sample_rate, dtype=np.int16
+            )
+
+    def fingerprint(self) -> str:
+        return fingerprint(
+            type(self).__qualname__,
+            self.voice_id,
+            self.engine,
+            self.language_code,
+            self.lexicon_names,
+            self.sample_rate,
+        )
+
+    def _synthesize_speech(self, text: StrOrSSML) -> dict:
         kwargs = dict(
             OutputFormat="pcm",
             Text=text,
@@ -73,11 +116,4 @@ class AmazonPolly(TTS):
             ],
         )
 
-        response = self.client.synthesize_speech(**kwargs)
-
-        with closing(response["AudioStream"]) as audio_stream:
-            signal_bytes = audio_stream.read()
-
-        samples = np.frombuffer(signal_bytes, dtype=np.int16)
-
-        return get_audio_from_samples(samples, self.sample_rate)
+        return self.client.synthesize_speech(**kwargs)
@@ -1,18 +1,38 @@
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import (
     Any,
     Callable,
+    ClassVar,
+    Dict,
+    Hashable,
     Iterable,
+    Iterator,
     Literal,
     Mapping,
     MutableMapping,
+    Optional,
+    Tuple,
     Type,
     Union,
 )
 
+import numpy as np
 from cachetools import Cache, LRUCache
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
+from voicebox.ssml import SSML
 from voicebox.tts import TTS
 from voicebox.tts.utils import get_audio_from_wav_file
 from voicebox.types import StrOrSSML, FileOrPath
@@ -22,13 +42,106 @@ Size = Union[int, float]
 SizeFunc = Callable[[Any], Size]
 """Returns the size of the given item."""
 
+KeyFunc = Callable[[TTS, StrOrSSML], Hashable]
+"""Returns the cache key for the given TTS and text."""
+
+
+def text_key(tts: TTS, text: StrOrSSML) -> StrOrSSML:
+    """Cache key of just the text. The TTS settings are not part of the key."""
+    return text
+
+
+def fingerprint_key(tts: TTS, text: StrOrSSML) -> Tuple[str, StrOrSSML]:
+    """
+    Cache key of the TTS fingerprint (see ``TTS.fingerprint()``) and the text,
+    so audio is never reused after a TTS setting changes, and one cache can be
+    shared by many TTSs.
+    """
+
+    return tts.fingerprint(), text
+
+
+def build_cache(
+    max_size: Size = 60,
+    size_func: Union[Literal["bytes", "count", "seconds"], SizeFunc] = "seconds",
+    cache_class: Type[Cache] = LRUCache,
+) -> Cache:
+    """
+    Returns an in-memory cache of ``Audio`` instances.
+    See ``CachedTTS.build()`` for the arguments.
+    """
+
+    if size_func == "bytes":
+        size_func = lambda audio: audio.len_bytes
+    elif size_func == "count":
+        size_func = lambda audio: 1
+    elif size_func == "seconds":
+        size_func = lambda audio: audio.len_seconds
+
+    return cache_class(maxsize=max_size, getsizeof=size_func)
+
+
+@dataclass
+class CacheStats:
+    """Counts of cache lookups, e.g. by ``CachedTTS``."""
+
+    hits: int = 0
+    """Number of requests answered from the cache."""
+
+    misses: int = 0
+    """Number of requests that were not in the cache."""
+
+    coalesced: int = 0
+    """
+    Number of requests that waited for a concurrent request for the same key,
+    instead of calling the wrapped TTS. Only counted by ``CachedTTS`` with
+    ``thread_safe=True``.
+    """
+
 
 @dataclass
 class CachedTTS(TTS):
-    """Wraps a ``TTS`` instance in a cache to reduce calls to the ``TTS``."""
+    """
+    Wraps a ``TTS`` instance in a cache to reduce calls to the ``TTS``.
+
+    Args:
+        tts:
+            The TTS instance to wrap.
+        cache:
+            The cache mapping keys to ``Audio`` instances.
+        key_func:
+            Returns the cache key for the TTS and text. Defaults to
+            ``text_key``, which keys by text only, so the cached audio goes
+            stale if a TTS setting changes. Use ``fingerprint_key`` to include
+            the TTS settings in the key.
+        thread_safe:
+            If ``True``, the cache is locked while it is used, so this
+            instance can be shared by multiple threads (e.g. multiple
+            ``ParallelVoicebox`` instances). Concurrent requests for the same
+            uncached key are coalesced: only the first calls the wrapped TTS,
+            and the rest wait for and share its audio (or exception).
+            Caches that are safe to use from multiple threads by themselves
+            (see ``DiskCache.thread_safe``) are written to outside the lock,
+            so slow writes do not hold up requests for other keys.
+            Defaults to ``False``.
+
+    Attributes:
+        stats:
+            Hit, miss, and coalesced request counts.
+    """
 
     tts: TTS
     cache: MutableMapping
+    key_func: KeyFunc = text_key
+    thread_safe: bool = False
+
+    stats: CacheStats = field(default_factory=CacheStats, init=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _in_flight: Dict[Hashable, Future] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def build(
@@ -37,6 +150,8 @@ class CachedTTS(TTS):
         max_size: Size = 60,
         size_func: Union[Literal["bytes", "count", "seconds"], SizeFunc] = "seconds",
         cache_class: Type[Cache] = LRUCache,
+        key_func: KeyFunc = text_key,
+        thread_safe: bool = False,
     ) -> "CachedTTS":
         """
         Constructs a cache that by default will keep the most recently used
@@ -58,32 +173,238 @@ class CachedTTS(TTS):
             cache_class: The ``Cache`` class used to construct the cache.
                 Defaults to ``cachetools.LRUCache``, a Least Recently Used
                 cache.
+            key_func: Returns the cache key for the TTS and text.
+                Defaults to ``text_key``; see ``CachedTTS``.
+            thread_safe: Whether to lock the cache and coalesce concurrent
+                requests. Defaults to ``False``; see ``CachedTTS``.
 
         Returns:
             An instance of ``CachedTTS``.
         """
 
-        if size_func == "bytes":
-            size_func = lambda audio: audio.len_bytes
-        elif size_func == "count":
-            size_func = lambda audio: 1
-        elif size_func == "seconds":
-            size_func = lambda audio: audio.len_seconds
+        cache = build_cache(max_size, size_func, cache_class)
+        return cls(tts, cache, key_func=key_func, thread_safe=thread_safe)
 
-        cache = cache_class(maxsize=max_size, getsizeof=size_func)
+    @classmethod
+    def build_on_disk(
+        cls,
+        tts: TTS,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 2**20,
+        key_func: KeyFunc = fingerprint_key,
+        thread_safe: bool = False,
+    ) -> "CachedTTS":
+        """
+        Wraps the given ``TTS`` instance in a :class:`DiskCache`, so cached
+        audio persists across process restarts and is shared by all
+        processes using the same ``path``.
 
-        return cls(tts, cache)
+        Args:
+            tts: The TTS instance to wrap.
+            path: Directory to store the cache in. Created if needed.
+            max_bytes: The maximum total size of the cached audio signals.
+                Defaults to 256 MiB.
+            key_func: Returns the cache key for the TTS and text. Defaults to
+                ``fingerprint_key``, so differently configured TTSs can share
+                the same directory.
+            thread_safe: Whether to lock the cache and coalesce concurrent
+                requests. Defaults to ``False``; see ``CachedTTS``.
+
+        Returns:
+            An instance of ``CachedTTS``.
+        """
+
+        return cls(
+            tts,
+            DiskCache(path, max_bytes=max_bytes),
+            key_func=key_func,
+            thread_safe=thread_safe,
+        )
 
     def get_speech(self, text: StrOrSSML) -> Audio:
+        key = self.key_func(self.tts, text)
+
+        if not self.thread_safe:
+            try:
+                audio = self.cache[key]
+            except KeyError:
+                self.stats.misses += 1
+                audio = self.tts.get_speech(text)
+                return self._add_to_cache(key, audio)
+            else:
+                self.stats.hits += 1
+                return audio
+
+        audio, flight = self._get_or_start_flight(key)
+        if audio is not None:
+            return audio
+        elif flight is not None:
+            return self._wait_for_flight(flight, text)
+
         try:
-            return self.cache[text]
-        except KeyError:
             audio = self.tts.get_speech(text)
-            return self._add_to_cache(text, audio)
+        except BaseException as e:
+            self._finish_flight(key, exception=e)
+            raise
+
+        return self._finish_flight(key, audio)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        """
+        Like ``get_speech()``, but awaits ``get_speech_async()`` of the
+        wrapped TTS on a cache miss. If ``thread_safe=True``, concurrent
+        requests for the same key are coalesced across coroutines and threads.
+        """
+
+        key = self.key_func(self.tts, text)
+
+        if not self.thread_safe:
+            try:
+                audio = self.cache[key]
+            except KeyError:
+                self.stats.misses += 1
+                audio = await self.tts.get_speech_async(text)
+                return self._add_to_cache(key, audio)
+            else:
+                self.stats.hits += 1
+                return audio
+
+        audio, flight = self._get_or_start_flight(key)
+        if audio is not None:
+            return audio
+        elif flight is not None:
+            audio = await asyncio.wrap_future(flight)
+            return audio if audio is not None else await self.get_speech_async(text)
+
+        try:
+            audio = await self.tts.get_speech_async(text)
+        except BaseException as e:
+            self._finish_flight(key, exception=e)
+            raise
+
+        return self._finish_flight(key, audio)
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        """
+        Yields the cached audio if there is any. Otherwise, yields chunks
+        from the wrapped TTS as they are generated, and caches the full audio
+        once the stream is complete.
+        """
+
+        key = self.key_func(self.tts, text)
 
-    def _add_to_cache(self, text: StrOrSSML, audio: Audio) -> Audio:
+        if not self.thread_safe:
+            try:
+                audio = self.cache[key]
+            except KeyError:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                yield audio
+                return
+
+            audio = yield from self._stream_and_collect(text)
+            if audio is not None:
+                self._add_to_cache(key, audio)
+
+            return
+
+        audio, flight = self._get_or_start_flight(key)
+        if audio is not None:
+            yield audio
+            return
+        elif flight is not None:
+            yield self._wait_for_flight(flight, text)
+            return
+
+        audio = None
         try:
-            self.cache[text] = audio
+            audio = yield from self._stream_and_collect(text)
+        except BaseException as e:
+            # Includes GeneratorExit if the stream is closed early
+            self._finish_flight(key, exception=e)
+            raise
+
+        self._finish_flight(key, audio)
+
+    def fingerprint(self) -> str:
+        return self.tts.fingerprint()
+
+    def _stream_and_collect(self, text: StrOrSSML) -> Iterator[Audio]:
+        """Yields the TTS chunks, and returns their concatenated audio."""
+
+        # Chunks may be modified after being yielded, so keep copies
+        signals = []
+        sample_rate = None
+        for chunk in self.tts.stream_speech(text):
+            signals.append(chunk.signal.copy())
+            sample_rate = chunk.sample_rate
+            yield chunk
+
+        return Audio(np.concatenate(signals), sample_rate) if signals else None
+
+    def _get_or_start_flight(
+        self, key: Hashable
+    ) -> Tuple[Optional[Audio], Optional[Future]]:
+        """
+        Returns ``(audio, None)`` on a cache hit, ``(None, flight)`` if
+        another thread is already generating the audio, or ``(None, None)``
+        if the caller must generate the audio and then call
+        ``_finish_flight()``.
+        """
+
+        with self._lock:
+            try:
+                audio = self.cache[key]
+            except KeyError:
+                pass
+            else:
+                self.stats.hits += 1
+                return audio, None
+
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self.stats.coalesced += 1
+                return None, flight
+
+            self.stats.misses += 1
+            self._in_flight[key] = Future()
+            return None, None
+
+    def _finish_flight(
+        self,
+        key: Hashable,
+        audio: Optional[Audio] = None,
+        exception: BaseException = None,
+    ) -> Optional[Audio]:
+        if audio is not None:
+            cache_lock = (
+                nullcontext()
+                if getattr(self.cache, "thread_safe", False)
+                else self._lock
+            )
+            with cache_lock:
+                self._add_to_cache(key, audio)
+
+        # Only after caching, so requests in between still join the flight
+        with self._lock:
+            flight = self._in_flight.pop(key)
+
+        if isinstance(exception, Exception):
+            flight.set_exception(exception)
+        else:
+            # No audio (e.g. a stream closed early); waiters generate their own
+            flight.set_result(audio)
+
+        return audio
+
+    def _wait_for_flight(self, flight: Future, text: StrOrSSML) -> Audio:
+        audio = flight.result()
+        return audio if audio is not None else self.get_speech(text)
+
+    def _add_to_cache(self, key: Hashable, audio: Audio) -> Audio:
+        try:
+            self.cache[key] = audio
         except ValueError as e:
             if str(e) != "value too large":
                 raise
@@ -91,6 +412,322 @@ class CachedTTS(TTS):
         return audio
 
 
+class DiskCache(MutableMapping):
+    """
+    Persistent cache of ``Audio`` instances, for use with :class:`CachedTTS`.
+    Keys must be strings (including ``SSML``), or tuples of keys, like those
+    returned by ``text_key`` and ``fingerprint_key``.
+
+    Signals are stored as ``.npy`` files in ``path``, with an SQLite index of
+    the keys, sample rates, sizes, and last access times. Keys are stored
+    by a SHA-256 hash of the namespace and key. Audio is memory-mapped
+    (copy-on-write) when read, so cached clips are not loaded until used,
+    and can still be modified in memory.
+
+    When the total size of the signals exceeds ``max_bytes``, the least
+    recently used clips are evicted.
+
+    Signal files are written to a temporary file first and then renamed into
+    place, and index changes are made in SQLite transactions, so a crash never
+    leaves a partially written clip in the cache. Signal files left unindexed
+    by a crash are deleted when the cache is next opened. Multiple threads and
+    processes can safely use the same ``path`` at the same time.
+
+    Reads do not lock the index, so they do not block each other. Access times
+    are written to the index in batches (see ``flush()``), so other processes
+    may see slightly stale access times when evicting.
+
+    Args:
+        path:
+            Directory to store the cache in. Created if needed.
+        max_bytes:
+            The maximum total size of the cached audio signals.
+        namespace:
+            Keys of caches with different namespaces do not collide, even if
+            they share a ``path``.
+    """
+
+    path: Path
+    max_bytes: int
+    namespace: str
+
+    thread_safe: ClassVar[bool] = True
+    """
+    Safe to use from multiple threads without an outside lock, so
+    ``CachedTTS`` does not hold its lock while writing to it.
+    """
+
+    timeout: float = 30.0
+    """Seconds to wait for other processes to release the index."""
+
+    access_batch_size: int = 32
+    """Number of reads whose access times are written to the index together."""
+
+    orphan_age: float = 300.0
+    """
+    Unindexed signal files older than this many seconds are deleted when the
+    cache is opened. Younger files may still be about to be indexed by another
+    process.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 2**20,
+        namespace: str = "",
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+
+        self._local = threading.local()
+        self._access_times: Dict[str, float] = {}
+        self._access_times_lock = threading.Lock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS clips ("
+                "digest TEXT PRIMARY KEY, "
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "sample_rate INTEGER NOT NULL, "
+                "nbytes INTEGER NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS clips_last_access ON clips (last_access)"
+            )
+            self._delete_orphans(conn)
+
+    def __getitem__(self, key: Hashable) -> Audio:
+        digest = self._digest(key)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sample_rate, nbytes FROM clips WHERE digest = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+
+        sample_rate, nbytes = row
+        blob_path = self._blob_path(digest)
+
+        try:
+            # Empty arrays cannot be memory-mapped
+            signal = np.load(blob_path, mmap_mode="c" if nbytes else None)
+        except FileNotFoundError:
+            # Blob was lost, e.g. by a crash during eviction
+            with self._transaction() as conn:
+                if not blob_path.exists():
+                    conn.execute("DELETE FROM clips WHERE digest = ?", (digest,))
+
+            raise KeyError(key) from None
+
+        with self._access_times_lock:
+            self._access_times[digest] = time.time()
+            batch_full = len(self._access_times) >= self.access_batch_size
+
+        if batch_full:
+            self.flush()
+
+        return Audio(signal, sample_rate)
+
+    def __setitem__(self, key: Hashable, audio: Audio) -> None:
+        nbytes = audio.signal.nbytes
+        if nbytes > self.max_bytes:
+            raise ValueError("value too large")
+
+        encoded_key = _encode_key(key)
+        digest = self._digest(key)
+        self._write_blob(digest, audio.signal)
+
+        with self._transaction() as conn:
+            self._write_access_times(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO clips VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    self.namespace,
+                    encoded_key,
+                    audio.sample_rate,
+                    nbytes,
+                    time.time(),
+                ),
+            )
+            self._evict(conn, keep_digest=digest)
+
+    def __delitem__(self, key: Hashable) -> None:
+        digest = self._digest(key)
+
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM clips WHERE digest = ?", (digest,)
+            ).rowcount
+            if not deleted:
+                raise KeyError(key)
+
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key FROM clips WHERE namespace = ?", (self.namespace,)
+            ).fetchall()
+
+        for (encoded_key,) in rows:
+            yield _decode_key(json.loads(encoded_key))
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM clips WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    @property
+    def currsize(self) -> int:
+        """Total size in bytes of all signals in the cache directory."""
+
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(nbytes), 0) FROM clips"
+            ).fetchone()[0]
+
+    def flush(self) -> None:
+        """
+        Writes the access times of clips read since the last flush to the index.
+        Called automatically every ``access_batch_size`` reads, and before
+        evicting clips.
+        """
+
+        with self._transaction() as conn:
+            self._write_access_times(conn)
+
+    def _write_access_times(self, conn: sqlite3.Connection) -> None:
+        with self._access_times_lock:
+            access_times, self._access_times = self._access_times, {}
+
+        conn.executemany(
+            "UPDATE clips SET last_access = ? WHERE digest = ?",
+            [(t, digest) for digest, t in access_times.items()],
+        )
+
+    def _delete_orphans(self, conn: sqlite3.Connection) -> None:
+        """
+        Deletes signal and temporary files that are not in the index, e.g.
+        because of a crash between writing the signal and indexing it.
+        """
+
+        digests = {digest for (digest,) in conn.execute("SELECT digest FROM clips")}
+        max_mtime = time.time() - self.orphan_age
+
+        for path in [*self.path.glob("*.npy"), *self.path.glob("*.tmp")]:
+            if path.suffix == ".npy" and path.stem in digests:
+                continue
+
+            try:
+                if path.stat().st_mtime < max_mtime:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _digest(self, key: Hashable) -> str:
+        key = "\0".join((self.namespace, _encode_key(key)))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.path / f"{digest}.npy"
+
+    def _write_blob(self, digest: str, signal: np.ndarray) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, signal)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self._blob_path(digest))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def _evict(self, conn: sqlite3.Connection, keep_digest: str) -> None:
+        total = conn.execute("SELECT SUM(nbytes) FROM clips").fetchone()[0]
+
+        rows = conn.execute(
+            "SELECT digest, nbytes FROM clips WHERE digest != ? "
+            "ORDER BY last_access",
+            (keep_digest,),
+        )
+
+        evicted = []
+        for digest, nbytes in rows:
+            if total <= self.max_bytes:
+                break
+
+            evicted.append(digest)
+            total -= nbytes
+
+        for digest in evicted:
+            conn.execute("DELETE FROM clips WHERE digest = ?", (digest,))
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yields this thread's connection to the index, opening it if needed."""
+
+        pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+
+        # Connections must not be shared with forked processes
+        if conn is None or self._local.pid != pid:
+            conn = sqlite3.connect(
+                self.path / "index.sqlite", timeout=self.timeout, isolation_level=None
+            )
+            self._local.conn, self._local.pid = conn, pid
+
+        yield conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+
+def _encode_key(key: Hashable) -> str:
+    """Encodes the key as JSON, keeping ``SSML`` and tuples distinguishable."""
+
+    def to_json(k):
+        if isinstance(k, SSML):
+            return {"ssml": str(k)}
+        elif isinstance(k, str):
+            return k
+        elif isinstance(k, tuple):
+            return [to_json(item) for item in k]
+
+        raise TypeError(f"Unsupported DiskCache key type: {type(k).__name__}")
+
+    return json.dumps(to_json(key))
+
+
+def _decode_key(value) -> Hashable:
+    if isinstance(value, dict):
+        return SSML(value["ssml"])
+    elif isinstance(value, list):
+        return tuple(_decode_key(item) for item in value)
+
+    return value
+
+
 @dataclass
 class PrerecordedTTS(TTS):
     """
@@ -109,6 +746,10 @@ class PrerecordedTTS(TTS):
     texts_to_audios: Mapping[StrOrSSML, Audio]
     fallback_tts: TTS = None
 
+    _clips_fingerprint: Optional[Tuple[list, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_tts(
         cls,
@@ -178,3 +819,53 @@ class PrerecordedTTS(TTS):
                 return self.fallback_tts.get_speech(text)
             else:
                 raise
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        try:
+            return self.texts_to_audios[text]
+        except KeyError:
+            if self.fallback_tts is not None:
+                return await self.fallback_tts.get_speech_async(text)
+            else:
+                raise
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        try:
+            yield self.texts_to_audios[text]
+        except KeyError:
+            if self.fallback_tts is not None:
+                yield from self.fallback_tts.stream_speech(text)
+            else:
+                raise
+
+    def fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the texts, clips, and fallback TTS.
+
+        The fingerprint of the clips is only recomputed when a text or clip is
+        added, removed, or replaced, so clips must not be modified in place.
+        """
+
+        fallback = (
+            None if self.fallback_tts is None else self.fallback_tts.fingerprint()
+        )
+        return fingerprint(
+            type(self).__qualname__, self._get_clips_fingerprint(), fallback
+        )
+
+    def _get_clips_fingerprint(self) -> str:
+        clips = [
+            (text, audio, audio.signal) for text, audio in self.texts_to_audios.items()
+        ]
+
+        if self._clips_fingerprint is not None:
+            old_clips, clips_fingerprint = self._clips_fingerprint
+            if len(old_clips) == len(clips) and all(
+                all(a is b for a, b in zip(old_clip, clip))
+                for old_clip, clip in zip(old_clips, clips)
+            ):
+                return clips_fingerprint
+
+        clips_fingerprint = fingerprint(dict(self.texts_to_audios))
+        self._clips_fingerprint = clips, clips_fingerprint
+        return clips_fingerprint
@@ -1,11 +1,13 @@
-from typing import Any, Iterator
+import inspect
+from typing import Any, AsyncIterable, Iterable, Iterator, Union
 
 import numpy as np
-from elevenlabs.client import ElevenLabs
+from elevenlabs.client import AsyncElevenLabs, ElevenLabs
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.tts import TTS
-from voicebox.tts.utils import get_audio_from_samples
+from voicebox.tts.utils import get_audio_from_samples, iter_audio_from_pcm_chunks
 from voicebox.types import StrOrSSML
 
 
@@ -28,6 +30,10 @@ class ElevenLabsTTS(TTS):
             (Optional) An :class:`elevenlabs.client.ElevenLabs` instance.
             Use this if you want to further customize the client behavior.
             Note: Cannot be used with the ``api_key`` arg!
+        async_client:
+            (Optional) An :class:`elevenlabs.client.AsyncElevenLabs` instance,
+            used by ``get_speech_async()``. If not given, one is constructed
+            on first use, with the API key of ``client``.
         sample_rate:
             (Optional) PCM audio sample rate. Defaults to 32kHz.
             This is used to set the ``output_format`` of the request.
@@ -39,12 +45,18 @@ class ElevenLabsTTS(TTS):
             (Optional) Additional kwargs to pass to the ``client.text_to_speech.convert``
             call. See here for all options:
             https://elevenlabs.io/docs/api-reference/text-to-speech/convert
+        lazy_audio:
+            (Optional) If ``True``, ``get_speech()`` and ``get_speech_async()``
+            return a :class:`PcmAudio`, which keeps the int16 samples until
+            its signal is first used, e.g. by an effect. Defaults to ``False``.
     """
 
     client: ElevenLabs
+    async_client: AsyncElevenLabs
     voice_id: str
     sample_rate: int
     convert_kwargs: dict[str, Any]
+    lazy_audio: bool
 
     def __init__(
         self,
@@ -52,8 +64,10 @@ class ElevenLabsTTS(TTS):
         voice_id: str,
         api_key: str = None,
         client: ElevenLabs = None,
+        async_client: AsyncElevenLabs = None,
         sample_rate: int = 32_000,
         convert_kwargs: dict[str, Any] = None,
+        lazy_audio: bool = False,
     ):
         if api_key and client:
             raise ValueError("Cannot give both api_key and client args.")
@@ -62,8 +76,21 @@ class ElevenLabsTTS(TTS):
         self.client = client or (
             ElevenLabs(api_key=api_key) if api_key else ElevenLabs()
         )
+        self._async_client = async_client
         self.sample_rate = sample_rate
         self.convert_kwargs = convert_kwargs or {}
+        self.lazy_audio = lazy_audio
+
+    @property
+    def async_client(self) -> AsyncElevenLabs:
+        if self._async_client is None:
+            self._async_client = AsyncElevenLabs(api_key=self.api_key)
+
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, async_client: AsyncElevenLabs) -> None:
+        self._async_client = async_client
 
     @property
     def api_key(self) -> str:
@@ -75,20 +102,58 @@ class ElevenLabsTTS(TTS):
         return f"pcm_{self.sample_rate}"
 
     def get_speech(self, text: StrOrSSML) -> Audio:
-        pcm_data = self.client.text_to_speech.convert(
+        pcm_data = self._convert(text)
+
+        if isinstance(pcm_data, Iterator):
+            pcm_data = b"".join(pcm_data)
+
+        return self._get_audio_from_pcm_data(pcm_data)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        pcm_data = self.async_client.text_to_speech.convert(
+            **self._get_convert_kwargs(text)
+        )
+
+        if inspect.isawaitable(pcm_data):
+            pcm_data = await pcm_data
+
+        if isinstance(pcm_data, AsyncIterable):
+            pcm_data = b"".join([chunk async for chunk in pcm_data])
+
+        return self._get_audio_from_pcm_data(pcm_data)
+
+    def fingerprint(self) -> str:
+        return fingerprint(
+            type(self).__qualname__,
+            self.voice_id,
+            self.output_format,
+            self.convert_kwargs,
+        )
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        pcm_data = self._convert(text)
+
+        if isinstance(pcm_data, bytes):
+            pcm_data = [pcm_data]
+
+        yield from iter_audio_from_pcm_chunks(pcm_data, self.sample_rate)
+
+    def _convert(self, text: StrOrSSML) -> Union[bytes, Iterable[bytes]]:
+        return self.client.text_to_speech.convert(**self._get_convert_kwargs(text))
+
+    def _get_convert_kwargs(self, text: StrOrSSML) -> dict[str, Any]:
+        return dict(
             voice_id=self.voice_id,
             text=text,
             output_format=self.output_format,
             **self.convert_kwargs,
         )
 
-        if isinstance(pcm_data, Iterator):
-            pcm_data = b"".join(pcm_data)
-
+    def _get_audio_from_pcm_data(self, pcm_data: bytes) -> Audio:
         pcm_data = np.frombuffer(
             pcm_data,
             # Little-endian, signed int, 2 bytes per int
             dtype="<i2",
         )
 
-        return get_audio_from_samples(pcm_data, self.sample_rate)
+        return get_audio_from_samples(pcm_data, self.sample_rate, lazy=self.lazy_audio)
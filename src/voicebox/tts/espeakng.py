@@ -1,11 +1,17 @@
+import asyncio
 import subprocess
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Union
+from io import BytesIO
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.ssml import SSML
 from voicebox.tts.tts import TTS
-from voicebox.tts.utils import get_audio_from_wav_file
+from voicebox.tts.utils import get_audio_from_wav_file, iter_audio_from_wav_file
 from voicebox.types import StrOrSSML
 
 
@@ -30,6 +36,9 @@ class ESpeakConfig:
     exe_path: str = "espeak-ng"
     timeout: float = None
 
+    stream_chunk_size: int = 1024
+    """Number of samples per chunk yielded by ``ESpeakNG.stream_speech()``."""
+
 
 @dataclass
 class ESpeakNG(TTS):
@@ -59,25 +68,72 @@ class ESpeakNG(TTS):
         finally:
             proc.wait(timeout=self.config.timeout)
 
-    def _get_proc(self, text: StrOrSSML):
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
         args = self._get_args(text)
 
         try:
-            proc = subprocess.Popen(
-                args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
             )
         except FileNotFoundError as e:
-            raise FileNotFoundError(
-                f"{e}; is espeak-ng installed? Try: sudo apt install espeak-ng"
+            raise _not_installed_error(e)
+
+        try:
+            wav_data, _ = await asyncio.wait_for(
+                proc.communicate(text.encode("utf-8")), self.config.timeout
+            )
+        except BaseException:
+            # Includes timeouts and cancellation
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+            raise
+
+        with BytesIO(wav_data) as wav_file:
+            return get_audio_from_wav_file(wav_file)
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        proc = self._get_proc(text)
+
+        try:
+            yield from iter_audio_from_wav_file(
+                proc.stdout, self.config.stream_chunk_size
             )
+        except BaseException:
+            # Stream was abandoned (GeneratorExit) or failed; don't wait for
+            # espeak-ng to finish writing
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            proc.wait(timeout=self.config.timeout)
+
+    def fingerprint(self) -> str:
+        # The args hold every setting that affects the audio. Subclasses run
+        # the same command, so they share the fingerprint.
+        return fingerprint(ESpeakNG.__qualname__, self._get_args(""))
+
+    def _get_proc(self, text: StrOrSSML):
+        proc = self._start_proc(self._get_args(text))
 
         proc.stdin.write(text.encode("utf-8"))
         proc.stdin.close()
 
         return proc
 
+    def _start_proc(self, args: List[str]) -> subprocess.Popen:
+        try:
+            return subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise _not_installed_error(e)
+
     def _get_args(self, text: StrOrSSML) -> List[str]:
         c = self.config
 
@@ -125,3 +181,169 @@ class ESpeakNG(TTS):
                 args.append("--punct")
 
         return args
+
+
+@dataclass
+class PrewarmedESpeakNG(ESpeakNG):
+    """
+    Like :class:`ESpeakNG`, but keeps ``espeak-ng`` processes started ahead
+    of time, waiting for text on stdin. Process startup and voice loading
+    then happen between utterances instead of during them, which reduces the
+    latency of each ``get_speech()`` call. The audio is identical to
+    :class:`ESpeakNG`, since the same command is run.
+
+    Each utterance consumes one process, and a new one is started to replace
+    it once the text has been sent, by a single background thread. Processes
+    started with an outdated config are discarded on the next utterance.
+    ``get_speech()``, ``get_speech_async()`` and ``stream_speech()`` all use
+    the waiting processes.
+
+    Call ``close()``, or use as a context manager, to stop the waiting
+    processes; they are also stopped when this instance is garbage collected.
+
+    Args:
+        config:
+            Optional configuration for the eSpeak NG engine.
+            If not given, a default config will be used.
+        pool_size:
+            Number of processes to keep waiting for each set of arguments.
+            More than 1 only helps if ``get_speech()`` is called from multiple
+            threads at once. Defaults to 1.
+    """
+
+    pool_size: int = 1
+
+    _procs: Dict[Tuple[str, ...], List[subprocess.Popen]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+    """Incremented by ``close()``, so that refills in progress are discarded."""
+
+    _refill_executor: Optional[ThreadPoolExecutor] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _refill_future: Optional[Future] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The last refill submitted; refills run one at a time, in order."""
+
+    def __post_init__(self):
+        self._finalizer = weakref.finalize(self, _kill_procs, self._procs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def warm_up(self, ssml: bool = False) -> None:
+        """
+        Starts the processes for the current config ahead of the first
+        utterance. Otherwise, they are started on the first utterance.
+        """
+
+        text = SSML("") if ssml else ""
+        self._refill(tuple(self._get_args(text)))
+
+    def close(self) -> None:
+        """Stops all waiting processes, and the refill thread."""
+
+        with self._lock:
+            self._generation += 1
+            _kill_procs(self._procs)
+            executor, self._refill_executor = self._refill_executor, None
+
+        if executor is not None:
+            # A refill in progress discards its process, so don't wait for it
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        """
+        Runs ``get_speech()`` in the event loop's default executor, so a
+        waiting process is used, unlike ``ESpeakNG.get_speech_async()``.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_speech, text)
+
+    def _get_proc(self, text: StrOrSSML):
+        args = tuple(self._get_args(text))
+
+        with self._lock:
+            self._discard_stale_procs(args)
+            procs = self._procs.get(args, [])
+            proc = procs.pop() if procs else None
+
+        if proc is None or proc.poll() is not None:
+            proc = self._start_proc(list(args))
+
+        proc.stdin.write(text.encode("utf-8"))
+        proc.stdin.close()
+
+        # The utterance is already being synthesized; don't make it wait
+        with self._lock:
+            if self._refill_executor is None:
+                self._refill_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=type(self).__name__
+                )
+
+            self._refill_future = self._refill_executor.submit(self._refill, args)
+
+        return proc
+
+    def _refill(self, args: Tuple[str, ...]) -> None:
+        """Starts processes until there are ``pool_size`` waiting for the args."""
+
+        while True:
+            with self._lock:
+                generation = self._generation
+                if len(self._procs.get(args, [])) >= self.pool_size:
+                    return
+
+            # Started without the lock, so utterances don't wait for it
+            proc = self._start_proc(list(args))
+
+            with self._lock:
+                procs = self._procs.get(args, [])
+                if generation != self._generation or len(procs) >= self.pool_size:
+                    # Closed, or filled by another thread, in the meantime
+                    _kill_proc(proc)
+                    return
+
+                self._procs[args] = procs + [proc]
+
+    def _discard_stale_procs(self, args: Tuple[str, ...]) -> None:
+        """Kills processes of other configs, but not of the SSML variant."""
+
+        config_args = _without_ssml_flag(args)
+
+        for other in list(self._procs):
+            if _without_ssml_flag(other) != config_args:
+                for proc in self._procs.pop(other):
+                    _kill_proc(proc)
+
+
+def _not_installed_error(e: FileNotFoundError) -> FileNotFoundError:
+    return FileNotFoundError(
+        f"{e}; is espeak-ng installed? Try: sudo apt install espeak-ng"
+    )
+
+
+def _without_ssml_flag(args: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(arg for arg in args if arg != "-m")
+
+
+def _kill_procs(procs: Dict[Tuple[str, ...], List[subprocess.Popen]]) -> None:
+    for proc_list in procs.values():
+        for proc in proc_list:
+            _kill_proc(proc)
+
+    procs.clear()
+
+
+def _kill_proc(proc: subprocess.Popen) -> None:
+    proc.kill()
+    proc.wait()
+    proc.stdin.close()
+    proc.stdout.close()
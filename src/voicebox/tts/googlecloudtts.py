@@ -11,6 +11,7 @@ from google.cloud.texttospeech import (
 )
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.ssml import SSML
 from voicebox.tts.tts import TTS
 from voicebox.tts.utils import get_audio_from_wav_file
@@ -38,7 +39,7 @@ class GoogleCloudTTS(TTS):
     timeout: float = gapic_v1.method.DEFAULT
 
     def get_speech(self, text: StrOrSSML) -> Audio:
-        self.audio_config.audio_encoding = AudioEncoding.LINEAR16
+        self._set_audio_encoding()
 
         input_ = (
             SynthesisInput(ssml=text)
@@ -55,3 +56,17 @@ class GoogleCloudTTS(TTS):
 
         with BytesIO(response.audio_content) as wav_file:
             return get_audio_from_wav_file(wav_file)
+
+    def fingerprint(self) -> str:
+        # Fingerprint the config used by get_speech(), without modifying it
+        audio_config = type(self.audio_config)(self.audio_config)
+        audio_config.audio_encoding = AudioEncoding.LINEAR16
+
+        return fingerprint(
+            type(self).__qualname__,
+            type(self.voice_params).serialize(self.voice_params),
+            type(audio_config).serialize(audio_config),
+        )
+
+    def _set_audio_encoding(self) -> None:
+        self.audio_config.audio_encoding = AudioEncoding.LINEAR16
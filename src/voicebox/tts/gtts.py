@@ -1,10 +1,15 @@
+import asyncio
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 from gtts import gTTS as gTTS_
 
+from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.ssml import SSML
 from voicebox.tts.tts import Mp3FileTTS
+from voicebox.tts.utils import get_audio_from_mp3
 from voicebox.types import KWArgs, StrOrSSML
 
 
@@ -15,6 +20,9 @@ class gTTS(Mp3FileTTS):
 
     Supports `SSML <https://www.w3.org/TR/speech-synthesis/>`_: ✘
 
+    The MP3 audio is decoded in memory; the temp file arguments are only
+    used by ``generate_speech_audio_file()``.
+
     Args:
         gtts_kwargs:
             These will be passed to the :class:`gtts.gTTS` constructor.
@@ -34,13 +42,30 @@ class gTTS(Mp3FileTTS):
         super().__init__(temp_file_dir, temp_file_prefix)
         self.gtts_kwargs = gtts_kwargs
 
+    def get_speech(self, text: StrOrSSML) -> Audio:
+        mp3_file = BytesIO()
+        self._get_gtts(text).write_to_fp(mp3_file)
+        mp3_file.seek(0)
+
+        return get_audio_from_mp3(mp3_file)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_speech, text)
+
+    def fingerprint(self) -> str:
+        return fingerprint(type(self).__qualname__, self.gtts_kwargs)
+
     def generate_speech_audio_file(
         self, text: StrOrSSML, audio_file_path: Path
     ) -> None:
-        if isinstance(text, SSML):
-            raise ValueError("gTTS does not support SSML.")
-
-        gtts = gTTS_(text, **self.gtts_kwargs)
+        gtts = self._get_gtts(text)
 
         with open(audio_file_path, "wb") as mp3_file:
             gtts.write_to_fp(mp3_file)
+
+    def _get_gtts(self, text: StrOrSSML) -> gTTS_:
+        if isinstance(text, SSML):
+            raise ValueError("gTTS does not support SSML.")
+
+        return gTTS_(text, **self.gtts_kwargs)
@@ -5,6 +5,7 @@ from parler_tts import ParlerTTSForConditionalGeneration
 from transformers import AutoTokenizer
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.tts import TTS
 from voicebox.types import StrOrSSML
 
@@ -109,5 +110,13 @@ class ParlerTTS(TTS):
 
         return Audio(signal, sample_rate)
 
+    def fingerprint(self) -> str:
+        return fingerprint(
+            type(self).__qualname__,
+            self.model.config._name_or_path,
+            str(self.model.dtype),
+            self.description,
+        )
+
     def _tokenize(self, text: str) -> torch.Tensor:
         return self.tokenizer(text, return_tensors="pt").input_ids.to(self.device)
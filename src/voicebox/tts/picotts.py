@@ -1,6 +1,9 @@
+import asyncio
 import subprocess
 from pathlib import Path
+from typing import List, Optional
 
+from voicebox.fingerprint import fingerprint
 from voicebox.ssml import SSML
 from voicebox.tts.tts import WavFileTTS
 from voicebox.types import StrOrSSML
@@ -15,6 +18,11 @@ class PicoTTS(WavFileTTS):
     - On Debian/Ubuntu: ``sudo apt install libttspico-utils``
 
     Supports `SSML <https://www.w3.org/TR/speech-synthesis/>`_: ✘
+
+    ``pico2wave`` can only write to a file. Pass
+    ``temp_file_dir=MEMORY_TEMP_FILE_DIR`` (or set ``VOICEBOX_TEMP_FILE_DIR``
+    to it) to keep that file in memory (``/dev/shm``) where available; see
+    ``AudioFileTTS`` for the ``temp_file_dir`` options.
     """
 
     pico2wave_path: str = "pico2wave"
@@ -24,7 +32,7 @@ class PicoTTS(WavFileTTS):
         self,
         pico2wave_path: str = "pico2wave",
         language: str = None,
-        temp_file_dir: str = None,
+        temp_file_dir: Optional[str] = None,
         temp_file_prefix: str = "voicebox-pico-tts-",
     ):
         super().__init__(
@@ -35,7 +43,38 @@ class PicoTTS(WavFileTTS):
         self.pico2wave_path = pico2wave_path
         self.language = language
 
+    def fingerprint(self) -> str:
+        return fingerprint(type(self).__qualname__, self.pico2wave_path, self.language)
+
     def generate_speech_audio_file(self, text: StrOrSSML, file_path: Path) -> None:
+        args = self._get_args(text, file_path)
+
+        try:
+            subprocess.run(args, check=True)
+        except FileNotFoundError as e:
+            raise _not_installed_error(e)
+
+    async def generate_speech_audio_file_async(
+        self, text: StrOrSSML, file_path: Path
+    ) -> None:
+        args = self._get_args(text, file_path)
+
+        try:
+            proc = await asyncio.create_subprocess_exec(*args)
+        except FileNotFoundError as e:
+            raise _not_installed_error(e)
+
+        try:
+            return_code = await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if return_code != 0:
+            raise subprocess.CalledProcessError(return_code, args)
+
+    def _get_args(self, text: StrOrSSML, file_path: Path) -> List[str]:
         if isinstance(text, SSML):
             raise ValueError("PicoTTS does not support SSML.")
 
@@ -50,9 +89,10 @@ class PicoTTS(WavFileTTS):
 
         args.append(text)
 
-        try:
-            subprocess.run(args, check=True)
-        except FileNotFoundError as e:
-            raise FileNotFoundError(
-                f"{e}; is PicoTTS installed? Try: sudo apt install libttspico-utils"
-            )
+        return args
+
+
+def _not_installed_error(e: FileNotFoundError) -> FileNotFoundError:
+    return FileNotFoundError(
+        f"{e}; is PicoTTS installed? Try: sudo apt install libttspico-utils"
+    )
@@ -3,6 +3,7 @@ from pathlib import Path
 import pyttsx3
 from pyttsx3 import Engine
 
+from voicebox.fingerprint import fingerprint
 from voicebox.tts.tts import WavFileTTS
 from voicebox.types import StrOrSSML
 
@@ -44,6 +45,15 @@ class Pyttsx3TTS(WavFileTTS):
 
         self.engine = engine if engine is not None else pyttsx3.init()
 
+    def fingerprint(self) -> str:
+        return fingerprint(
+            type(self).__qualname__,
+            # Voice IDs are specific to the driver, so this also identifies it
+            self.engine.getProperty("voice"),
+            self.engine.getProperty("rate"),
+            self.engine.getProperty("volume"),
+        )
+
     def generate_speech_audio_file(self, text: StrOrSSML, file_path: Path) -> None:
         self.engine.save_to_file(text, str(file_path))
         self.engine.runAndWait()
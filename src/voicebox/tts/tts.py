@@ -1,17 +1,36 @@
+import asyncio
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import chain
 from logging import Logger
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Sequence, Type, Tuple, Optional
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Type,
+    Tuple,
+    Optional,
+    TypeVar,
+)
 
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.tts.utils import get_audio_from_mp3, get_audio_from_wav_file
 from voicebox.types import StrOrSSML
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class TTS(ABC):
     """Base class for text-to-speech engines."""
@@ -24,9 +43,112 @@ class TTS(ABC):
         """Returns audio of the given text."""
         ...  # pragma: no cover
 
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        """
+        Returns audio of the given text, without blocking the event loop.
+
+        By default, this runs ``get_speech()`` in the event loop's default
+        executor, which ties up a thread for the whole call; TTS engines that
+        can wait for the audio without blocking (e.g. using async HTTP clients
+        or asyncio subprocesses) override this.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_speech, text)
+
+    def get_speech_batch(self, texts: Iterable[StrOrSSML]) -> List[Audio]:
+        """
+        Returns audio of each of the given texts, in the same order.
+
+        By default, this calls ``get_speech()`` for one text at a time;
+        TTS engines that can generate multiple texts more efficiently
+        override this. See :class:`PooledTTS` to generate them concurrently.
+        """
+
+        return [self.get_speech(text) for text in texts]
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        """
+        Yields audio of the given text in consecutive chunks, as it is generated,
+        so the first chunk can be used before the rest of the audio is ready.
+
+        By default, this just yields the audio from ``get_speech()``;
+        TTS engines that generate audio incrementally override this.
+        """
+
+        yield self.get_speech(text)
+
+    def fingerprint(self) -> str:
+        """
+        Returns a deterministic fingerprint of the settings that affect the
+        audio generated by this TTS (see :mod:`voicebox.fingerprint`).
+
+        The fingerprint changes whenever such a setting changes, so it can be
+        part of cache keys; see :func:`voicebox.tts.cache.fingerprint_key`.
+
+        Raises:
+            NotImplementedError:
+                If the TTS does not support fingerprinting.
+        """
+
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement fingerprint()."
+        )
+
+
+MEMORY_TEMP_FILE_DIR = ":memory:"
+"""
+Value of ``AudioFileTTS.temp_file_dir`` to keep temp audio files in a
+memory-backed filesystem (``/dev/shm``), if there is one.
+"""
+
+TEMP_FILE_DIR_ENV_VAR = "VOICEBOX_TEMP_FILE_DIR"
+"""
+Environment variable with the directory to use for temp audio files when an
+``AudioFileTTS`` is not given a ``temp_file_dir``. May be
+``MEMORY_TEMP_FILE_DIR``.
+"""
+
+_SHM_DIR = "/dev/shm"
+
+
+def resolve_temp_file_dir(temp_file_dir: Optional[str]) -> Optional[str]:
+    """
+    Returns the directory to create temp audio files in, given an
+    ``AudioFileTTS.temp_file_dir`` value:
+
+    - ``None``: The ``VOICEBOX_TEMP_FILE_DIR`` environment variable, if set
+      (resolved like ``temp_file_dir``), otherwise ``None``, meaning the
+      default temp directory of :mod:`tempfile`.
+    - ``MEMORY_TEMP_FILE_DIR``: ``/dev/shm`` if it is a writable directory,
+      otherwise ``None``.
+    - Anything else is returned as is.
+    """
+
+    if temp_file_dir is None:
+        temp_file_dir = os.environ.get(TEMP_FILE_DIR_ENV_VAR) or None
+
+    if temp_file_dir == MEMORY_TEMP_FILE_DIR:
+        is_usable = os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK)
+        return _SHM_DIR if is_usable else None
+
+    return temp_file_dir
+
 
 class AudioFileTTS(TTS, ABC):
-    """Base class for text-to-speech engines that generate audio files."""
+    """
+    Base class for text-to-speech engines that generate audio files.
+
+    Args:
+        temp_file_dir:
+            The directory to write temp audio files to. If ``None``, uses
+            the ``VOICEBOX_TEMP_FILE_DIR`` environment variable, or the
+            default temp directory. Use ``MEMORY_TEMP_FILE_DIR`` to avoid
+            disk I/O by writing to ``/dev/shm``, where available.
+            See ``resolve_temp_file_dir()``.
+        temp_file_prefix:
+            The prefix of the temp audio file names.
+    """
 
     temp_file_dir: Optional[str]
     temp_file_prefix: str
@@ -40,15 +162,52 @@ class AudioFileTTS(TTS, ABC):
         self.temp_file_prefix = temp_file_prefix
 
     def get_speech(self, text: StrOrSSML) -> Audio:
+        with self.temp_audio_file() as audio_file_path:
+            self.generate_speech_audio_file(text, audio_file_path)
+            return self.get_audio_from_file(audio_file_path)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        """
+        Generates the audio file with ``generate_speech_audio_file_async()``,
+        and does the temp file handling and decoding in the event loop's
+        default executor.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        temp_audio_file = self.temp_audio_file()
+        audio_file_path = await loop.run_in_executor(None, temp_audio_file.__enter__)
+        try:
+            await self.generate_speech_audio_file_async(text, audio_file_path)
+            return await loop.run_in_executor(
+                None, self.get_audio_from_file, audio_file_path
+            )
+        finally:
+            # Only deletes the file; exceptions still propagate from here
+            await loop.run_in_executor(None, temp_audio_file.__exit__, None, None, None)
+
+    @contextmanager
+    def temp_audio_file(self) -> Iterator[Path]:
+        """
+        Yields the path of a new, empty temp file for the generated audio,
+        and deletes the file afterward.
+
+        Override this to change where temp audio files are stored.
+        """
+
         with NamedTemporaryFile(
             prefix=self.temp_file_prefix,
             suffix="." + self.get_audio_file_type(),
-            dir=self.temp_file_dir,
+            dir=resolve_temp_file_dir(self.temp_file_dir),
+            delete=False,
         ) as audio_file:
-            audio_file.close()
-            audio_file_path = Path(audio_file.name)
-            self.generate_speech_audio_file(text, audio_file_path)
-            return self.get_audio_from_file(audio_file_path)
+            pass
+
+        audio_file_path = Path(audio_file.name)
+        try:
+            yield audio_file_path
+        finally:
+            audio_file_path.unlink(missing_ok=True)
 
     @abstractmethod
     def get_audio_file_type(self) -> str:
@@ -62,6 +221,20 @@ class AudioFileTTS(TTS, ABC):
         """Generates a speech audio file from the given text."""
         ...  # pragma: no cover
 
+    async def generate_speech_audio_file_async(
+        self, text: StrOrSSML, audio_file_path: Path
+    ) -> None:
+        """
+        Generates a speech audio file from the given text, without blocking
+        the event loop. By default, runs ``generate_speech_audio_file()`` in
+        the event loop's default executor.
+        """
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self.generate_speech_audio_file, text, audio_file_path
+        )
+
     @abstractmethod
     def get_audio_from_file(self, file_path: Path) -> Audio:
         """Returns an Audio instance from the given file path."""
@@ -110,19 +283,54 @@ class FallbackTTS(TTS):
     log: Logger = log
 
     def get_speech(self, text: StrOrSSML) -> Audio:
+        return self._call_with_fallback(lambda tts: tts.get_speech(text))
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
         for i, tts in enumerate(self.ttss):
             try:
-                return tts.get_speech(text)
+                return await tts.get_speech_async(text)
             except BaseException as e:
-                self.handle_exception(e, tts, i)
+                if not self._handle_fallback_exception(e, tts, i):
+                    raise
 
-                is_last = i + 1 >= len(self.ttss)
-                should_catch = isinstance(e, self.exceptions_to_catch)
-                if is_last or not should_catch:
+        raise ValueError("self.ttss is empty")
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        """
+        Falls back to the next TTS only if a TTS fails before yielding its
+        first chunk; exceptions raised after that are not caught.
+        """
+
+        yield from self._call_with_fallback(
+            lambda tts: _start_stream(tts.stream_speech(text))
+        )
+
+    def fingerprint(self) -> str:
+        return fingerprint(
+            type(self).__qualname__, [tts.fingerprint() for tts in self.ttss]
+        )
+
+    def _call_with_fallback(self, func: Callable[[TTS], T]) -> T:
+        for i, tts in enumerate(self.ttss):
+            try:
+                return func(tts)
+            except BaseException as e:
+                if not self._handle_fallback_exception(e, tts, i):
                     raise
 
         raise ValueError("self.ttss is empty")
 
+    def _handle_fallback_exception(
+        self, e: BaseException, tts: TTS, tts_index: int
+    ) -> bool:
+        """Handles the exception, and returns whether to try the next TTS."""
+
+        self.handle_exception(e, tts, tts_index)
+
+        is_last = tts_index + 1 >= len(self.ttss)
+        should_catch = isinstance(e, self.exceptions_to_catch)
+        return not is_last and should_catch
+
     def handle_exception(self, e: BaseException, tts: TTS, tts_index: int) -> None:
         message = f"Exception occurred calling TTS={tts} (index {tts_index})"
         self.log.exception(message, exc_info=e)
@@ -154,21 +362,159 @@ class RetryTTS(TTS):
     log: Logger = log
 
     def get_speech(self, text: StrOrSSML) -> Audio:
+        return self._call_with_retry(lambda: self.tts.get_speech(text))
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
         for attempt in range(1, self.max_attempts + 1):
             try:
-                return self.tts.get_speech(text)
+                return await self.tts.get_speech_async(text)
             except BaseException as e:
-                self.handle_exception(e, attempt)
+                if not self._handle_retry_exception(e, attempt):
+                    raise
+
+        raise self._no_attempts_error()
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        """
+        Retries only if the TTS fails before yielding its first chunk;
+        exceptions raised after that are not caught.
+        """
 
-                is_last_attempt = attempt >= self.max_attempts
-                should_catch = isinstance(e, self.exceptions_to_catch)
-                if is_last_attempt or not should_catch:
+        yield from self._call_with_retry(
+            lambda: _start_stream(self.tts.stream_speech(text))
+        )
+
+    def fingerprint(self) -> str:
+        return self.tts.fingerprint()
+
+    def _call_with_retry(self, func: Callable[[], T]) -> T:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return func()
+            except BaseException as e:
+                if not self._handle_retry_exception(e, attempt):
                     raise
 
-        raise ValueError(
+        raise self._no_attempts_error()
+
+    def _handle_retry_exception(self, e: BaseException, attempt: int) -> bool:
+        """Handles the exception, and returns whether to try again."""
+
+        self.handle_exception(e, attempt)
+
+        is_last_attempt = attempt >= self.max_attempts
+        should_catch = isinstance(e, self.exceptions_to_catch)
+        return not is_last_attempt and should_catch
+
+    def _no_attempts_error(self) -> ValueError:
+        return ValueError(
             f"self.max_attempts must be > 0; " f"max_attempts={self.max_attempts}"
         )
 
     def handle_exception(self, e: BaseException, attempt: int) -> None:
         message = f"TTS attempt {attempt}/{self.max_attempts} failed"
         self.log.exception(message, exc_info=e)
+
+
+@dataclass
+class PooledTTS(TTS):
+    """
+    Generates batches of texts concurrently, by calling the wrapped TTS from
+    a pool of worker threads.
+
+    Useful for rendering many texts offline with TTS engines that spend their
+    time waiting on something other than Python code, e.g. a subprocess
+    (``ESpeakNG``, ``PicoTTS``) or a web API; the threads just wait for them.
+
+    Calls other than ``get_speech_batch()`` go straight to the wrapped TTS.
+
+    Args:
+        tts:
+            The TTS to call. It must be safe to call from multiple threads
+            at once; e.g. wrap ``CachedTTS`` with ``thread_safe=True``.
+        max_workers:
+            The maximum number of texts to generate at once.
+            Defaults to the number of CPUs.
+    """
+
+    tts: TTS
+    max_workers: Optional[int] = None
+
+    _executor: Optional[ThreadPoolExecutor] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _executor_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __enter__(self) -> "PooledTTS":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker threads, if they were started."""
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+    def get_speech(self, text: StrOrSSML) -> Audio:
+        return self.tts.get_speech(text)
+
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        return await self.tts.get_speech_async(text)
+
+    def get_speech_batch(self, texts: Iterable[StrOrSSML]) -> List[Audio]:
+        """
+        Returns audio of each of the given texts, in the same order,
+        generating up to ``max_workers`` of them at once.
+
+        If generating any text fails, the texts that have not been started
+        yet are cancelled, and the first exception (in text order) is raised.
+        """
+
+        executor = self._get_executor()
+        futures = [executor.submit(self.tts.get_speech, text) for text in texts]
+
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def stream_speech(self, text: StrOrSSML) -> Iterator[Audio]:
+        return self.tts.stream_speech(text)
+
+    def fingerprint(self) -> str:
+        return self.tts.fingerprint()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers or os.cpu_count() or 1,
+                    thread_name_prefix=type(self).__name__,
+                )
+
+            return self._executor
+
+
+def _start_stream(stream: Iterable[Audio]) -> Iterator[Audio]:
+    """
+    Gets the first chunk of the stream right away, so any exception raised
+    while starting the stream is raised here instead of when iterating.
+    """
+
+    stream = iter(stream)
+
+    try:
+        first = next(stream)
+    except StopIteration:
+        return iter(())
+
+    return chain([first], stream)
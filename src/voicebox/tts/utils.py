@@ -1,11 +1,12 @@
 import wave
 from pathlib import Path
-from typing import TypeVar, Iterable, Optional, Tuple
+from typing import TypeVar, Iterable, Iterator, Optional, Tuple, Union
 
 import audioread
 import numpy as np
+from pedalboard.io import AudioFile
 
-from voicebox.audio import Audio
+from voicebox.audio import Audio, PcmAudio, pcm_to_float32
 from voicebox.types import FileOrPath
 
 K = TypeVar("K")
@@ -24,17 +25,77 @@ sample_width_to_dtype = {
 }
 
 
-def get_audio_from_mp3(file) -> Audio:
-    """Returns an :class:`Audio` instance from an MP3 file."""
+def get_audio_from_mp3(file: FileOrPath) -> Audio:
+    """
+    Returns an :class:`Audio` instance from an MP3 file.
+
+    The MP3 is decoded in-process by pedalboard, straight into a float32
+    array. If pedalboard cannot decode a file path, this falls back to
+    audioread, which uses e.g. an ffmpeg subprocess or GStreamer.
+
+    Args:
+        file:
+            The path of the MP3 file, or a binary file object (e.g.
+            :class:`io.BytesIO`) to decode the MP3 from, without writing
+            it to disk.
+    """
+
+    try:
+        return get_audio_from_mp3_pedalboard(file)
+    except ValueError:
+        if not isinstance(file, (str, Path)):
+            raise
+
+    return get_audio_from_mp3_audioread(file)
+
+
+def get_audio_from_mp3_pedalboard(file: FileOrPath) -> Audio:
+    """
+    Returns an :class:`Audio` instance from an MP3 file, decoded by pedalboard.
+    Multiple channels are mixed down to mono.
+
+    Raises:
+        ValueError:
+            If pedalboard cannot decode the file.
+    """
+
+    if isinstance(file, Path):
+        file = str(file)
 
-    with audioread.audio_open(file) as f:
+    with AudioFile(file) as f:
         sample_rate = f.samplerate
+        signal = f.read(f.frames)
+
+    # Mix channels down to mono
+    signal = signal[0] if len(signal) == 1 else signal.mean(axis=0)
+
+    return Audio(signal.astype(np.float32, copy=False), round(sample_rate))
+
+
+def get_audio_from_mp3_audioread(path: Union[str, Path]) -> Audio:
+    """
+    Returns an :class:`Audio` instance from an MP3 file, decoded by audioread.
+    Multiple channels are mixed down to mono.
+    """
+
+    with audioread.audio_open(path) as f:
+        sample_rate = f.samplerate
+        channels = f.channels
         samples = np.frombuffer(b"".join(f.read_data()), dtype=np.int16)
 
-    return get_audio_from_samples(samples, sample_rate)
+    audio = get_audio_from_samples(samples, sample_rate)
+    if channels > 1:
+        audio.signal = audio.signal.reshape(-1, channels).mean(axis=1)
+
+    return audio
 
 
-def get_audio_from_samples(samples: np.ndarray, sample_rate: int) -> Audio:
+def get_audio_from_samples(
+    samples: np.ndarray,
+    sample_rate: int,
+    out: np.ndarray = None,
+    lazy: bool = False,
+) -> Audio:
     """
     Takes raw int-typed samples and a sample rate, and returns an
     :class:`Audio` instance with ``signal`` properly scaled to range
@@ -46,20 +107,32 @@ def get_audio_from_samples(samples: np.ndarray, sample_rate: int) -> Audio:
             dtype must be int8, int16, or int32.
         sample_rate:
             The sample rate of the samples in Hz.
+        out:
+            (Optional) A float32 array of the same shape as ``samples`` to
+            write the signal to, e.g. to reuse a buffer.
+        lazy:
+            If ``True``, returns a :class:`PcmAudio` that keeps the samples
+            as they are, and only converts them when the signal is used.
+            ``out`` is ignored. Defaults to ``False``.
     """
 
-    bytes_per_sample = dtype_to_sample_width[samples.dtype]
-    max_value = 2 ** (8 * bytes_per_sample - 1)
+    if samples.dtype not in dtype_to_sample_width:
+        raise ValueError(
+            f"Unsupported samples dtype {samples.dtype}; "
+            f"must be one of: {', '.join(map(str, dtype_to_sample_width))}"
+        )
 
-    # Scale to [-1, 1)
-    signal = samples.astype(float) / max_value
-    signal = signal.astype(np.float32)
+    if lazy:
+        return PcmAudio(samples, sample_rate)
 
-    return Audio(signal, sample_rate)
+    return Audio(pcm_to_float32(samples, out=out), sample_rate)
 
 
-def get_audio_from_wav_file(file_or_path: FileOrPath) -> Audio:
-    """Returns an :class:`Audio` instance from a WAV file."""
+def get_audio_from_wav_file(file_or_path: FileOrPath, lazy: bool = False) -> Audio:
+    """
+    Returns an :class:`Audio` instance from a WAV file. With ``lazy=True``,
+    it is a :class:`PcmAudio`; see ``get_audio_from_samples()``.
+    """
 
     if isinstance(file_or_path, Path):
         file_or_path = str(file_or_path)
@@ -72,7 +145,70 @@ def get_audio_from_wav_file(file_or_path: FileOrPath) -> Audio:
     dtype = sample_width_to_dtype[bytes_per_sample]
     samples = np.frombuffer(sample_bytes, dtype=dtype)
 
-    return get_audio_from_samples(samples, sample_rate)
+    return get_audio_from_samples(samples, sample_rate, lazy=lazy)
+
+
+def iter_audio_from_wav_file(
+    file_or_path: FileOrPath, chunk_size: int
+) -> Iterator[Audio]:
+    """
+    Yields :class:`Audio` instances of up to ``chunk_size`` samples each
+    from a WAV file, as they are read. Works with pipes.
+    """
+
+    if isinstance(file_or_path, Path):
+        file_or_path = str(file_or_path)
+
+    with wave.open(file_or_path, "rb") as wav_file:
+        bytes_per_sample = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        dtype = sample_width_to_dtype[bytes_per_sample]
+
+        while True:
+            sample_bytes = wav_file.readframes(chunk_size)
+
+            # Drop any partial sample at the end of a truncated file
+            sample_bytes = sample_bytes[
+                : len(sample_bytes) // bytes_per_sample * bytes_per_sample
+            ]
+            if not sample_bytes:
+                break
+
+            samples = np.frombuffer(sample_bytes, dtype=dtype)
+            yield get_audio_from_samples(samples, sample_rate)
+
+
+def iter_audio_from_pcm_chunks(
+    chunks: Iterable[bytes],
+    sample_rate: int,
+    dtype="<i2",
+) -> Iterator[Audio]:
+    """
+    Yields an :class:`Audio` instance for each chunk of raw PCM bytes.
+
+    Chunks do not need to contain whole samples; bytes of a partial sample
+    at the end of a chunk are carried over to the next chunk.
+
+    Args:
+        chunks:
+            Chunks of raw PCM bytes.
+        sample_rate:
+            The sample rate of the samples in Hz.
+        dtype:
+            The sample type. Defaults to little-endian, signed int, 2 bytes per int.
+    """
+
+    sample_width = np.dtype(dtype).itemsize
+    leftover = b""
+
+    for chunk in chunks:
+        chunk = leftover + chunk
+        end = len(chunk) // sample_width * sample_width
+        chunk, leftover = chunk[:end], chunk[end:]
+
+        if chunk:
+            samples = np.frombuffer(chunk, dtype=dtype)
+            yield get_audio_from_samples(samples, sample_rate)
 
 
 def add_optional_items(d: dict, items: Iterable[Tuple[K, Optional[V]]]) -> dict:
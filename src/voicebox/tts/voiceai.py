@@ -1,9 +1,15 @@
 from io import BytesIO
-from typing import Any
+from typing import Any, Tuple
 
 import requests
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from voicebox.audio import Audio
+from voicebox.fingerprint import fingerprint
 from voicebox.tts import TTS
 from voicebox.tts.utils import add_optional_items, get_audio_from_wav_file
 from voicebox.types import StrOrSSML
@@ -41,6 +47,17 @@ class VoiceAiTTS(TTS):
             (Optional) Extra headers to add to the request.
         request_kwargs:
             (Optional) Extra kwargs to pass to the ``requests.post()`` call.
+            ``get_speech_async()`` passes the same kwargs to ``httpx``,
+            translated where the names differ (e.g. ``allow_redirects``,
+            ``proxies``). Like ``requests``, there is no timeout by default.
+        async_client:
+            (Optional) ``httpx.AsyncClient`` used by ``get_speech_async()``.
+            Share one client between calls to reuse connections. If not given,
+            a new client is used for each call. Client settings in
+            ``request_kwargs`` (``verify``, ``cert`` and ``proxies``) only
+            apply to those new clients; configure a given client directly.
+            If ``httpx`` is not installed, ``get_speech_async()`` runs
+            ``get_speech()`` in an executor.
     """
 
     def __init__(
@@ -55,6 +72,7 @@ class VoiceAiTTS(TTS):
         extra_json: dict[str, Any] = None,
         extra_headers: dict[str, str] = None,
         request_kwargs: dict[str, Any] = None,
+        async_client: "httpx.AsyncClient" = None,
     ):
         self.api_key = api_key
 
@@ -67,6 +85,7 @@ class VoiceAiTTS(TTS):
         self.extra_json = extra_json or {}
         self.extra_headers = extra_headers or {}
         self.request_kwargs = request_kwargs or {}
+        self.async_client = async_client
 
     def get_speech(self, text: StrOrSSML) -> Audio:
         response = requests.post(
@@ -81,6 +100,39 @@ class VoiceAiTTS(TTS):
         with BytesIO(response.content) as wav_file:
             return get_audio_from_wav_file(wav_file)
 
+    async def get_speech_async(self, text: StrOrSSML) -> Audio:
+        if httpx is None:
+            return await super().get_speech_async(text)
+
+        client_kwargs, post_kwargs = _get_httpx_kwargs(self.request_kwargs)
+
+        if self.async_client is not None:
+            response = await self._post_async(self.async_client, text, post_kwargs)
+        else:
+            async with httpx.AsyncClient(**client_kwargs) as client:
+                response = await self._post_async(client, text, post_kwargs)
+
+        response.raise_for_status()
+
+        with BytesIO(response.content) as wav_file:
+            return get_audio_from_wav_file(wav_file)
+
+    async def _post_async(
+        self,
+        client: "httpx.AsyncClient",
+        text: StrOrSSML,
+        post_kwargs: dict[str, Any],
+    ) -> "httpx.Response":
+        return await client.post(
+            self.api_url,
+            headers=self._build_headers(),
+            json=self._build_json(text),
+            **post_kwargs,
+        )
+
+    def fingerprint(self) -> str:
+        return fingerprint(type(self).__qualname__, self.api_url, self._build_json(""))
+
     def _build_headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self.api_key}",
@@ -108,3 +160,53 @@ class VoiceAiTTS(TTS):
         json.update(self.extra_json)
 
         return json
+
+
+_HTTPX_CLIENT_KWARGS = ("verify", "cert")
+
+
+def _get_httpx_kwargs(
+    request_kwargs: dict[str, Any],
+) -> Tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Translates kwargs for ``requests.post()`` into kwargs for
+    ``httpx.AsyncClient()`` and for its ``post()``, with the same defaults as
+    ``requests``: no timeout, and following redirects.
+    """
+
+    post_kwargs = dict(request_kwargs)
+    post_kwargs.pop("stream", None)
+
+    client_kwargs = {
+        name: post_kwargs.pop(name)
+        for name in _HTTPX_CLIENT_KWARGS
+        if name in post_kwargs
+    }
+
+    proxies = post_kwargs.pop("proxies", None)
+    if proxies:
+        client_kwargs["mounts"] = {
+            _get_proxy_pattern(scheme): httpx.AsyncHTTPTransport(proxy=url)
+            for scheme, url in proxies.items()
+        }
+
+    post_kwargs["follow_redirects"] = post_kwargs.pop("allow_redirects", True)
+
+    timeout = post_kwargs.get("timeout")
+    if isinstance(timeout, tuple):
+        # (connect, read) timeouts
+        connect, read = timeout
+        post_kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+    else:
+        post_kwargs["timeout"] = timeout
+
+    return client_kwargs, post_kwargs
+
+
+def _get_proxy_pattern(scheme: str) -> str:
+    """Converts a ``requests`` proxy key, e.g. ``"https"``, to an ``httpx`` one."""
+
+    if "://" in scheme:
+        return scheme
+
+    return "all://" if scheme == "all" else f"{scheme}://"
@@ -1,3 +1,4 @@
 from voicebox.voiceboxes.base import *
+from voicebox.voiceboxes.cache import *
 from voicebox.voiceboxes.parallel import *
 from voicebox.voiceboxes.simple import *
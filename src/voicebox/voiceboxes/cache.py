@@ -0,0 +1,137 @@
+__all__ = ["EffectsCache"]
+
+from dataclasses import dataclass, field
+from typing import Hashable, Literal, MutableMapping, Optional, Type, Union
+
+from cachetools import Cache, LRUCache
+
+from voicebox.audio import Audio
+from voicebox.effects import Effects, SeriesChain
+from voicebox.tts import TTS
+from voicebox.tts.cache import (
+    CacheStats,
+    KeyFunc,
+    Size,
+    SizeFunc,
+    build_cache,
+    text_key,
+)
+from voicebox.types import StrOrSSML
+
+
+@dataclass
+class EffectsCache:
+    """
+    Caches audio after the effects have been applied, so repeated messages
+    skip both the TTS and the effects. Used by passing it as the
+    ``effects_cache`` of a voicebox.
+
+    Audio is keyed by the fingerprint of the effects (see
+    ``Effect.fingerprint()``) and the key returned by ``key_func``.
+    Effects that are not deterministic (see ``Effect.is_deterministic``), or
+    that cannot be fingerprinted, bypass the cache.
+
+    Args:
+        cache:
+            The cache mapping keys to processed ``Audio`` instances.
+        key_func:
+            Returns the TTS part of the cache key. Defaults to
+            :func:`voicebox.tts.cache.text_key`, which keys by text only;
+            use :func:`voicebox.tts.cache.fingerprint_key` to also include
+            the TTS settings.
+
+    Attributes:
+        stats:
+            Hit and miss counts. Bypassed requests are not counted.
+    """
+
+    cache: MutableMapping
+    key_func: KeyFunc = text_key
+
+    stats: CacheStats = field(default_factory=CacheStats, init=False)
+
+    @classmethod
+    def build(
+        cls,
+        max_size: Size = 60,
+        size_func: Union[Literal["bytes", "count", "seconds"], SizeFunc] = "seconds",
+        cache_class: Type[Cache] = LRUCache,
+        key_func: KeyFunc = text_key,
+    ) -> "EffectsCache":
+        """
+        Constructs an in-memory cache that by default will keep the most
+        recently used 60 seconds of audio. See ``CachedTTS.build()`` for the
+        arguments.
+        """
+
+        return cls(build_cache(max_size, size_func, cache_class), key_func=key_func)
+
+    def get_key(
+        self, tts: TTS, effects: Effects, text: StrOrSSML, streaming: bool = False
+    ) -> Optional[Hashable]:
+        """
+        Returns the cache key of the audio, or ``None`` if the audio must not
+        be cached.
+
+        Set ``streaming`` for audio streamed through the effects block by block
+        (see ``Effect.process_block()``). It is keyed apart from audio processed
+        whole, since some effects stream a different output, e.g. ``Normalize``
+        with running statistics.
+        """
+
+        effects_chain = SeriesChain(*effects)
+        if not effects_chain.is_deterministic:
+            return None
+
+        try:
+            effects_fingerprint = effects_chain.fingerprint()
+        except TypeError:
+            return None
+
+        if streaming:
+            return effects_fingerprint, self.key_func(tts, text), "streaming"
+
+        return effects_fingerprint, self.key_func(tts, text)
+
+    def get(self, key: Hashable) -> Optional[Audio]:
+        """Returns the cached audio, or ``None`` if it is not cached."""
+
+        try:
+            audio = self.cache[key]
+        except KeyError:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return audio
+
+    def put(self, key: Hashable, audio: Audio) -> None:
+        """Caches the audio, unless it is too large for the cache."""
+
+        try:
+            self.cache[key] = audio
+        except ValueError as e:
+            if str(e) != "value too large":
+                raise
+
+    def get_speech_with_effects(
+        self, tts: TTS, effects: Effects, text: StrOrSSML
+    ) -> Audio:
+        """
+        Returns the cached audio if there is any. Otherwise, gets the speech
+        from the TTS, applies the effects, and caches the result.
+        """
+
+        key = self.get_key(tts, effects, text)
+
+        if key is not None:
+            audio = self.get(key)
+            if audio is not None:
+                return audio
+
+        audio = SeriesChain(*effects, inplace=True)(tts.get_speech(text))
+
+        if key is not None:
+            self.put(key, audio)
+
+        return audio
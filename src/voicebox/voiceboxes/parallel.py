@@ -2,15 +2,19 @@ __all__ = ["ParallelVoicebox"]
 
 from abc import abstractmethod
 from queue import Empty
-from threading import Thread, Event
-from typing import TypeVar, Iterable
+from threading import Thread, Event, current_thread
+from typing import Hashable, Iterator, TypeVar, Iterable, Optional, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
 
 from voicebox.audio import Audio
-from voicebox.effects import Effects, default_effects
+from voicebox.effects import ConvertDtype, Effects, SeriesChain, default_effects
 from voicebox.sinks import Sink, default_sink
 from voicebox.tts import TTS, default_tts
 from voicebox.types import StrOrSSML
 from voicebox.voiceboxes.base import VoiceboxWithTextSplitter
+from voicebox.voiceboxes.cache import EffectsCache
 from voicebox.voiceboxes.queue import Queue
 from voicebox.voiceboxes.splitter import Splitter
 
@@ -73,6 +77,49 @@ class _QueueThread(Thread):
     def _process_item(self, item: T) -> None: ...  # pragma: no cover
 
 
+class _AudioBlockStream:
+    """
+    Stream of audio blocks passed between threads; iterating blocks until
+    the producer calls ``close()``, which it must do in a ``finally`` block.
+    Iteration also ends if the thread that created the stream (the producer)
+    dies without closing it, so the consumer can never hang.
+    """
+
+    get_timeout: float
+
+    _queue: Queue
+    _producer: Thread
+
+    def __init__(self, get_timeout: float = 1.0):
+        self.get_timeout = get_timeout
+        self._queue = Queue()
+        self._producer = current_thread()
+
+    def put(self, block: Audio) -> None:
+        self._queue.put(block)
+
+    def close(self) -> None:
+        self._queue.put(None)
+
+    def __iter__(self) -> Iterator[Audio]:
+        while (block := self._get()) is not None:
+            yield block
+
+    def _get(self) -> Optional[Audio]:
+        while True:
+            try:
+                return self._queue.get(timeout=self.get_timeout)
+            except Empty:
+                if self._producer.is_alive():
+                    continue
+
+            # The producer may have put blocks just before dying
+            try:
+                return self._queue.get_nowait()
+            except Empty:
+                return None
+
+
 class _SinkQueueThread(_QueueThread):
     sink: Sink
 
@@ -80,8 +127,11 @@ class _SinkQueueThread(_QueueThread):
         self.sink = sink
         super().__init__(**kwargs)
 
-    def _process_item(self, audio: Audio) -> None:
-        self.sink.play(audio)
+    def _process_item(self, audio: Union[Audio, _AudioBlockStream]) -> None:
+        if isinstance(audio, _AudioBlockStream):
+            self.sink.play_stream(audio)
+        else:
+            self.sink.play(audio)
 
 
 class _TTSAndEffectsQueueThread(_QueueThread):
@@ -89,26 +139,88 @@ class _TTSAndEffectsQueueThread(_QueueThread):
     effects: Effects
     sink_queue_thread: _SinkQueueThread
 
+    streaming: bool
+    effects_cache: Optional[EffectsCache]
+    dtype: Optional[DTypeLike]
+
     def __init__(
         self,
         tts: TTS,
         effects: Effects,
         sink_queue_thread: _SinkQueueThread,
+        streaming: bool = False,
+        effects_cache: EffectsCache = None,
+        dtype: DTypeLike = None,
         **kwargs,
     ):
         self.tts = tts
         self.effects = effects
         self.sink_queue_thread = sink_queue_thread
+        self.streaming = streaming
+        self.effects_cache = effects_cache
+        self.dtype = dtype
         super().__init__(**kwargs)
 
     def _process_item(self, text: StrOrSSML) -> None:
+        effects = [ConvertDtype(self.dtype), *self.effects]
+
+        effects_chain = SeriesChain(*effects)
+        streaming = self.streaming and effects_chain.supports_streaming
+
+        cache_key = None
+        if self.effects_cache is not None:
+            cache_key = self.effects_cache.get_key(
+                self.tts, effects, text, streaming=streaming
+            )
+
+        if cache_key is not None:
+            audio = self.effects_cache.get(cache_key)
+            if audio is not None:
+                self.sink_queue_thread.put(audio)
+                return
+
+        if streaming:
+            self._stream_item(text, effects_chain, cache_key)
+            return
+
         audio = self.tts.get_speech(text)
 
-        for effect in self.effects:
-            audio = effect.apply(audio)
+        audio = SeriesChain(*effects, inplace=True).apply(audio)
+
+        if cache_key is not None:
+            self.effects_cache.put(cache_key, audio)
 
         self.sink_queue_thread.put(audio)
 
+    def _stream_item(
+        self,
+        text: StrOrSSML,
+        effects_chain: SeriesChain,
+        cache_key: Optional[Hashable] = None,
+    ) -> None:
+        # Hand the stream to the sink before the first block is ready,
+        # so the sink can start playing as soon as it is
+        blocks = _AudioBlockStream(self.queue_get_timeout)
+        self.sink_queue_thread.put(blocks)
+
+        signals = []
+        sample_rate = None
+        try:
+            audio_stream = self.tts.stream_speech(text)
+            for block in effects_chain.process_stream(audio_stream):
+                if cache_key is not None:
+                    # Copy, since the sink may modify the block it is given
+                    signals.append(block.signal.copy())
+                    sample_rate = block.sample_rate
+
+                blocks.put(block)
+        finally:
+            blocks.close()
+
+        if signals:
+            audio = Audio(np.concatenate(signals), sample_rate)
+            self.effects_cache.put(cache_key, audio)
+
 
 class ParallelVoicebox(VoiceboxWithTextSplitter):
     """
@@ -148,6 +260,25 @@ class ParallelVoicebox(VoiceboxWithTextSplitter):
             between checks of the stop flag.
         daemon:
             Whether the thread is daemonic (i.e. dies when the main thread exits).
+        streaming:
+            If ``True``, audio blocks flow from ``TTS.stream_speech()`` through
+            the effects (see ``Effect.process_block()``) to
+            ``Sink.play_stream()`` as they are generated, so speech starts
+            playing before the whole text chunk has been synthesized.
+            Falls back to processing whole audios if any effect does not
+            support streaming. Effects that need the whole audio, like
+            ``Normalize()`` with its default ``stream_lookahead=None``, hold
+            back all audio until the end of each text chunk; use e.g.
+            ``Normalize(stream_lookahead=0.1)`` for low latency.
+            Defaults to ``False``.
+        effects_cache:
+            Optional :class:`voicebox.voiceboxes.cache.EffectsCache` to cache
+            the audio after the effects have been applied. Cached audio is
+            played whole, even if ``streaming=True``.
+        dtype:
+            The float dtype to convert the TTS audio to before applying the
+            effects. Defaults to :func:`voicebox.audio.get_default_dtype`,
+            i.e. float32.
     """
 
     _tts_and_effects_queue_thread: _TTSAndEffectsQueueThread
@@ -162,6 +293,9 @@ class ParallelVoicebox(VoiceboxWithTextSplitter):
         start: bool = True,
         queue_get_timeout: float = 1.0,
         daemon: bool = True,
+        streaming: bool = False,
+        effects_cache: EffectsCache = None,
+        dtype: DTypeLike = None,
     ):
         super().__init__(text_splitter)
 
@@ -181,6 +315,9 @@ class ParallelVoicebox(VoiceboxWithTextSplitter):
             tts=tts,
             effects=effects,
             sink_queue_thread=self._sink_queue_thread,
+            streaming=streaming,
+            effects_cache=effects_cache,
+            dtype=dtype,
             queue_get_timeout=queue_get_timeout,
             start=start,
             daemon=daemon,
@@ -202,6 +339,30 @@ class ParallelVoicebox(VoiceboxWithTextSplitter):
     def effects(self, effects: Effects) -> None:
         self._tts_and_effects_queue_thread.effects = effects
 
+    @property
+    def streaming(self) -> bool:
+        return self._tts_and_effects_queue_thread.streaming
+
+    @streaming.setter
+    def streaming(self, streaming: bool) -> None:
+        self._tts_and_effects_queue_thread.streaming = streaming
+
+    @property
+    def effects_cache(self) -> Optional[EffectsCache]:
+        return self._tts_and_effects_queue_thread.effects_cache
+
+    @effects_cache.setter
+    def effects_cache(self, effects_cache: Optional[EffectsCache]) -> None:
+        self._tts_and_effects_queue_thread.effects_cache = effects_cache
+
+    @property
+    def dtype(self) -> Optional[DTypeLike]:
+        return self._tts_and_effects_queue_thread.dtype
+
+    @dtype.setter
+    def dtype(self, dtype: Optional[DTypeLike]) -> None:
+        self._tts_and_effects_queue_thread.dtype = dtype
+
     @property
     def sink(self) -> Sink:
         return self._sink_queue_thread.sink
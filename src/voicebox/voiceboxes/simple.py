@@ -1,10 +1,15 @@
 __all__ = ["SimpleVoicebox"]
 
+from typing import Optional
+
+from numpy.typing import DTypeLike
+
 from voicebox.audio import Audio
-from voicebox.effects import Effects, default_effects, SeriesChain
+from voicebox.effects import ConvertDtype, Effects, default_effects, SeriesChain
 from voicebox.sinks import Sink, default_sink
 from voicebox.tts import TTS, default_tts
 from voicebox.voiceboxes.base import VoiceboxWithTextSplitter
+from voicebox.voiceboxes.cache import EffectsCache
 from voicebox.voiceboxes.splitter import Splitter
 
 
@@ -24,11 +29,20 @@ class SimpleVoicebox(VoiceboxWithTextSplitter):
         text_splitter:
             The :class:`voicebox.voiceboxes.splitter.Splitter` to use to split
             the text into chunks to be spoken. Defaults to no splitting.
+        effects_cache:
+            Optional :class:`voicebox.voiceboxes.cache.EffectsCache` to cache
+            the audio after the effects have been applied.
+        dtype:
+            The float dtype to convert the TTS audio to before applying the
+            effects. Defaults to :func:`voicebox.audio.get_default_dtype`,
+            i.e. float32.
     """
 
     tts: TTS
     effects: Effects
     sink: Sink
+    effects_cache: Optional[EffectsCache]
+    dtype: Optional[DTypeLike]
 
     def __init__(
         self,
@@ -36,21 +50,30 @@ class SimpleVoicebox(VoiceboxWithTextSplitter):
         effects: Effects = None,
         sink: Sink = None,
         text_splitter: Splitter = None,
+        effects_cache: EffectsCache = None,
+        dtype: DTypeLike = None,
     ):
         super().__init__(text_splitter)
 
         self.tts = tts if tts is not None else default_tts()
         self.effects = effects if effects is not None else default_effects()
         self.sink = sink if sink is not None else default_sink()
+        self.effects_cache = effects_cache
+        self.dtype = dtype
 
     def _say_chunk(self, chunk: str) -> None:
         audio = self._get_tts_audio_with_effects(chunk)
         self.sink.play(audio)
 
     def _get_tts_audio_with_effects(self, text: str) -> Audio:
+        effects = [ConvertDtype(self.dtype), *self.effects]
+
+        if self.effects_cache is not None:
+            return self.effects_cache.get_speech_with_effects(self.tts, effects, text)
+
         audio = self.tts.get_speech(text)
 
-        effects_chain = SeriesChain(*self.effects)
+        effects_chain = SeriesChain(*effects, inplace=True)
         audio = effects_chain(audio)
 
         return audio
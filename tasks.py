@@ -1,5 +1,7 @@
 """Run with: ``invoke <task> [task ...]``"""
 
+from pathlib import Path
+
 from invoke import task
 
 
@@ -21,6 +23,13 @@ def integration(c):
     c.run("coverage run --branch --source=src -m pytest tests/integration")
 
 
+@task
+def bench(c):
+    """Run benchmarks."""
+    for path in sorted(Path("benchmarks").glob("*.py")):
+        c.run(f"python {path}", echo=True)
+
+
 @task
 def cov(c):
     """Generate coverage report."""
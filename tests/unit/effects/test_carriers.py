@@ -0,0 +1,199 @@
+import unittest
+from random import Random
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.effects.carriers import RandomSawtoothWave, RandomSemitoneWave
+from voicebox.effects.vocoder import sawtooth_wave
+
+SAMPLE_RATE = 16_000
+
+
+def get_times(length: int, start: int = 0) -> np.ndarray:
+    return np.arange(start, start + length) * (1.0 / SAMPLE_RATE)
+
+
+def get_aliasing(signal: np.ndarray, freq: int) -> float:
+    """
+    Returns the fraction of the power of a 1 second signal that is not at a
+    harmonic of the integer frequency below the Nyquist frequency.
+    """
+
+    power = np.abs(np.fft.rfft(signal)) ** 2
+    harmonics = np.arange(0, len(power), freq)
+    return 1 - power[harmonics].sum() / power.sum()
+
+
+class RandomSawtoothWaveTest(unittest.TestCase):
+    def test_matches_sawtooth_wave_within_first_pitch(self):
+        times = get_times(1000, start=1234)
+        wave = RandomSawtoothWave(100.0, 200.0, 1.0, rng=np.random.default_rng(0))
+
+        result = wave(times)
+
+        freq = wave.get_frequencies(np.random.default_rng(0), 1)[0]
+        expected = sawtooth_wave(2 * np.pi * freq * times)
+        np.testing.assert_allclose(expected, result, atol=1e-9)
+
+    def test_phase_is_continuous_across_pitch_changes(self):
+        wave = RandomSawtoothWave(100.0, 400.0, 0.01, rng=np.random.default_rng(0))
+
+        result = wave(get_times(SAMPLE_RATE))
+
+        # Each sample advances by 2 * freq / sample_rate, wrapping from +1 to -1
+        steps = np.diff(result)
+        steps[steps < 0] += 2
+        freqs = steps * SAMPLE_RATE / 2
+        self.assertGreaterEqual(freqs.min(), 100.0 - 1e-6)
+        self.assertLessEqual(freqs.max(), 400.0 + 1e-6)
+        self.assertGreater(len(np.unique(freqs.round(6))), 50)
+
+    def test_pitch_changes_every_pitch_duration(self):
+        wave = RandomSawtoothWave(100.0, 400.0, 0.01, rng=np.random.default_rng(0))
+
+        result = wave(get_times(1600))
+
+        steps = np.diff(result)
+        steps[steps < 0] += 2
+        changes = np.flatnonzero(np.abs(np.diff(steps)) > 1e-9) + 1
+        np.testing.assert_array_equal(np.arange(160, 1600, 160), changes)
+
+    def test_pitch_changes_at_multiples_of_pitch_duration(self):
+        wave = RandomSawtoothWave(100.0, 400.0, 0.01, rng=np.random.default_rng(0))
+
+        result = wave(get_times(1000, start=100))
+
+        steps = np.diff(result)
+        steps[steps < 0] += 2
+        changes = np.flatnonzero(np.abs(np.diff(steps)) > 1e-9) + 1
+        np.testing.assert_array_equal(np.arange(60, 1000, 160), changes)
+
+    @parameterized.expand(
+        [
+            ("one block", [4000]),
+            ("uneven blocks", [1000, 333, 1, 2000, 666]),
+            ("blocks of one", [1] * 500),
+        ]
+    )
+    def test_get_wave_block_matches_one_call(self, name, block_sizes):
+        def build() -> RandomSawtoothWave:
+            return RandomSawtoothWave(
+                100.0, 400.0, 0.01, band_limited=True, rng=np.random.default_rng(0)
+            )
+
+        length = sum(block_sizes)
+        expected = build()(get_times(length, start=50))
+
+        wave = build()
+        state = None
+        blocks = []
+        start = 50
+        for block_size in block_sizes:
+            block, state = wave.get_wave_block(
+                get_times(block_size, start), state, dt=1 / SAMPLE_RATE
+            )
+            blocks.append(block)
+            start += block_size
+
+        np.testing.assert_allclose(expected, np.concatenate(blocks), atol=1e-9)
+
+    def test_get_wave_block_with_empty_times_keeps_state(self):
+        wave = RandomSawtoothWave(100.0, 400.0, 0.01)
+        _, state = wave.get_wave_block(get_times(100))
+
+        block, new_state = wave.get_wave_block(get_times(0), state)
+
+        self.assertEqual(0, len(block))
+        self.assertIs(state, new_state)
+
+    def test_frequencies_are_log_uniform(self):
+        wave = RandomSawtoothWave(100.0, 400.0, 0.1)
+
+        freqs = wave.get_frequencies(np.random.default_rng(0), 100_000)
+
+        self.assertTrue(np.all((100.0 <= freqs) & (freqs <= 400.0)))
+        self.assertAlmostEqual(0.5, np.mean(freqs < 200.0), delta=0.01)
+
+    def test_seeded_rng_is_repeatable(self):
+        times = get_times(4000)
+
+        for rng_1, rng_2 in [
+            (np.random.default_rng(1), np.random.default_rng(1)),
+            (Random(1), Random(1)),
+        ]:
+            result_1 = RandomSawtoothWave(100.0, 200.0, 0.05, rng=rng_1)(times)
+            result_2 = RandomSawtoothWave(100.0, 200.0, 0.05, rng=rng_2)(times)
+            np.testing.assert_array_equal(result_1, result_2)
+
+    def test_rng_can_be_passed_positionally(self):
+        rng = Random(1)
+        wave = RandomSawtoothWave(100.0, 200.0, 0.05, rng)
+
+        self.assertIs(rng, wave.rng)
+        self.assertEqual("sawtooth", wave.waveform)
+        np.testing.assert_array_equal(
+            RandomSawtoothWave(100.0, 200.0, 0.05, rng=Random(1))(get_times(4000)),
+            RandomSawtoothWave(100.0, 200.0, 0.05, Random(1))(get_times(4000)),
+        )
+
+    @parameterized.expand([(0,), (1,)])
+    def test_short_times(self, length: int):
+        result = RandomSawtoothWave(100.0, 200.0, 0.05)(get_times(length))
+
+        self.assertEqual(length, len(result))
+
+    @parameterized.expand([("sawtooth",), ("square",), ("pulse",)])
+    def test_band_limited_reduces_aliasing(self, waveform: str):
+        times = get_times(SAMPLE_RATE)
+
+        def build(band_limited: bool) -> RandomSawtoothWave:
+            return RandomSawtoothWave(
+                3001.0,
+                3001.0,
+                1.0,
+                waveform=waveform,
+                duty=0.3,
+                band_limited=band_limited,
+            )
+
+        naive = build(False)(times)
+        band_limited = build(True)(times)
+
+        self.assertLessEqual(np.abs(band_limited).max(), 1.0 + 1e-9)
+        self.assertLess(get_aliasing(band_limited, 3001), get_aliasing(naive, 3001) / 2)
+
+    @parameterized.expand(
+        [("square", 0.25, 0.5), ("pulse", 0.25, 0.25), ("pulse", 0.75, 0.75)]
+    )
+    def test_duty_cycle(self, waveform: str, duty: float, expected: float):
+        wave = RandomSawtoothWave(100.0, 100.0, 1.0, waveform=waveform, duty=duty)
+
+        result = wave(get_times(SAMPLE_RATE))
+
+        self.assertEqual({-1.0, 1.0}, set(result))
+        self.assertAlmostEqual(expected, np.mean(result > 0), places=3)
+
+    def test_unsupported_waveform_raises_ValueError(self):
+        wave = RandomSawtoothWave(100.0, 200.0, 0.1, waveform="triangle")
+
+        self.assertRaises(ValueError, wave, get_times(100))
+
+
+class RandomSemitoneWaveTest(unittest.TestCase):
+    def test_frequencies_are_whole_semitones(self):
+        wave = RandomSemitoneWave(170.0, 6, 0.4)
+
+        freqs = wave.get_frequencies(np.random.default_rng(0), 10_000)
+
+        semitones = 12 * np.log2(freqs / 170.0)
+        np.testing.assert_allclose(semitones.round(), semitones, atol=1e-9)
+        self.assertEqual(set(range(7)), set(semitones.round().astype(int)))
+
+    def test_call(self):
+        wave = RandomSemitoneWave(170.0, 6, 0.4, rng=np.random.default_rng(0))
+
+        result = wave(get_times(SAMPLE_RATE))
+
+        self.assertEqual(SAMPLE_RATE, len(result))
+        self.assertTrue(np.all((-1.0 <= result) & (result < 1.0)))
@@ -1,5 +1,7 @@
+import threading
 import unittest
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 import numpy as np
 from parameterized import parameterized
@@ -7,6 +9,10 @@ from parameterized import parameterized
 from unit.utils import build_audio
 from voicebox.audio import Audio
 from voicebox.effects.chain import SeriesChain, ParallelChain
+from voicebox.effects.eq import Filter
+from voicebox.effects.normalize import Normalize
+from voicebox.effects.ring_mod import RingMod
+from voicebox.effects.tail import Tail
 
 
 class SeriesChainTest(unittest.TestCase):
@@ -33,6 +39,39 @@ class SeriesChainTest(unittest.TestCase):
         self.assertIs(result, audio)
         self.assertEqual(audio_copy, result)
 
+    def test_apply_inplace_never_writes_to_input_audio(self):
+        audio = Audio(np.array([1.0, -2.0, 3.0, -4.0]), sample_rate=8000)
+        audio_copy = audio.copy()
+        chain = SeriesChain(
+            Filter.build("lowpass", 1000),
+            RingMod(),
+            Normalize(),
+            inplace=True,
+        )
+
+        result = chain.apply(audio)
+
+        expected = SeriesChain(*chain.effects).apply(audio.copy())
+        self.assertEqual(audio_copy, audio)
+        np.testing.assert_array_equal(expected.signal, result.signal)
+
+    def test_apply_inplace_only_reuses_signals_made_by_effects(self):
+        audio = build_audio(4)
+        new_audio = build_audio(4)
+        effect_1 = mock_effect(lambda a: a)
+        effect_2 = mock_effect(lambda a: new_audio)
+        effect_3 = Mock()
+        effect_3.apply_inplace.side_effect = lambda a: a
+        chain = SeriesChain(effect_1, effect_2, effect_3, inplace=True)
+
+        result = chain.apply(audio)
+
+        self.assertIs(new_audio, result)
+        effect_1.apply.assert_called_once_with(audio)
+        effect_2.apply.assert_called_once_with(audio)
+        effect_3.apply.assert_not_called()
+        effect_3.apply_inplace.assert_called_once_with(new_audio)
+
 
 class ParallelChainTest(unittest.TestCase):
     def setUp(self):
@@ -95,8 +134,124 @@ class ParallelChainTest(unittest.TestCase):
         expected = Audio(expected_signal, sample_rate=self.audio.sample_rate)
         self.assertEqual(expected, result)
 
+    def test_apply_only_copies_audio_for_effects_that_modify_their_input(self):
+        modifying_effect = mock_effect(lambda a: a)
+        modifying_effect.modifies_input = True
+        non_modifying_effect = mock_effect(lambda a: a.copy())
+        non_modifying_effect.modifies_input = False
+        chain = ParallelChain(modifying_effect, non_modifying_effect, dry_gain=1)
+        audio = self.audio.copy()
+
+        result = chain.apply(audio)
+
+        self.assertIsNot(audio, modifying_effect.apply.call_args.args[0])
+        self.assertIs(audio, non_modifying_effect.apply.call_args.args[0])
+        self.assertEqual(self.audio, audio)
+        np.testing.assert_array_equal(3 * self.audio.signal, result.signal)
+
+    @parameterized.expand([(0.0,), (0.5,)])
+    def test_sum_matches_combining_matrix(self, dry_gain: float):
+        rng = np.random.default_rng(0)
+        audio = Audio(rng.uniform(-1, 1, 1000).astype(np.float32), 16_000)
+        effects = [
+            Filter.build("lowpass", 1000),
+            RingMod(),
+            Tail(0.01),
+            Normalize(),
+        ]
+
+        result = ParallelChain(*effects, dry_gain=dry_gain).apply(audio.copy())
+
+        # Any other combine_func stacks the signals into a matrix first
+        matrix_chain = ParallelChain(
+            *effects,
+            dry_gain=dry_gain,
+            combine_func=lambda signals, axis: np.sum(signals, axis=axis),
+        )
+        expected = matrix_chain.apply(audio.copy())
+        self.assertEqual(np.float32, result.signal.dtype)
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([(2,), (None,)])
+    def test_apply_with_max_workers(self, max_workers):
+        # Both effects must be applied at the same time to get past this
+        barrier = threading.Barrier(2, timeout=5)
+
+        def apply(a):
+            self.assertIsNot(threading.main_thread(), threading.current_thread())
+            barrier.wait()
+            return a.copy(signal=a.signal * 2)
+
+        chain = ParallelChain(
+            mock_effect(apply),
+            mock_effect(apply),
+            mock_effect(lambda a: a.copy(signal=a.signal + 1)),
+            dry_gain=1,
+            max_workers=max_workers,
+        )
+
+        with patch("os.cpu_count", return_value=2), chain:
+            result = chain.apply(self.audio.copy())
+
+        expected_signal = 6 * self.audio.signal + 1
+        self.assertEqual(self.audio.copy(signal=expected_signal), result)
+
+    def test_apply_with_max_workers_reuses_worker_threads_until_closed(self):
+        chain = ParallelChain(
+            mock_effect(lambda a: a), mock_effect(lambda a: a), max_workers=2
+        )
+
+        with patch(
+            "voicebox.effects.chain.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor_class:
+            chain.apply(self.audio.copy())
+            chain.apply(self.audio.copy())
+            executor_class.assert_called_once()
+
+            chain.close()
+            chain.apply(self.audio.copy())
+            self.assertEqual(2, executor_class.call_count)
+
+        chain.close()
+
+    def test_apply_with_max_workers_raises_effect_exceptions(self):
+        effect = Mock()
+        effect.apply.side_effect = ValueError("oops")
+        chain = ParallelChain(
+            mock_effect(lambda a: a), effect, mock_effect(lambda a: a), max_workers=2
+        )
+        self.addCleanup(chain.close)
+
+        self.assertRaises(ValueError, chain.apply, self.audio)
+
+    def test_fingerprint_ignores_max_workers(self):
+        effect = RingMod()
+
+        self.assertEqual(
+            ParallelChain(effect).fingerprint(),
+            ParallelChain(effect, max_workers=4).fingerprint(),
+        )
+        self.assertNotEqual(
+            ParallelChain(effect).fingerprint(),
+            ParallelChain(effect, dry_gain=0.5).fingerprint(),
+        )
+
 
 def mock_effect(lambda_) -> Mock:
     effect = Mock()
     effect.apply.side_effect = lambda_
     return effect
+
+
+class SeriesChainStreamingTest(unittest.TestCase):
+    def test_flush_passes_held_back_audio_through_later_effects(self):
+        audio = Audio(np.array([1.0, 2.0, 3.0]), sample_rate=1)
+        chain = SeriesChain(Normalize(), Tail(1.0), Normalize(max_amplitude=0.5))
+
+        block, state = chain.process_block(audio.copy())
+        self.assertEqual(0, len(block))
+
+        result = chain.flush(state)
+
+        expected = chain.apply(audio.copy())
+        self.assertEqual(expected, result)
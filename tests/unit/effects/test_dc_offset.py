@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from voicebox.audio import Audio
+from voicebox.effects.dc_offset import RemoveDcOffset
+
+
+class RemoveDcOffsetTest(unittest.TestCase):
+    def test_apply(self):
+        audio = Audio(np.array([0.0, 1.0, 2.0, 3.0]), 4)
+
+        result = RemoveDcOffset().apply(audio)
+
+        self.assertEqual(Audio(np.array([-1.5, -0.5, 0.5, 1.5]), 4), result)
+
+    def test_process_block_without_lookahead_holds_back_all_audio(self):
+        effect = RemoveDcOffset()
+
+        block, state = effect.process_block(Audio(np.array([0.0, 1.0]), 4))
+        self.assertEqual(0, len(block))
+
+        block, state = effect.process_block(Audio(np.array([2.0, 3.0]), 4), state)
+        self.assertEqual(0, len(block))
+
+        result = effect.flush(state)
+        self.assertEqual(Audio(np.array([-1.5, -0.5, 0.5, 1.5]), 4), result)
+
+    def test_process_block_with_lookahead_uses_running_mean(self):
+        effect = RemoveDcOffset(stream_lookahead=0.25)
+
+        block, state = effect.process_block(Audio(np.array([1.0, 3.0]), 4))
+        np.testing.assert_array_equal([-1.0], block.signal)
+
+        block, state = effect.process_block(Audio(np.array([5.0, 7.0]), 4), state)
+        np.testing.assert_array_equal([-1.0, 1.0], block.signal)
+
+        result = effect.flush(state)
+        np.testing.assert_array_equal([3.0], result.signal)
+
+    def test_flush_with_no_blocks_returns_none(self):
+        self.assertIsNone(RemoveDcOffset().flush(None))
+
+    def test_process_block_without_lookahead_does_not_copy_pending_audio(self):
+        effect = RemoveDcOffset()
+        state = None
+
+        with patch("numpy.concatenate", wraps=np.concatenate) as concatenate:
+            for i in range(10):
+                _, state = effect.process_block(Audio(np.full(2, float(i)), 4), state)
+
+            concatenate.assert_not_called()
+
+        result = effect.flush(state)
+        np.testing.assert_array_equal(
+            np.repeat(np.arange(10.0), 2) - 4.5, result.signal
+        )
+
+    def test_process_block_does_not_keep_reference_to_block(self):
+        effect = RemoveDcOffset()
+        signal = np.array([0.0, 1.0])
+
+        _, state = effect.process_block(Audio(signal, 4))
+        signal[:] = 10.0
+
+        np.testing.assert_array_equal([-0.5, 0.5], effect.flush(state).signal)
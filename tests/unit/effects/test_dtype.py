@@ -0,0 +1,98 @@
+import unittest
+import warnings
+
+import numpy as np
+import pedalboard
+from parameterized import parameterized
+
+from voicebox.audio import Audio, set_default_dtype, get_default_dtype
+from voicebox.effects import (
+    ConvertDtype,
+    Filter,
+    Flanger,
+    Glitch,
+    Normalize,
+    ParallelChain,
+    PedalboardEffect,
+    RemoveDcOffset,
+    RingMod,
+    SeriesChain,
+    Tail,
+    Vocoder,
+)
+from voicebox.effects.vocoder import EnvelopeFollower
+
+EFFECTS = [
+    ("ConvertDtype", lambda: ConvertDtype(np.float32)),
+    ("Filter", lambda: Filter.build("bandpass", (300, 3000), order=2)),
+    ("Flanger", lambda: Flanger()),
+    ("Glitch", lambda: Glitch()),
+    ("Normalize", lambda: Normalize()),
+    ("Normalize lookahead", lambda: Normalize(stream_lookahead=0.01)),
+    ("ParallelChain", lambda: ParallelChain(RingMod(), Flanger(), dry_gain=0.5)),
+    ("PedalboardEffect", lambda: PedalboardEffect(pedalboard.Reverb())),
+    ("RemoveDcOffset", lambda: RemoveDcOffset()),
+    ("RingMod", lambda: RingMod()),
+    ("SeriesChain", lambda: SeriesChain(Filter.build("highpass", 100), RingMod())),
+    ("Tail", lambda: Tail(0.1)),
+    ("Vocoder", lambda: Vocoder.build(bands=10, max_freq=7000)),
+    ("EnvelopeFollower", lambda: EnvelopeFollower.build()),
+]
+
+
+class EffectsKeepDtypeTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (f"{name} {np.dtype(dtype).name}", build_effect, dtype)
+            for name, build_effect in EFFECTS
+            for dtype in (np.float32, np.float64)
+            if name != "ConvertDtype" or dtype == np.float32
+        ]
+    )
+    def test(self, name, build_effect, dtype):
+        rng = np.random.default_rng(0)
+        audio = Audio(rng.uniform(-0.5, 0.5, 4000).astype(dtype), 16_000)
+        effect = build_effect()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            self.assertEqual(dtype, effect.apply(audio.copy()).dtype)
+
+            if effect.supports_streaming:
+                blocks = [audio.copy(signal=s) for s in np.array_split(audio.signal, 4)]
+                for block in effect.process_stream(blocks):
+                    self.assertEqual(dtype, block.dtype)
+
+
+class ConvertDtypeTest(unittest.TestCase):
+    def setUp(self):
+        self.audio = Audio(np.float32([0.0, 0.5, -1.0]), 8000)
+
+    def test_apply(self):
+        result = ConvertDtype(np.float64).apply(self.audio)
+
+        self.assertEqual(np.float64, result.dtype)
+        self.assertEqual(self.audio, result)
+
+    def test_apply_uses_default_dtype(self):
+        audio = self.audio.copy(signal=self.audio.signal.astype(np.float64))
+        self.assertEqual(np.float32, ConvertDtype().apply(audio).dtype)
+
+    def test_process_block(self):
+        block, state = ConvertDtype(np.float64).process_block(self.audio)
+
+        self.assertEqual(np.float64, block.dtype)
+        self.assertIsNone(state)
+
+    def test_fingerprint_depends_on_resolved_dtype(self):
+        fingerprint = ConvertDtype().fingerprint()
+
+        self.assertEqual(fingerprint, ConvertDtype(np.float32).fingerprint())
+        self.assertEqual(fingerprint, ConvertDtype("float32").fingerprint())
+        self.assertNotEqual(fingerprint, ConvertDtype(np.float64).fingerprint())
+
+        self.addCleanup(set_default_dtype, get_default_dtype())
+        set_default_dtype(np.float64)
+
+        self.assertNotEqual(fingerprint, ConvertDtype().fingerprint())
@@ -0,0 +1,308 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects import (
+    Filter,
+    Flanger,
+    Glitch,
+    Normalize,
+    ParallelChain,
+    RemoveDcOffset,
+    RingMod,
+    SeriesChain,
+    Tail,
+    Vocoder,
+)
+from voicebox.effects.effect import Effect, EffectWithDryWet
+from voicebox.effects.utils import BLOCK_SIZE
+from voicebox.effects.vocoder import RandomSawtoothWave
+
+
+def split_audio(audio: Audio, block_sizes) -> list:
+    bounds = np.cumsum([0] + list(block_sizes))
+    assert bounds[-1] == len(audio)
+    return [
+        audio.copy(signal=audio.signal[start:stop].copy())
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def process_blocks(effect: Effect, blocks) -> np.ndarray:
+    signals = [block.signal for block in effect.process_stream(blocks)]
+    return np.concatenate(signals) if signals else np.zeros(0)
+
+
+BLOCK_SIZES = [
+    ("one block", [4000]),
+    ("equal blocks", [1000] * 4),
+    ("uneven blocks", [1, 7, 512, 0, 1480, 2000]),
+]
+
+
+class DoublingEffect(EffectWithDryWet):
+    """Third-party style effect, which doubles the input signal in place."""
+
+    def get_wet_signal(self, audio: Audio) -> np.ndarray:
+        audio.signal *= 2
+        return audio.signal
+
+
+STREAMING_EFFECTS = [
+    ("filter", lambda: Filter.build("bandpass", (300, 3000), order=3)),
+    ("ring mod", lambda: RingMod(carrier_freq=30.0)),
+    ("flanger", lambda: Flanger(t_offset_func=None)),
+    ("vocoder", lambda: Vocoder.build(bands=10, max_freq=7000)),
+    ("remove dc offset", lambda: RemoveDcOffset()),
+    ("normalize", lambda: Normalize()),
+    ("tail", lambda: Tail(0.1)),
+    ("glitch", lambda: Glitch(chunk_time=0.01, p_repeat=1.0, max_repeats=1)),
+    (
+        "series chain",
+        lambda: SeriesChain(
+            Filter.build("highpass", 100),
+            Normalize(max_amplitude=0.5),
+            RingMod(),
+            Tail(0.1),
+        ),
+    ),
+]
+
+
+class EffectStreamingTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        signal = rng.uniform(-0.5, 0.5, 4000) + 0.1
+        self.audio = Audio(signal, 16_000)
+
+    @parameterized.expand(
+        [
+            (f"{effect_name}, {blocks_name}", build_effect, block_sizes)
+            for effect_name, build_effect in STREAMING_EFFECTS
+            for blocks_name, block_sizes in BLOCK_SIZES
+        ]
+    )
+    def test_blocks_match_whole_buffer(self, name, build_effect, block_sizes):
+        effect = build_effect()
+        self.assertTrue(effect.supports_streaming)
+
+        expected = build_effect().apply(self.audio.copy()).signal
+        result = process_blocks(effect, split_audio(self.audio, block_sizes))
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    def test_process_stream_with_no_blocks_yields_nothing(self):
+        self.assertEqual([], list(Filter.build("lowpass", 1000).process_stream([])))
+
+    def test_process_block_raises_if_streaming_not_supported(self):
+        class WholeAudioEffect(Effect):
+            def apply(self, audio: Audio) -> Audio:
+                return audio
+
+        effect = WholeAudioEffect()
+
+        self.assertFalse(effect.supports_streaming)
+        self.assertFalse(SeriesChain(effect, RingMod()).supports_streaming)
+        with self.assertRaises(NotImplementedError):
+            effect.process_block(self.audio)
+        self.assertIsNone(effect.flush(None))
+
+
+class EffectFingerprintTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("normalize", lambda: Normalize(), True),
+            ("ring mod", lambda: RingMod(), True),
+            ("vocoder", lambda: Vocoder.build(bands=10), True),
+            (
+                "random vocoder",
+                lambda: Vocoder.build(carrier_wave=RandomSawtoothWave(100, 200, 0.1)),
+                False,
+            ),
+            ("glitch", lambda: Glitch(), False),
+            ("flanger", lambda: Flanger(t_offset_func=None), True),
+            ("time-seeded flanger", lambda: Flanger(), False),
+            ("series chain", lambda: SeriesChain(Normalize(), RingMod()), True),
+            ("random series chain", lambda: SeriesChain(Normalize(), Glitch()), False),
+            ("parallel chain", lambda: ParallelChain(Tail(), RingMod()), True),
+            ("random parallel chain", lambda: ParallelChain(Tail(), Flanger()), False),
+        ]
+    )
+    def test_is_deterministic(self, name, build_effect, expected):
+        self.assertEqual(expected, build_effect().is_deterministic)
+
+    @parameterized.expand(
+        [
+            ("normalize", lambda: Normalize(), lambda: Normalize(max_amplitude=0.5)),
+            ("ring mod", lambda: RingMod(), lambda: RingMod(carrier_wave=np.cos)),
+            (
+                "filter",
+                lambda: Filter.build("lowpass", 100),
+                lambda: Filter.build("lowpass", 200),
+            ),
+            (
+                "flanger",
+                lambda: Flanger(t_offset_func=None),
+                lambda: Flanger(rate=1, t_offset_func=None),
+            ),
+            (
+                "vocoder",
+                lambda: Vocoder.build(),
+                lambda: Vocoder.build(carrier_freq=100),
+            ),
+            (
+                "chain order",
+                lambda: SeriesChain(Normalize(), Tail()),
+                lambda: SeriesChain(Tail(), Normalize()),
+            ),
+            ("chain type", lambda: SeriesChain(Tail()), lambda: ParallelChain(Tail())),
+        ]
+    )
+    def test_fingerprint_depends_on_settings(self, name, build_effect, build_other):
+        fingerprint = build_effect().fingerprint()
+
+        self.assertEqual(fingerprint, build_effect().fingerprint())
+        self.assertNotEqual(fingerprint, build_other().fingerprint())
+
+    def test_fingerprint_ignores_private_attributes(self):
+        vocoder = Vocoder.build(bands=10, max_freq=7000)
+        fingerprint = vocoder.fingerprint()
+
+        vocoder._scratch = np.zeros(100)
+
+        self.assertEqual(fingerprint, vocoder.fingerprint())
+
+    def test_fingerprint_raises_TypeError_for_unsupported_attributes(self):
+        self.assertRaises(TypeError, Glitch().fingerprint)
+
+    def test_setting_attribute_changes_fingerprint(self):
+        ring_mod = RingMod()
+        chain = SeriesChain(ring_mod)
+        fingerprint = chain.fingerprint()
+
+        ring_mod.carrier_freq = 30.0
+
+        self.assertNotEqual(fingerprint, chain.fingerprint())
+        self.assertEqual(
+            SeriesChain(RingMod(carrier_freq=30.0)).fingerprint(), chain.fingerprint()
+        )
+
+    def test_setting_nested_filter_param_changes_fingerprint(self):
+        vocoder = Vocoder.build(bands=10, max_freq=7000)
+        fingerprint = vocoder.fingerprint()
+
+        vocoder.bandpass_filters[0].filter_param_builder.order = 4
+
+        self.assertNotEqual(fingerprint, vocoder.fingerprint())
+
+    def test_setting_nested_carrier_param_changes_fingerprint(self):
+        vocoder = Vocoder.build(bands=10, max_freq=7000)
+        fingerprint = vocoder.fingerprint()
+
+        vocoder.carrier_wave.freq = 300.0
+
+        self.assertNotEqual(fingerprint, vocoder.fingerprint())
+
+
+INPLACE_EFFECTS = [
+    ("filter", lambda: Filter.build("bandpass", (300, 3000), order=3)),
+    ("ring mod", lambda: RingMod(carrier_freq=30.0)),
+    ("flanger", lambda: Flanger(t_offset_func=None)),
+    ("vocoder", lambda: Vocoder.build(bands=10, max_freq=7000)),
+    ("normalize", lambda: Normalize()),
+    ("remove dc offset", lambda: RemoveDcOffset()),
+    (
+        "series chain",
+        lambda: SeriesChain(
+            Filter.build("highpass", 100),
+            RingMod(),
+            Normalize(max_amplitude=0.5),
+        ),
+    ),
+    (
+        "parallel chain",
+        lambda: ParallelChain(RingMod(), Filter.build("lowpass", 1000), dry_gain=0.5),
+    ),
+]
+
+NON_MODIFYING_EFFECTS = [
+    (name, build_effect)
+    for name, build_effect in INPLACE_EFFECTS
+    if not build_effect().modifies_input
+]
+
+
+class EffectInplaceTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Longer than one block, to cover effects that work block by block
+        signal = rng.uniform(-0.5, 0.5, 2 * BLOCK_SIZE + 123).astype(np.float32)
+        self.audio = Audio(signal, 16_000)
+
+    @parameterized.expand(INPLACE_EFFECTS)
+    def test_apply_inplace_matches_apply(self, name, build_effect):
+        expected = build_effect().apply(self.audio.copy())
+
+        result = build_effect().apply_inplace(self.audio.copy())
+
+        self.assertEqual(expected.signal.dtype, result.signal.dtype)
+        np.testing.assert_array_equal(expected.signal, result.signal)
+
+    @parameterized.expand(NON_MODIFYING_EFFECTS)
+    def test_apply_inplace_with_read_only_signal(self, name, build_effect):
+        expected = build_effect().apply(self.audio.copy())
+        audio = self.audio.copy()
+        audio.signal.flags.writeable = False
+
+        result = build_effect().apply_inplace(audio)
+
+        np.testing.assert_array_equal(expected.signal, result.signal)
+        np.testing.assert_array_equal(self.audio.signal, audio.signal)
+
+    @parameterized.expand(
+        [
+            ("filter", lambda: Filter.build("lowpass", 1000)),
+            ("ring mod", lambda: RingMod()),
+        ]
+    )
+    def test_apply_inplace_reuses_signal(self, name, build_effect):
+        audio = self.audio.copy()
+
+        result = build_effect().apply_inplace(audio)
+
+        self.assertIs(audio.signal, result.signal)
+
+    @parameterized.expand(NON_MODIFYING_EFFECTS)
+    def test_apply_does_not_modify_input(self, name, build_effect):
+        audio = self.audio.copy()
+
+        build_effect().apply(audio)
+
+        np.testing.assert_array_equal(self.audio.signal, audio.signal)
+
+    @parameterized.expand(
+        [
+            ("filter", lambda: Filter.build("lowpass", 1000), False),
+            ("ring mod", lambda: RingMod(), False),
+            ("flanger", lambda: Flanger(), False),
+            ("vocoder", lambda: Vocoder.build(bands=10), False),
+            ("normalize", lambda: Normalize(), True),
+            ("dry/wet subclass", lambda: DoublingEffect(dry=1.0, wet=1.0), True),
+            ("parallel chain", lambda: ParallelChain(Normalize()), False),
+            ("series chain", lambda: SeriesChain(RingMod()), False),
+            ("series chain", lambda: SeriesChain(RingMod(), Normalize()), True),
+        ]
+    )
+    def test_modifies_input(self, name, build_effect, expected):
+        self.assertEqual(expected, build_effect().modifies_input)
+
+    def test_parallel_chain_copies_audio_for_dry_wet_subclass(self):
+        audio = self.audio.copy()
+        chain = ParallelChain(DoublingEffect(dry=0.0, wet=1.0), RingMod(wet=0.0))
+
+        result = chain(audio)
+
+        np.testing.assert_array_equal(self.audio.signal, audio.signal)
+        np.testing.assert_allclose(2.5 * self.audio.signal, result.signal, rtol=1e-6)
@@ -0,0 +1,189 @@
+import copy
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects import Filter, Vocoder
+from voicebox.effects.eq import (
+    FILTER_CACHE_MAX_SIZE,
+    IIRFilterParamBuilder,
+    clear_filter_cache,
+    get_filter_cache_info,
+)
+
+
+def build_param_builder(freq=1000, **kwargs) -> IIRFilterParamBuilder:
+    kwargs = dict(
+        dict(order=2, rp=None, rs=None, btype="lowpass", ftype="butter"),
+        **kwargs,
+    )
+    return IIRFilterParamBuilder(freq=freq, **kwargs)
+
+
+class IIRFilterParamBuilderCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_filter_cache()
+
+    def test_build_reuses_params_for_same_sample_rate(self):
+        builder = build_param_builder()
+
+        sos = builder.build(16_000)
+
+        self.assertIs(sos, builder.build(16_000))
+        self.assertIsNot(sos, builder.build(48_000))
+        info = get_filter_cache_info()
+        self.assertEqual(1, info.hits)
+        self.assertEqual(1, info.builder_hits)
+        self.assertEqual(2, info.misses)
+
+    def test_hits_include_global_and_builder_hits(self):
+        a = build_param_builder()
+        b = build_param_builder()
+
+        a.build(16_000)
+        b.build(16_000)
+        b.build(16_000)
+
+        info = get_filter_cache_info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(1, info.builder_hits)
+        self.assertEqual(1, info.misses)
+
+    def test_clear_filter_cache_resets_stats(self):
+        builder = build_param_builder()
+        builder.build(16_000)
+        builder.build(16_000)
+
+        clear_filter_cache()
+
+        info = get_filter_cache_info()
+        self.assertEqual(0, info.hits)
+        self.assertEqual(0, info.misses)
+        self.assertEqual(0, info.builder_hits)
+
+    @parameterized.expand(
+        [
+            ("order", 4),
+            ("freq", 2000),
+            ("btype", "highpass"),
+            ("ftype", "bessel"),
+        ]
+    )
+    def test_setting_attribute_clears_cache(self, name: str, value):
+        builder = build_param_builder()
+        sos = builder.build(16_000)
+
+        setattr(builder, name, value)
+        new_sos = builder.build(16_000)
+
+        expected = build_param_builder(**{name: value}).build(16_000)
+        np.testing.assert_array_equal(expected, new_sos)
+        self.assertFalse(np.array_equal(sos, new_sos))
+
+    def test_same_settings_share_params(self):
+        a = build_param_builder().build(16_000)
+        b = build_param_builder().build(16_000)
+
+        self.assertIs(a, b)
+
+    def test_vocoder_band_filters_share_params(self):
+        a = Vocoder.build(bands=10)
+        b = Vocoder.build(bands=10)
+        audio = Audio(np.zeros(100), 16_000)
+
+        a(audio)
+        b(audio)
+
+        for a_bpf, b_bpf in zip(a.bandpass_filters, b.bandpass_filters):
+            self.assertIs(
+                a_bpf.filter_param_builder.build(16_000),
+                b_bpf.filter_param_builder.build(16_000),
+            )
+
+    def test_build_accepts_list_band(self):
+        sos = build_param_builder(freq=[100, 1000], btype="bandpass").build(16_000)
+
+        expected = build_param_builder(freq=(100, 1000), btype="bandpass")
+        np.testing.assert_array_equal(expected.build(16_000), sos)
+
+    def test_band_is_stored_as_tuple(self):
+        band = [100, 1000]
+        builder = build_param_builder(freq=band, btype="bandpass")
+        sos = builder.build(16_000)
+
+        band[1] = 2000
+        self.assertEqual((100, 1000), builder.freq)
+        self.assertIs(sos, builder.build(16_000))
+
+        builder.freq = np.array([100, 3000])
+
+        self.assertEqual((100, 3000), builder.freq)
+        self.assertFalse(np.array_equal(sos, builder.build(16_000)))
+
+    def test_invalid_params_are_not_cached(self):
+        builder = build_param_builder(freq=10_000)
+
+        with self.assertRaises(ValueError):
+            builder.build(16_000)
+
+        builder.freq = 1000
+        builder.build(16_000)
+
+    def test_builder_cache_is_bounded(self):
+        builder = build_param_builder()
+
+        for sample_rate in range(8_000, 48_000, 1_000):
+            builder.build(sample_rate)
+
+        self.assertLessEqual(len(builder._cache), 8)
+
+    def test_global_cache_is_bounded(self):
+        with patch("voicebox.effects.eq._iirfilter") as iirfilter:
+            for i in range(FILTER_CACHE_MAX_SIZE + 10):
+                build_param_builder(freq=100 + i).build(16_000)
+
+        info = get_filter_cache_info()
+        self.assertEqual(FILTER_CACHE_MAX_SIZE, info.maxsize)
+        self.assertEqual(FILTER_CACHE_MAX_SIZE, info.currsize)
+        self.assertEqual(FILTER_CACHE_MAX_SIZE + 10, iirfilter.call_count)
+
+    def test_cache_is_not_part_of_equality_or_repr(self):
+        builder = build_param_builder()
+        before = repr(builder)
+
+        builder.build(16_000)
+
+        self.assertEqual(build_param_builder(), builder)
+        self.assertEqual(before, repr(builder))
+
+    def test_copies_build_same_params(self):
+        builder = build_param_builder()
+        sos = builder.build(16_000)
+
+        builder_copy = copy.deepcopy(builder)
+        builder_copy.freq = 2000
+
+        self.assertIs(sos, builder.build(16_000))
+        self.assertFalse(np.array_equal(sos, builder_copy.build(16_000)))
+
+
+class FilterCacheTest(unittest.TestCase):
+    def test_fingerprint_is_unchanged_by_cache(self):
+        effect = Filter.build("lowpass", 1000)
+        before = effect.fingerprint()
+
+        effect(Audio(np.zeros(100), 16_000))
+
+        self.assertEqual(before, effect.fingerprint())
+
+    def test_output_is_unchanged_by_cache(self):
+        effect = Filter.build("bandpass", (300, 3000))
+        audio = Audio(np.random.default_rng(0).uniform(-1, 1, 1000), 16_000)
+
+        first = effect(audio)
+        second = effect(audio)
+
+        np.testing.assert_array_equal(first.signal, second.signal)
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects.flanger import Flanger, _feedback_delay
+
+
+def reference_feedback_delay(signal, delay_offsets, feedback):
+    """Original sample-by-sample implementation of the feedback delay line."""
+
+    wet = np.zeros_like(signal)
+    for i, (in_sample, delay_offset) in enumerate(zip(signal, delay_offsets)):
+        i_delay = i - delay_offset
+        delay_sample = wet[i_delay] if i_delay >= 0 else 0
+        wet[i] = in_sample + feedback * delay_sample
+
+    return wet
+
+
+class FlangerTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (16_000, np.float32),
+            (24_000, np.float32),
+            (48_000, np.float32),
+            (44_100, np.float64),
+        ]
+    )
+    def test_get_wet_signal_matches_reference(self, sample_rate: int, dtype):
+        rng = np.random.default_rng(0)
+        signal = rng.uniform(-1, 1, sample_rate // 2).astype(dtype)
+        audio = Audio(signal, sample_rate)
+
+        flanger = Flanger(rate=2.0, t_offset=0.3, t_offset_func=None)
+
+        result = flanger.get_wet_signal(audio)
+
+        delay_offsets = flanger._get_delay_offsets(audio)
+        expected = reference_feedback_delay(signal, delay_offsets, flanger.feedback)
+
+        self.assertEqual(dtype, result.dtype)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_apply_does_not_change_length(self):
+        audio = Audio(np.ones(1000, dtype=np.float32), 8000)
+
+        result = Flanger(t_offset_func=None).apply(audio)
+
+        self.assertEqual(len(audio), len(result))
+        self.assertEqual(audio.sample_rate, result.sample_rate)
+
+
+class FeedbackDelayTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ([0, 0, 0, 0, 0],),
+            ([0, 1, 2, 1, 0],),
+            ([3, 3, 3, 3, 3],),
+            ([1, 7, 2, 9, 4],),
+        ]
+    )
+    def test_matches_reference(self, delay_offsets):
+        signal = np.array([1.0, -0.5, 0.25, 0.75, -1.0])
+        delay_offsets = np.array(delay_offsets)
+
+        result = _feedback_delay(signal, delay_offsets, 0.9)
+
+        expected = reference_feedback_delay(signal, delay_offsets, 0.9)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_empty_signal(self):
+        result = _feedback_delay(np.zeros(0), np.zeros(0, dtype=int), 0.9)
+        self.assertEqual(0, len(result))
+
+
+class FlangerStreamingTest(unittest.TestCase):
+    def test_t_offset_func_is_called_once_per_stream(self):
+        rng = np.random.default_rng(0)
+        audio = Audio(rng.uniform(-1, 1, 8000), 16_000)
+        t_offset_func = Mock(return_value=1.23)
+        flanger = Flanger(rate=2.0, t_offset_func=t_offset_func)
+
+        blocks = [audio.copy(signal=s) for s in np.array_split(audio.signal, 7)]
+        result = np.concatenate([b.signal for b in flanger.process_stream(blocks)])
+
+        t_offset_func.assert_called_once()
+        expected = flanger.apply(audio.copy()).signal
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
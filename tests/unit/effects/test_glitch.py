@@ -0,0 +1,106 @@
+import unittest
+from random import Random
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects.glitch import Glitch, _repeat_chunks
+
+
+def reference_repeat_chunks(signal, chunk_size, repeats):
+    """Original chunk-by-chunk implementation, without modifying the signal."""
+
+    new_signal = []
+    for i, start in enumerate(range(0, len(signal), chunk_size)):
+        chunk = signal[start : start + chunk_size].copy()
+        if repeats[i]:
+            chunk -= chunk.mean()
+
+        new_signal.extend([chunk] * (repeats[i] + 1))
+
+    return np.concatenate(new_signal) if new_signal else signal[:0].copy()
+
+
+class GlitchTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        signal = rng.uniform(-0.5, 0.5, 16_050).astype(np.float32) + 0.1
+        self.audio = Audio(signal, 16_000)
+
+    def test_apply_does_not_modify_input(self):
+        audio = self.audio.copy()
+
+        result = Glitch(p_repeat=1.0).apply(audio)
+
+        self.assertEqual(self.audio, audio)
+        self.assertGreater(len(result), len(audio))
+        self.assertEqual(np.float32, result.signal.dtype)
+
+    def test_apply_with_seeded_rng_is_repeatable(self):
+        result_1 = Glitch(p_repeat=0.5, rng=np.random.default_rng(1)).apply(self.audio)
+        result_2 = Glitch(p_repeat=0.5, rng=np.random.default_rng(1)).apply(self.audio)
+
+        self.assertEqual(result_1, result_2)
+
+    def test_apply_with_python_random(self):
+        result_1 = Glitch(p_repeat=0.5, rng=Random(1)).apply(self.audio)
+        result_2 = Glitch(p_repeat=0.5, rng=Random(1)).apply(self.audio)
+
+        self.assertEqual(result_1, result_2)
+
+    def test_apply_matches_reference(self):
+        glitch = Glitch(p_repeat=0.5, rng=np.random.default_rng(2))
+        repeats = Glitch(p_repeat=0.5, rng=np.random.default_rng(2))._get_repeats(11)
+
+        result = glitch.apply(self.audio)
+
+        expected = reference_repeat_chunks(self.audio.signal, 1600, repeats)
+        np.testing.assert_array_equal(expected, result.signal)
+
+    def test_repeats_are_drawn_with_the_given_probabilities(self):
+        glitch = Glitch(p_repeat=0.2, max_repeats=3, rng=np.random.default_rng(0))
+
+        repeats = glitch._get_repeats(100_000)
+
+        self.assertAlmostEqual(0.2, np.mean(repeats > 0), delta=0.01)
+        self.assertEqual({0, 1, 2, 3}, set(repeats))
+        np.testing.assert_allclose(
+            [1 / 3] * 3,
+            np.bincount(repeats[repeats > 0])[1:] / np.sum(repeats > 0),
+            atol=0.01,
+        )
+
+    @parameterized.expand([(0.0, 3), (1.0, 1)])
+    def test_streaming_matches_whole_buffer(self, p_repeat: float, max_repeats: int):
+        # These settings leave nothing to chance
+        glitch = Glitch(p_repeat=p_repeat, max_repeats=max_repeats)
+        blocks = [
+            self.audio.copy(signal=signal)
+            for signal in np.split(self.audio.signal, [30, 1000, 1000, 9001])
+        ]
+
+        result = np.concatenate([b.signal for b in glitch.process_stream(blocks)])
+
+        expected = glitch.apply(self.audio).signal
+        np.testing.assert_array_equal(expected, result)
+
+
+class RepeatChunksTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("empty", 0, []),
+            ("no repeats", 10, [0, 0, 0, 0]),
+            ("full chunks", 9, [1, 0, 3]),
+            ("short last chunk", 10, [0, 2, 0, 1]),
+            ("short only chunk", 2, [2]),
+        ]
+    )
+    def test_matches_reference(self, name, length, repeats):
+        signal = np.arange(length, dtype=np.float64) ** 2
+        repeats = np.array(repeats, dtype=int)
+
+        result = _repeat_chunks(signal, 3, repeats)
+
+        expected = reference_repeat_chunks(signal, 3, repeats)
+        np.testing.assert_allclose(expected, result, rtol=1e-12, atol=1e-12)
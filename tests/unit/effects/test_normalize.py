@@ -55,3 +55,26 @@ class NormalizeTest(TestCase):
         result = normalize.apply(audio.copy())
 
         self.assertEqual(audio, result)
+
+    def test_stream_lookahead_defaults_to_none(self):
+        self.assertIsNone(Normalize().stream_lookahead)
+
+    def test_process_block_with_lookahead_uses_running_peak(self):
+        normalize = Normalize(stream_lookahead=0.0)
+
+        block, state = normalize.process_block(Audio(np.array([-0.5, 0.5]), 44100))
+        np.testing.assert_array_equal([-1.0, 1.0], block.signal)
+
+        block, state = normalize.process_block(
+            Audio(np.array([-1.0, 1.0]), 44100), state
+        )
+        np.testing.assert_array_equal([-1.0, 1.0], block.signal)
+
+        self.assertIsNone(normalize.flush(state))
+
+    def test_process_block_with_lookahead_without_dc_offset_removal(self):
+        normalize = Normalize(remove_dc_offset=False, stream_lookahead=0.0)
+
+        block, state = normalize.process_block(Audio(np.array([0.25, 0.5]), 44100))
+
+        np.testing.assert_array_equal([0.5, 1.0], block.signal)
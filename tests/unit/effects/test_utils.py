@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from parameterized import parameterized
 
-from voicebox.effects.utils import db
+from voicebox.effects.utils import block_slices, db
 
 
 class DbTest(TestCase):
@@ -20,3 +20,16 @@ class DbTest(TestCase):
     )
     def test_db(self, db_: float, expected: float):
         self.assertAlmostEqual(expected, db(db_), places=3)
+
+
+class BlockSlicesTest(TestCase):
+    @parameterized.expand(
+        [
+            (0, 3, []),
+            (2, 3, [slice(0, 2)]),
+            (6, 3, [slice(0, 3), slice(3, 6)]),
+            (7, 3, [slice(0, 3), slice(3, 6), slice(6, 7)]),
+        ]
+    )
+    def test_block_slices(self, length: int, block_size: int, expected):
+        self.assertEqual(expected, list(block_slices(length, block_size)))
@@ -0,0 +1,339 @@
+import unittest
+import warnings
+from typing import Tuple
+from unittest.mock import Mock
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects.vocoder import (
+    RandomSawtoothWave,
+    SawtoothWave,
+    Vocoder,
+    _carrier_cache,
+    clear_carrier_cache,
+)
+
+
+def reference_wet_signal(vocoder: Vocoder, audio: Audio) -> np.ndarray:
+    """Original per-band implementation of ``Vocoder.get_wet_signal()``."""
+
+    # The vocoder filters in float64, whatever the dtype of the audio,
+    # but keeps the filtered carrier in the working dtype of the audio
+    carrier_dtype = np.result_type(audio.signal.dtype, np.float32)
+    audio = audio.astype(np.float64)
+    t = np.arange(len(audio)) * audio.sample_period
+    carrier = audio.copy(signal=vocoder.carrier_wave(t))
+
+    new_signals = []
+    for bpf in vocoder.bandpass_filters:
+        try:
+            filtered_modulator = bpf(audio.copy())
+        except ValueError:
+            new_signals.append(np.zeros_like(audio.signal))
+            continue
+
+        modulator_level = vocoder.envelope_follower(filtered_modulator).signal
+        carrier_signal = bpf(carrier.copy()).signal.astype(carrier_dtype)
+        new_signals.append(modulator_level * carrier_signal)
+
+    return np.sum(new_signals, axis=0)
+
+
+class VocoderTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.audio = Audio(rng.uniform(-1, 1, 4000).astype(np.float32), 16_000)
+
+    @parameterized.expand([(10,), (40,)])
+    def test_get_wet_signal_matches_reference(self, bands: int):
+        vocoder = Vocoder.build(bands=bands, max_freq=7000)
+
+        result = vocoder.get_wet_signal(self.audio)
+
+        expected = reference_wet_signal(vocoder, self.audio)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_get_wet_signal_does_not_modify_audio(self):
+        audio = self.audio.copy()
+
+        Vocoder.build(bands=10, max_freq=7000).get_wet_signal(audio)
+
+        self.assertEqual(self.audio, audio)
+
+    def test_get_wet_signal_drops_bands_above_nyquist_with_warning(self):
+        vocoder = Vocoder.build(bands=10, max_freq=12000)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = vocoder.get_wet_signal(self.audio)
+
+        self.assertTrue(caught)
+        self.assertIn("too low for Vocoder", str(caught[0].message))
+
+        expected = reference_wet_signal(vocoder, self.audio)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_get_wet_signal_with_all_bands_dropped_returns_silence(self):
+        vocoder = Vocoder.build(min_freq=9000, max_freq=12000, bands=2)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = vocoder.get_wet_signal(self.audio)
+
+        np.testing.assert_array_equal(np.zeros(len(self.audio)), result)
+
+    def test_build_defaults(self):
+        vocoder = Vocoder.build()
+
+        self.assertEqual(SawtoothWave(160.0), vocoder.carrier_wave)
+        self.assertEqual(40, len(vocoder.bandpass_filters))
+        self.assertEqual(8000.0, vocoder.max_freq)
+        self.assertEqual(0.0, vocoder.dry)
+        self.assertEqual(1.0, vocoder.wet)
+
+
+class VocoderStreamingTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.audio = Audio(rng.uniform(-1, 1, 24_000), 24_000)
+
+    def test_random_carrier_continues_across_blocks(self):
+        def build() -> Vocoder:
+            carrier_wave = RandomSawtoothWave(
+                100.0, 200.0, 0.4, rng=np.random.default_rng(0)
+            )
+            return Vocoder.build(carrier_wave=carrier_wave, bands=10)
+
+        vocoder = build()
+        self.assertTrue(vocoder.supports_streaming)
+
+        blocks = [
+            self.audio.copy(signal=self.audio.signal[i : i + 1024])
+            for i in range(0, len(self.audio), 1024)
+        ]
+        result = np.concatenate(
+            [block.signal for block in vocoder.process_stream(blocks)]
+        )
+
+        expected = build().apply(self.audio.copy()).signal
+        np.testing.assert_allclose(expected, result, atol=1e-9)
+
+    def test_carrier_without_state_does_not_support_streaming(self):
+        vocoder = Vocoder.build(carrier_wave=lambda t: np.sin(t), bands=10)
+
+        self.assertFalse(vocoder.supports_streaming)
+        with self.assertRaises(NotImplementedError):
+            vocoder.process_block(self.audio)
+
+
+class VocoderCarrierCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_carrier_cache()
+        self.addCleanup(clear_carrier_cache)
+
+        rng = np.random.default_rng(0)
+        self.audio = Audio(rng.uniform(-1, 1, 4000).astype(np.float32), 16_000)
+
+    def build_vocoder(self, carrier_wave, **kwargs) -> Vocoder:
+        return Vocoder.build(
+            carrier_wave=carrier_wave, bands=10, max_freq=7000, **kwargs
+        )
+
+    def test_deterministic_carrier_is_generated_once(self):
+        carrier_wave = Mock(wraps=SawtoothWave(160.0), deterministic=True)
+        vocoder = self.build_vocoder(carrier_wave)
+
+        first = vocoder.get_wet_signal(self.audio)
+        second = vocoder.get_wet_signal(self.audio)
+        shorter = vocoder.get_wet_signal(Audio(self.audio.signal[:100], 16_000))
+
+        carrier_wave.assert_called_once()
+        self.assertEqual(16_000, len(carrier_wave.call_args.args[0]))
+
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_array_equal(reference_wet_signal(vocoder, self.audio), first)
+        self.assertEqual(100, len(shorter))
+
+    def test_cache_grows_for_longer_audio(self):
+        vocoder = self.build_vocoder(SawtoothWave(160.0))
+        vocoder.get_wet_signal(self.audio)
+
+        long_audio = Audio(np.tile(self.audio.signal, 5), 16_000)
+        result = vocoder.get_wet_signal(long_audio)
+
+        np.testing.assert_array_equal(reference_wet_signal(vocoder, long_audio), result)
+
+        (carrier_bands,) = _carrier_cache.values()
+        self.assertEqual(32_000, carrier_bands.shape[1])
+        self.assertFalse(carrier_bands.flags.writeable)
+
+    def test_audio_of_whole_seconds_is_cached(self):
+        vocoder = self.build_vocoder(SawtoothWave(160.0))
+
+        vocoder.get_wet_signal(Audio(np.zeros(16_000, dtype=np.float32), 16_000))
+
+        self.assertEqual(1, len(_carrier_cache))
+
+    def test_cache_growth_is_capped_by_budget(self):
+        # 10 bands of 1 second of float32 samples at 16 kHz take 640 kB
+        vocoder = self.build_vocoder(
+            SawtoothWave(160.0), carrier_cache_max_bytes=int(2.5 * 640_000)
+        )
+        vocoder.get_wet_signal(Audio(np.zeros(32_000, dtype=np.float32), 16_000))
+
+        result = vocoder.get_wet_signal(
+            Audio(np.zeros(40_000, dtype=np.float32), 16_000)
+        )
+
+        self.assertEqual(40_000, len(result))
+        (carrier_bands,) = _carrier_cache.values()
+        self.assertEqual(40_000, carrier_bands.shape[1])
+
+    def test_default_budget_caches_utterances_of_a_few_seconds(self):
+        vocoder = Vocoder.build(carrier_wave=SawtoothWave(160.0))
+
+        vocoder.get_wet_signal(Audio(np.zeros(2 * 22_050, dtype=np.float32), 22_050))
+
+        self.assertEqual(1, len(_carrier_cache))
+
+    def test_bands_are_cached_in_audio_dtype(self):
+        vocoder = self.build_vocoder(SawtoothWave(160.0))
+
+        vocoder.get_wet_signal(self.audio)
+        vocoder.get_wet_signal(self.audio.astype(np.float64))
+
+        self.assertEqual(
+            {np.dtype(np.float32), np.dtype(np.float64)},
+            {carrier_bands.dtype for carrier_bands in _carrier_cache.values()},
+        )
+
+    def test_cache_is_shared_by_vocoders_with_same_carrier(self):
+        carrier_wave = Mock(wraps=SawtoothWave(160.0), deterministic=True)
+
+        self.build_vocoder(carrier_wave).get_wet_signal(self.audio)
+        self.build_vocoder(carrier_wave).get_wet_signal(self.audio)
+
+        carrier_wave.assert_called_once()
+        self.assertEqual(1, len(_carrier_cache))
+
+    def test_cache_is_keyed_by_sample_rate(self):
+        vocoder = self.build_vocoder(SawtoothWave(160.0))
+
+        vocoder.get_wet_signal(self.audio)
+        vocoder.get_wet_signal(self.audio.copy(sample_rate=22_050))
+
+        self.assertEqual(2, len(_carrier_cache))
+
+    @parameterized.expand(
+        [
+            ("random carrier", RandomSawtoothWave(100.0, 200.0, 0.1), {}),
+            ("undeclared carrier", lambda t: np.sin(t), {}),
+            ("cache disabled", SawtoothWave(160.0), dict(carrier_cache_max_bytes=0)),
+            ("over budget", SawtoothWave(160.0), dict(carrier_cache_max_bytes=1000)),
+        ]
+    )
+    def test_carrier_not_cached(self, name, carrier_wave, kwargs):
+        vocoder = self.build_vocoder(carrier_wave, **kwargs)
+
+        vocoder.get_wet_signal(self.audio)
+
+        self.assertEqual(0, len(_carrier_cache))
+
+
+class VocoderStftEngineTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        t = np.arange(32_000) / 16_000
+        # Amplitude-modulated low tone, a steady high tone, and some noise
+        signal = (
+            0.25 * np.sin(2 * np.pi * 300 * t) * (1 + np.sin(2 * np.pi * 3 * t))
+            + 0.2 * np.sin(2 * np.pi * 2000 * t)
+            + 0.05 * rng.standard_normal(len(t))
+        )
+        self.audio = Audio(signal.astype(np.float32), 16_000)
+
+    def build_vocoders(self, **kwargs) -> Tuple[Vocoder, Vocoder]:
+        return (
+            Vocoder.build(max_freq=7000, **kwargs),
+            Vocoder.build(max_freq=7000, engine="stft", **kwargs),
+        )
+
+    def test_output_resembles_iir_engine(self):
+        iir_vocoder, stft_vocoder = self.build_vocoders()
+
+        expected = iir_vocoder.get_wet_signal(self.audio)
+        result = stft_vocoder.get_wet_signal(self.audio)
+
+        self.assertEqual(len(expected), len(result))
+
+        # Similar overall level
+        level_ratio = np.std(result) / np.std(expected)
+        self.assertTrue(0.5 < level_ratio < 2, level_ratio)
+
+        # Similar spectral envelope, across the vocoder bands
+        power = np.abs(np.fft.rfft(expected)) ** 2, np.abs(np.fft.rfft(result)) ** 2
+        freqs = np.fft.rfftfreq(len(result), 1 / self.audio.sample_rate)
+        band_powers = np.array(
+            [
+                [p[(low <= freqs) & (freqs < high)].sum() for p in power]
+                for low, high in (
+                    bpf.filter_param_builder.freq
+                    for bpf in iir_vocoder.bandpass_filters
+                )
+            ]
+        )
+        correlation = np.corrcoef(np.log(band_powers.T + 1e-12))[0, 1]
+        self.assertGreater(correlation, 0.9)
+
+        # Similar amplitude envelope over time, in 20 ms frames
+        envelopes = [
+            np.sqrt(np.mean(s[: len(s) // 320 * 320].reshape(-1, 320) ** 2, axis=1))
+            for s in (expected, result)
+        ]
+        self.assertGreater(np.corrcoef(envelopes)[0, 1], 0.8)
+
+    def test_apply_keeps_length_and_dtype(self):
+        _, vocoder = self.build_vocoders()
+
+        result = vocoder.apply(self.audio.copy())
+
+        self.assertEqual(len(self.audio), len(result))
+        self.assertEqual(np.float32, result.signal.dtype)
+
+    @parameterized.expand([(0,), (1,), (1000,)])
+    def test_audio_shorter_than_frame(self, length: int):
+        _, vocoder = self.build_vocoders()
+        audio = self.audio.copy(signal=self.audio.signal[:length])
+
+        result = vocoder.get_wet_signal(audio)
+
+        self.assertEqual(length, len(result))
+
+    def test_drops_bands_above_nyquist_with_warning(self):
+        vocoder = Vocoder.build(bands=10, max_freq=12000, engine="stft")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = vocoder.get_wet_signal(self.audio)
+
+        self.assertIn("too low for Vocoder", str(caught[0].message))
+        self.assertEqual(len(self.audio), len(result))
+
+    def test_does_not_support_streaming(self):
+        iir_vocoder, stft_vocoder = self.build_vocoders(bands=10)
+
+        self.assertTrue(iir_vocoder.supports_streaming)
+        self.assertFalse(stft_vocoder.supports_streaming)
+        with self.assertRaises(NotImplementedError):
+            stft_vocoder.process_block(self.audio)
+
+    def test_engine_is_part_of_fingerprint(self):
+        iir_vocoder, stft_vocoder = self.build_vocoders(bands=10)
+
+        self.assertNotEqual(iir_vocoder.fingerprint(), stft_vocoder.fingerprint())
+
+    def test_unsupported_engine_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            Vocoder.build(engine="fft")
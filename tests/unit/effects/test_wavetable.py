@@ -0,0 +1,193 @@
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.audio import Audio
+from voicebox.effects import RingMod, Vocoder
+from voicebox.effects.vocoder import _carrier_cache, clear_carrier_cache, sawtooth_wave
+from voicebox.effects.wavetable import (
+    Wavetable,
+    WavetableWave,
+    WavetableWaveFunc,
+    get_wavetable,
+)
+
+SAMPLE_RATE = 16_000
+WAVEFORMS = [("sine",), ("sawtooth",), ("square",), ("triangle",)]
+
+
+def get_times(length: int = SAMPLE_RATE) -> np.ndarray:
+    return np.arange(length) * (1.0 / SAMPLE_RATE)
+
+
+def get_aliasing(signal: np.ndarray, freq: int) -> float:
+    """
+    Returns the fraction of the power of a 1 second signal that is not at a
+    harmonic of the integer frequency below the Nyquist frequency.
+    """
+
+    power = np.abs(np.fft.rfft(signal)) ** 2
+    harmonics = np.arange(0, len(power), freq)
+    return 1 - power[harmonics].sum() / power.sum()
+
+
+class WavetableTest(unittest.TestCase):
+    def test_sine_table_is_sine(self):
+        wavetable = Wavetable.build("sine", size=256)
+
+        expected = np.sin(2 * np.pi * np.arange(257) / 256)
+        for table in wavetable.tables:
+            np.testing.assert_allclose(expected, table, atol=1e-12)
+
+    @parameterized.expand(WAVEFORMS)
+    def test_tables_have_doubling_harmonics(self, waveform: str):
+        wavetable = Wavetable.build(waveform, size=256)
+
+        self.assertEqual((7, 257), wavetable.tables.shape)
+        self.assertEqual(256, wavetable.size)
+        for level, table in enumerate(wavetable.tables):
+            spectrum = np.abs(np.fft.rfft(table[:-1]))
+            self.assertLess(spectrum[2**level + 1 :].max(initial=0), 1e-9)
+            self.assertEqual(table[0], table[-1])
+
+    def test_tables_are_read_only(self):
+        wavetable = get_wavetable("sawtooth")
+
+        self.assertIs(wavetable, get_wavetable("sawtooth"))
+        self.assertFalse(wavetable.tables.flags.writeable)
+
+    def test_build_raises_ValueError_for_unsupported_waveform(self):
+        self.assertRaises(ValueError, Wavetable.build, "noise")
+
+    @parameterized.expand(
+        [
+            ("fundamental only", 0.0, 0),
+            ("nyquist", 0.5, 0),
+            ("above nyquist", 0.6, 0),
+            ("4 harmonics", 0.5 / 4, 2),
+            ("almost 4 harmonics", 0.5 / 3.9, 1),
+            ("most harmonics", 1e-6, 9),
+        ]
+    )
+    def test_lookup_uses_table_below_nyquist(self, name, phase_step, level):
+        wavetable = get_wavetable("sawtooth")
+        phase = np.linspace(0, 3, 100)
+
+        result = wavetable.lookup(phase, phase_step)
+
+        expected = np.interp(phase % 1, np.arange(2049) / 2048, wavetable.tables[level])
+        np.testing.assert_allclose(expected, result, atol=1e-12)
+
+    def test_lookup_with_phase_step_per_phase(self):
+        wavetable = get_wavetable("square")
+        phase = np.linspace(-2, 2, 1000)
+        phase_steps = np.where(np.arange(1000) % 2, 0.01, 0.2)
+
+        result = wavetable.lookup(phase, phase_steps)
+
+        expected = np.where(
+            np.arange(1000) % 2,
+            wavetable.lookup(phase, 0.01),
+            wavetable.lookup(phase, 0.2),
+        )
+        np.testing.assert_allclose(expected, result, atol=1e-12)
+
+
+class WavetableWaveTest(unittest.TestCase):
+    def test_sawtooth_matches_naive_sawtooth_at_low_freq(self):
+        times = get_times()
+
+        result = WavetableWave(50.0)(times)
+
+        expected = sawtooth_wave(2 * np.pi * 50.0 * times)
+        self.assertLess(np.mean(np.abs(expected - result)), 0.01)
+
+    @parameterized.expand(WAVEFORMS)
+    def test_does_not_alias(self, waveform: str):
+        result = WavetableWave(3001.0, waveform)(get_times())
+
+        self.assertLess(get_aliasing(result, 3001), 1e-6)
+
+    def test_aliases_much_less_than_sawtooth_wave(self):
+        times = get_times()
+
+        result = WavetableWave(3001.0)(times)
+
+        naive = sawtooth_wave(2 * np.pi * 3001.0 * times)
+        self.assertGreater(get_aliasing(naive, 3001), 0.1)
+        self.assertLess(get_aliasing(result, 3001), 1e-6)
+
+    @parameterized.expand([(0,), (1,)])
+    def test_short_times(self, length: int):
+        result = WavetableWave(100.0)(get_times(length))
+
+        self.assertEqual(length, len(result))
+
+    def test_single_time_with_dt_matches_longer_times(self):
+        wave = WavetableWave(3001.0)
+        times = get_times(100)
+
+        result = [wave(times[i : i + 1], 1.0 / SAMPLE_RATE) for i in range(100)]
+
+        np.testing.assert_array_equal(wave(times), np.concatenate(result))
+
+    def test_vocoder_caches_carrier(self):
+        clear_carrier_cache()
+        self.addCleanup(clear_carrier_cache)
+        audio = Audio(np.random.default_rng(0).uniform(-1, 1, 4000), SAMPLE_RATE)
+        vocoder = Vocoder.build(
+            carrier_wave_builder=WavetableWave, bands=10, max_freq=7000
+        )
+
+        result = vocoder.apply(audio.copy())
+
+        self.assertEqual(WavetableWave(160.0), vocoder.carrier_wave)
+        self.assertTrue(vocoder.is_deterministic)
+        self.assertEqual(1, len(_carrier_cache))
+        self.assertEqual(len(audio), len(result))
+
+    def test_vocoder_streams_single_samples(self):
+        audio = Audio(np.random.default_rng(0).uniform(-1, 1, 200), SAMPLE_RATE)
+        vocoder = Vocoder.build(
+            carrier_wave_builder=WavetableWave, bands=10, max_freq=7000
+        )
+        blocks = [audio.copy(signal=audio.signal[i : i + 1]) for i in range(200)]
+
+        result = np.concatenate([b.signal for b in vocoder.process_stream(blocks)])
+
+        np.testing.assert_allclose(vocoder.apply(audio.copy()).signal, result)
+
+
+class WavetableWaveFuncTest(unittest.TestCase):
+    @parameterized.expand(WAVEFORMS)
+    def test_matches_wavetable_wave(self, waveform: str):
+        times = get_times()
+
+        result = WavetableWaveFunc(waveform)(2 * np.pi * 440.0 * times)
+
+        expected = WavetableWave(440.0, waveform)(times)
+        np.testing.assert_allclose(expected, result, atol=1e-9)
+
+    def test_ring_mod(self):
+        audio = Audio(np.ones(1000, dtype=np.float32), SAMPLE_RATE)
+        ring_mod = RingMod(440.0, WavetableWaveFunc("square"), dry=0.0, wet=1.0)
+
+        result = ring_mod.apply(audio.copy())
+
+        expected = WavetableWave(440.0, "square")(get_times(1000))
+        self.assertEqual(np.float32, result.signal.dtype)
+        np.testing.assert_allclose(expected, result.signal, atol=1e-6)
+        self.assertEqual(
+            ring_mod.fingerprint(),
+            RingMod(440.0, WavetableWaveFunc("square"), 0.0, 1.0).fingerprint(),
+        )
+
+    def test_ring_mod_streams_single_samples(self):
+        audio = Audio(np.ones(100, dtype=np.float32), SAMPLE_RATE)
+        ring_mod = RingMod(3001.0, WavetableWaveFunc(), dry=0.0, wet=1.0)
+        blocks = [audio.copy(signal=audio.signal[i : i + 1]) for i in range(100)]
+
+        result = np.concatenate([b.signal for b in ring_mod.process_stream(blocks)])
+
+        np.testing.assert_allclose(ring_mod.apply(audio.copy()).signal, result)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 from voicebox.sinks.sink import Sink
 
@@ -17,3 +17,16 @@ class SinkTest(TestCase):
         sink(audio)
 
         sink.play.assert_called_once_with(audio)
+
+    def test_play_stream_plays_each_block(self):
+        class TestSink(Sink):
+            def play(self, audio_):
+                pass
+
+        sink = TestSink()
+        sink.play = Mock()
+        blocks = [Mock(), Mock()]
+
+        sink.play_stream(iter(blocks))
+
+        self.assertEqual([call(blocks[0]), call(blocks[1])], sink.play.mock_calls)
@@ -1,10 +1,21 @@
 import unittest
+from threading import Thread
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
 from parameterized import parameterized
 
 from unit.utils import build_audio
-from voicebox.sinks.sounddevice import SoundDevice, Device, Latency
+from voicebox.audio import Audio
+from voicebox.sinks.sounddevice import (
+    SoundDevice,
+    SoundDeviceStream,
+    Device,
+    Latency,
+    _LinearResampler,
+    _RingBuffer,
+)
 
 
 class SoundDeviceTest(unittest.TestCase):
@@ -44,3 +55,281 @@ class SoundDeviceTest(unittest.TestCase):
         self.assertEqual(blocking, mock_call.kwargs["blocking"])
         self.assertEqual(device, mock_call.kwargs["device"])
         self.assertEqual(latency, mock_call.kwargs["latency"])
+
+    @patch("voicebox.sinks.sounddevice.sd")
+    def test_play_stream_writes_blocks_to_one_output_stream(self, mock_sd):
+        stream = self.setup_output_stream(mock_sd)
+        blocks = [build_audio(3, 16_000), build_audio(5, 16_000)]
+
+        sink = SoundDevice("some-device", latency="low")
+        sink.play_stream(iter(blocks))
+
+        mock_sd.OutputStream.assert_called_once_with(
+            samplerate=16_000,
+            channels=1,
+            dtype="float32",
+            device="some-device",
+            latency="low",
+        )
+
+        stream.start.assert_called_once()
+        self.assertEqual(2, len(stream.write.mock_calls))
+        for block, mock_call in zip(blocks, stream.write.mock_calls):
+            (data,) = mock_call.args
+            self.assertEqual((len(block), 1), data.shape)
+            self.assertEqual(np.float32, data.dtype)
+
+    @patch("voicebox.sinks.sounddevice.sd")
+    def test_play_stream_with_no_blocks_does_not_open_stream(self, mock_sd):
+        SoundDevice().play_stream(iter([]))
+        mock_sd.OutputStream.assert_not_called()
+
+    @patch("voicebox.sinks.sounddevice.sd")
+    def test_play_stream_reuses_stream_until_closed(self, mock_sd):
+        stream = self.setup_output_stream(mock_sd)
+
+        with SoundDevice() as sink:
+            sink.play_stream([build_audio(3, 16_000)])
+            sink.play_stream([build_audio(3, 16_000)])
+
+            stream.close.assert_not_called()
+
+        mock_sd.OutputStream.assert_called_once()
+        self.assertEqual(2, len(stream.write.mock_calls))
+        stream.close.assert_called_once()
+
+    @patch("voicebox.sinks.sounddevice.sd")
+    def test_play_stream_opens_new_stream_for_new_sample_rate(self, mock_sd):
+        stream = self.setup_output_stream(mock_sd)
+        sink = SoundDevice()
+
+        sink.play_stream([build_audio(3, 16_000)])
+        sink.play_stream([build_audio(3, 8_000)])
+
+        self.assertEqual(2, mock_sd.OutputStream.call_count)
+        self.assertEqual(8_000, mock_sd.OutputStream.call_args.kwargs["samplerate"])
+        stream.close.assert_called_once()
+
+    @patch("voicebox.sinks.sounddevice.sd")
+    def test_play_stream_closes_stream_on_error(self, mock_sd):
+        stream = self.setup_output_stream(mock_sd)
+        stream.write.side_effect = RuntimeError
+        sink = SoundDevice()
+
+        with self.assertRaises(RuntimeError):
+            sink.play_stream([build_audio(3, 16_000)])
+
+        stream.close.assert_called_once()
+        self.assertIsNone(sink._stream)
+
+    @staticmethod
+    def setup_output_stream(mock_sd):
+        stream = mock_sd.OutputStream.return_value
+        stream.samplerate = 16_000
+        stream.active = True
+        stream.latency = 0.0
+        return stream
+
+
+class FakeOutputStream:
+    """Stands in for ``sounddevice.OutputStream``; audio is pulled with ``pull()``."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.started = False
+        self.closed = False
+        self.failed = False
+
+    @property
+    def active(self) -> bool:
+        return self.started and not self.failed
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def close(self):
+        self.closed = True
+
+    def pull(self, frames: int, output_underflow: bool = False) -> np.ndarray:
+        outdata = np.full((frames, 1), np.nan, dtype=np.float32)
+        status = SimpleNamespace(output_underflow=output_underflow)
+        self.kwargs["callback"](outdata, frames, None, status)
+        return outdata[:, 0]
+
+
+class SoundDeviceStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.streams = []
+
+        self.sink = SoundDeviceStream(
+            buffer_seconds=1.0,
+            stream_factory=self.stream_factory,
+        )
+
+    def stream_factory(self, **kwargs) -> FakeOutputStream:
+        self.streams.append(FakeOutputStream(**kwargs))
+        return self.streams[-1]
+
+    def test_constructor_defaults(self):
+        sink = SoundDeviceStream()
+        self.assertIsNone(sink.sample_rate)
+        self.assertIsNone(sink.device)
+        self.assertFalse(sink.blocking)
+        self.assertEqual(0.1, sink.latency)
+        self.assertEqual(2.0, sink.buffer_seconds)
+        self.assertEqual(5.0, sink.stall_timeout)
+        self.assertIsNone(sink.stream_factory)
+
+    def test_play_opens_one_persistent_stream(self):
+        self.sink.play(Audio(np.float32([0.1, 0.2]), 8))
+        self.sink.play(Audio(np.float32([0.3]), 8))
+
+        (stream,) = self.streams
+        self.assertTrue(stream.started)
+        self.assertEqual(8, stream.kwargs["samplerate"])
+        self.assertEqual(1, stream.kwargs["channels"])
+        self.assertEqual("float32", stream.kwargs["dtype"])
+
+        np.testing.assert_allclose([0.1, 0.2, 0.3, 0.0], stream.pull(4))
+
+    def test_play_resamples_to_stream_sample_rate(self):
+        self.sink.sample_rate = 8
+        self.sink.play(Audio(np.float32([0.0, 0.2, 0.4, 0.6]), 4))
+
+        (stream,) = self.streams
+        self.assertEqual(8, stream.kwargs["samplerate"])
+        np.testing.assert_allclose(
+            [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6], stream.pull(7), atol=1e-7
+        )
+
+    def test_blocking_play_waits_while_buffer_is_full(self):
+        self.sink.blocking = True
+        self.sink.buffer_seconds = 0.5
+        audio = Audio(np.arange(1, 21, dtype=np.float32) / 20, 8)
+
+        thread = Thread(target=self.sink.play, args=(audio,))
+        thread.start()
+
+        pulled = []
+        while thread.is_alive() or not pulled:
+            if self.streams:
+                pulled.append(self.streams[0].pull(2))
+            thread.join(0.001)
+
+        result = np.concatenate(pulled)
+        self.assertLess(self.sink._ring_buffer.capacity, len(audio))
+        np.testing.assert_array_equal(audio.signal, result[result != 0])
+
+    def test_play_returns_once_audio_is_queued(self):
+        self.sink.play(Audio(np.float32([0.1, 0.2]), 8))
+        self.sink.play(Audio(np.float32([0.3]), 8))
+
+        # Nothing was played yet, and the audios are back-to-back
+        np.testing.assert_allclose([0.1, 0.2, 0.3], self.streams[0].pull(3))
+
+    def test_blocking_play_stops_waiting_if_stream_stops(self):
+        self.sink.blocking = True
+
+        def stream_factory(**kwargs):
+            stream = self.stream_factory(**kwargs)
+            stream.failed = True
+            return stream
+
+        self.sink.stream_factory = stream_factory
+
+        self.sink.play(Audio(np.float32([0.1]), 8))
+
+    def test_blocking_play_raises_TimeoutError_if_stream_stalls(self):
+        self.sink.blocking = True
+        self.sink.stall_timeout = 0.02
+
+        with self.assertRaises(TimeoutError):
+            self.sink.play(Audio(np.float32([0.1]), 8))
+
+    def test_play_raises_RuntimeError_if_stream_stops_with_full_buffer(self):
+        self.sink.play(Audio(np.float32([0.1]), 8))
+        self.streams[0].failed = True
+
+        with self.assertRaises(RuntimeError):
+            self.sink.play(Audio(np.zeros(20, dtype=np.float32), 8))
+
+        self.assertTrue(self.streams[0].closed)
+
+        # The next audio opens a new stream
+        self.sink.play(Audio(np.float32([0.2]), 8))
+        self.assertEqual(2, len(self.streams))
+
+    def test_underruns_are_counted_only_while_producing(self):
+        self.sink.play(Audio(np.float32([0.1]), 8))
+        stream = self.streams[0]
+
+        stream.pull(4)
+        self.assertEqual(0, self.sink.underrun_count)
+
+        def blocks():
+            yield Audio(np.float32([0.1]), 8)
+            stream.pull(4)
+            yield Audio(np.float32([0.2]), 8)
+
+        self.sink.play_stream(blocks())
+
+        self.assertEqual(1, self.sink.underrun_count)
+        self.assertEqual(3, self.sink.underrun_frames)
+
+    def test_output_underflows_are_counted(self):
+        self.sink.play(Audio(np.float32([0.1]), 8))
+
+        self.streams[0].pull(1, output_underflow=True)
+
+        self.assertEqual(1, self.sink.output_underflow_count)
+
+    def test_close_stops_and_closes_stream(self):
+        with self.sink:
+            self.sink.play(Audio(np.float32([]), 8))
+
+        (stream,) = self.streams
+        self.assertFalse(stream.started)
+        self.assertTrue(stream.closed)
+
+
+class RingBufferTest(unittest.TestCase):
+    def test_write_and_read_wrap_around(self):
+        ring_buffer = _RingBuffer(4)
+
+        self.assertEqual(3, ring_buffer.write(np.float32([1, 2, 3])))
+        out = np.zeros(2, dtype=np.float32)
+        self.assertEqual(2, ring_buffer.read_into(out))
+        np.testing.assert_array_equal([1, 2], out)
+
+        self.assertEqual(3, ring_buffer.write(np.float32([4, 5, 6, 7])))
+        self.assertEqual(4, ring_buffer.readable())
+
+        out = np.zeros(5, dtype=np.float32)
+        self.assertEqual(4, ring_buffer.read_into(out))
+        np.testing.assert_array_equal([3, 4, 5, 6, 0], out)
+
+
+class LinearResamplerTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (16_000, 24_000, [1000]),
+            (24_000, 16_000, [1000]),
+            (22_050, 48_000, [1, 333, 100, 566]),
+            (48_000, 22_050, [7, 993]),
+        ]
+    )
+    def test_blocks_match_whole_signal(self, in_rate, out_rate, block_sizes):
+        signal = np.sin(np.arange(sum(block_sizes)) * 0.01)
+
+        whole = _LinearResampler(in_rate, out_rate).process(signal)
+
+        resampler = _LinearResampler(in_rate, out_rate)
+        blocks = np.split(signal, np.cumsum(block_sizes)[:-1])
+        result = np.concatenate([resampler.process(b) for b in blocks])
+
+        np.testing.assert_allclose(whole, result, atol=1e-9)
+        expected_len = len(signal) * out_rate / in_rate
+        self.assertAlmostEqual(expected_len, len(whole), delta=out_rate / in_rate + 1)
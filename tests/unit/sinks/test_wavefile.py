@@ -1,4 +1,5 @@
 import unittest
+import wave
 from io import BytesIO
 from unittest.mock import Mock, patch
 
@@ -7,7 +8,7 @@ from parameterized import parameterized
 
 from voicebox.audio import Audio
 from voicebox.sinks.wavefile import WaveFile, write_audio_to_wav
-from voicebox.tts.utils import get_audio_from_wav_file
+from voicebox.tts.utils import get_audio_from_wav_file, sample_width_to_dtype
 
 
 class WaveFileTest(unittest.TestCase):
@@ -68,3 +69,23 @@ class WriteAudioToWavTest(unittest.TestCase):
         )
 
         self.assertEqual(result, expected_audio)
+
+    @parameterized.expand([(1,), (2,)])
+    def test_float32_and_float64_signals_differ_by_at_most_1_lsb(self, sample_width):
+        signal = np.random.default_rng(0).uniform(-1, 1, 10_000)
+
+        samples = []
+        for dtype in (np.float32, np.float64):
+            audio = Audio(signal.astype(dtype), 44100)
+
+            with BytesIO() as file:
+                write_audio_to_wav(audio, file, sample_width=sample_width)
+                file.seek(0)
+
+                with wave.open(file, "rb") as wav_file:
+                    frames = wav_file.readframes(-1)
+
+            dtype = sample_width_to_dtype[sample_width]
+            samples.append(np.frombuffer(frames, dtype=dtype).astype(np.int64))
+
+        np.testing.assert_array_less(np.abs(samples[0] - samples[1]), 2)
@@ -1,10 +1,19 @@
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from parameterized import parameterized
 
 from unit.utils import build_audio
-from voicebox.audio import Audio
+from voicebox.audio import (
+    Audio,
+    PcmAudio,
+    get_default_dtype,
+    pcm_to_float32,
+    resolve_dtype,
+    set_default_dtype,
+)
 
 
 class AudioTest(unittest.TestCase):
@@ -96,3 +105,132 @@ class AudioTest(unittest.TestCase):
         self.assertEqual(0, audio.len_bytes)
         self.assertEqual(0, audio.len_seconds)
         self.assertEqual(0, len(audio))
+
+
+class AudioDtypeTest(unittest.TestCase):
+    def setUp(self):
+        self.audio = Audio(np.float32([0.0, 0.5, -1.0]), 8000)
+
+    def test_dtype(self):
+        self.assertEqual(np.float32, self.audio.dtype)
+
+    def test_astype_same_dtype_returns_self(self):
+        self.assertIs(self.audio, self.audio.astype(np.float32))
+        self.assertIs(self.audio, self.audio.astype())
+
+    def test_astype_other_dtype_returns_converted_copy(self):
+        result = self.audio.astype(np.float64)
+
+        self.assertEqual(np.float64, result.dtype)
+        self.assertEqual(self.audio, result)
+        self.assertEqual(np.float32, self.audio.dtype)
+
+    def test_astype_int_raises_ValueError(self):
+        self.assertRaises(ValueError, self.audio.astype, np.int16)
+
+    def test_default_dtype(self):
+        self.assertEqual(np.float32, get_default_dtype())
+        self.addCleanup(set_default_dtype, get_default_dtype())
+
+        set_default_dtype("float64")
+
+        self.assertEqual(np.float64, get_default_dtype())
+        self.assertEqual(np.float64, resolve_dtype(None))
+        self.assertEqual(np.float64, self.audio.astype().dtype)
+
+    def test_set_default_dtype_int_raises_ValueError(self):
+        self.assertRaises(ValueError, set_default_dtype, np.int16)
+        self.assertEqual(np.float32, get_default_dtype())
+
+
+class PcmAudioTest(unittest.TestCase):
+    def setUp(self):
+        self.samples = np.int16([0, 16384, -32768, 32767])
+        self.audio = PcmAudio(self.samples, 8000)
+
+    def test_samples_are_converted_on_first_signal_access(self):
+        self.assertEqual(4, len(self.audio))
+        self.assertEqual(8, self.audio.len_bytes)
+        self.assertIs(self.samples, self.audio.samples)
+
+        signal = self.audio.signal
+
+        np.testing.assert_array_equal(pcm_to_float32(self.samples), signal)
+        self.assertIs(signal, self.audio.signal)
+        self.assertIsNone(self.audio.samples)
+        self.assertEqual(16, self.audio.len_bytes)
+
+    def test_first_signal_access_from_threads_converts_once(self):
+        for _ in range(20):
+            audio = PcmAudio(np.zeros(100_000, dtype=np.int16), 8000)
+            barrier = threading.Barrier(8)
+
+            def get_signal():
+                barrier.wait()
+                return audio.signal
+
+            with ThreadPoolExecutor(8) as executor:
+                signals = list(executor.map(lambda _: get_signal(), range(8)))
+
+            for signal in signals:
+                self.assertIs(audio.signal, signal)
+
+    def test_astype_float32_keeps_samples(self):
+        self.assertIs(self.audio, self.audio.astype(np.float32))
+        self.assertIs(self.samples, self.audio.samples)
+
+    def test_set_signal(self):
+        signal = np.float32([0.1, 0.2])
+
+        self.audio.signal = signal
+
+        self.assertIs(signal, self.audio.signal)
+        self.assertIsNone(self.audio.samples)
+        self.assertEqual(2, len(self.audio))
+
+    def test_equals_converted_audio(self):
+        expected = Audio(pcm_to_float32(self.samples), 8000)
+        self.assertEqual(expected, self.audio)
+
+    def test_copy_keeps_samples(self):
+        copy = self.audio.copy(sample_rate=16_000)
+
+        self.assertIsInstance(copy, PcmAudio)
+        self.assertIsNot(self.samples, copy.samples)
+        np.testing.assert_array_equal(self.samples, copy.samples)
+        self.assertEqual(16_000, copy.sample_rate)
+        self.assertIs(self.samples, self.audio.samples)
+
+    def test_copy_with_new_signal_returns_Audio(self):
+        signal = np.float32([0.1, 0.2])
+
+        copy = self.audio.copy(signal=signal)
+
+        self.assertIs(Audio, type(copy))
+        self.assertIs(signal, copy.signal)
+
+
+class PcmToFloat32Test(unittest.TestCase):
+    @parameterized.expand([(np.int8,), (np.int16,), (np.int32,)])
+    def test_matches_float64_conversion(self, dtype):
+        info = np.iinfo(dtype)
+        rng = np.random.default_rng(0)
+        samples = rng.integers(info.min, info.max, 10_000, dtype=dtype)
+        samples[:2] = info.min, info.max
+
+        result = pcm_to_float32(samples)
+
+        expected = (samples.astype(float) / -float(info.min)).astype(np.float32)
+        self.assertEqual(np.float32, result.dtype)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_writes_to_out(self):
+        out = np.empty(3, dtype=np.float32)
+
+        result = pcm_to_float32(np.int16([0, 16384, -32768]), out=out)
+
+        self.assertIs(out, result)
+        np.testing.assert_array_equal([0.0, 0.5, -1.0], out)
+
+    def test_raises_ValueError_for_non_int_samples(self):
+        self.assertRaises(ValueError, pcm_to_float32, np.float32([0.5]))
@@ -0,0 +1,90 @@
+import unittest
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+from parameterized import parameterized
+
+from voicebox.fingerprint import fingerprint, stable_repr
+from voicebox.ssml import SSML
+
+
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+
+
+@dataclass
+class Config:
+    name: str
+    values: list
+
+
+class WithFingerprint:
+    def __init__(self, value: str):
+        self.value = value
+
+    def fingerprint(self) -> str:
+        return self.value
+
+
+def module_function():
+    pass
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_is_sha256_hex_digest(self):
+        result = fingerprint("foo")
+
+        self.assertEqual(64, len(result))
+        int(result, 16)
+
+    def test_equal_values_have_equal_fingerprints(self):
+        self.assertEqual(
+            fingerprint(Config("a", [1, 2.0]), {"x": 1, "y": np.arange(3)}),
+            fingerprint(Config("a", [1, 2.0]), {"y": np.arange(3), "x": 1}),
+        )
+
+    @parameterized.expand(
+        [
+            ("str vs SSML", "foo", SSML("foo")),
+            ("int vs float", 1, 1.0),
+            ("int vs bool", 1, True),
+            ("list vs tuple", [1], (1,)),
+            ("enum members", Color.RED, Color.BLUE),
+            ("array dtype", np.zeros(3, np.float32), np.zeros(3, np.float64)),
+            ("array shape", np.zeros((2, 3)), np.zeros((3, 2))),
+            ("array values", np.zeros(3), np.ones(3)),
+            ("dataclass fields", Config("a", [1]), Config("a", [2])),
+            ("fingerprint method", WithFingerprint("a"), WithFingerprint("b")),
+            ("functions", np.sin, np.cos),
+            ("numpy functions", np.sum, np.mean),
+            ("None vs str", None, "None"),
+        ]
+    )
+    def test_different_values_have_different_fingerprints(self, name, a, b):
+        self.assertNotEqual(fingerprint(a), fingerprint(b))
+
+    def test_set_order_does_not_matter(self):
+        self.assertEqual(stable_repr({"b", "a", "c"}), stable_repr({"c", "a", "b"}))
+
+    def test_numpy_scalar_equals_python_scalar(self):
+        self.assertEqual(stable_repr(3), stable_repr(np.int64(3)))
+
+    def test_module_function(self):
+        self.assertIn("module_function", stable_repr(module_function))
+
+    @parameterized.expand(
+        [
+            ("object", object()),
+            ("lambda", lambda: None),
+            ("bound method", WithFingerprint("a").fingerprint),
+            ("nested unsupported", [1, {"a": object()}]),
+        ]
+    )
+    def test_unsupported_values_raise_TypeError(self, name, value):
+        self.assertRaises(TypeError, fingerprint, value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
 import unittest
 from unittest.mock import Mock, call
 
+import numpy as np
+
 from unit.utils import assert_called_with_exactly, build_audio
 from voicebox.effects.normalize import Normalize
 from voicebox.sinks.sounddevice import SoundDevice
 from voicebox.tts.picotts import PicoTTS
+from voicebox.voiceboxes.cache import EffectsCache
 from voicebox.voiceboxes.simple import SimpleVoicebox
 
 
@@ -37,6 +40,7 @@ class SimpleVoiceboxTest(unittest.TestCase):
         self.assertIsInstance(effects[0], Normalize)
 
         self.assertIsInstance(voicebox.sink, SoundDevice)
+        self.assertIsNone(voicebox.effects_cache)
 
     def test_say(self):
         self.voicebox.say("foo")
@@ -55,3 +59,26 @@ class SimpleVoiceboxTest(unittest.TestCase):
         assert_called_with_exactly(
             self.sink.play, [call(self.foo_audio), call(self.bar_audio)]
         )
+
+    def test_say_with_effects_cache(self):
+        effects_cache = EffectsCache({})
+        voicebox = SimpleVoicebox(
+            self.tts, [Normalize()], self.sink, effects_cache=effects_cache
+        )
+
+        voicebox.say("foo")
+        voicebox.say("foo")
+
+        self.tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual(2, self.sink.play.call_count)
+        self.assertEqual(1, effects_cache.stats.hits)
+
+    def test_say_converts_audio_to_dtype(self):
+        for dtype, expected in [(None, np.float32), (np.float64, np.float64)]:
+            self.sink.reset_mock()
+            voicebox = SimpleVoicebox(self.tts, [Normalize()], self.sink, dtype=dtype)
+
+            voicebox.say("foo")
+
+            (audio,) = self.sink.play.call_args.args
+            self.assertEqual(expected, audio.dtype)
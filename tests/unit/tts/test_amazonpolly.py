@@ -5,6 +5,7 @@ import numpy as np
 from mypy_boto3_polly.literals import VoiceIdType
 
 from unit.utils import build_audio
+from voicebox.audio import PcmAudio
 from voicebox.ssml import SSML
 from voicebox.tts.amazonpolly import AmazonPolly
 
@@ -32,6 +33,7 @@ class AmazonPollyTest(unittest.TestCase):
         self.assertIsNone(self.tts.language_code)
         self.assertIsNone(self.tts.lexicon_names)
         self.assertEqual(16000, self.tts.sample_rate)
+        self.assertEqual(4096, self.tts.stream_chunk_size)
 
     def test_constructor(self):
         lexicon_names = ["lex", "names"]
@@ -107,3 +109,44 @@ class AmazonPollyTest(unittest.TestCase):
         mock_get_audio_from_samples.assert_called_once()
         mock_call = mock_get_audio_from_samples.mock_calls[0]
         np.testing.assert_allclose(mock_call.args[0], self.samples)
+
+    def test_get_speech_with_lazy_audio_returns_PcmAudio(self):
+        self.tts.lazy_audio = True
+
+        result = self.tts.get_speech("foo")
+
+        self.assertIsInstance(result, PcmAudio)
+        np.testing.assert_array_equal(self.samples, result.samples)
+
+    def test_stream_speech_yields_audio_per_chunk(self):
+        audio_stream = self.client.synthesize_speech.return_value["AudioStream"]
+        data = self.samples.tobytes()
+        audio_stream.iter_chunks.return_value = iter([data[:4], data[4:]])
+
+        self.tts = AmazonPolly(self.client, self.voice_id, stream_chunk_size=2)
+
+        result = list(self.tts.stream_speech("foo"))
+
+        self.assertEqual([2, 3], [len(a) for a in result])
+        np.testing.assert_allclose(
+            self.samples / 32768, np.concatenate([a.signal for a in result])
+        )
+        self.assertEqual({16000}, {a.sample_rate for a in result})
+
+        audio_stream.iter_chunks.assert_called_once_with(4)
+        audio_stream.close.assert_called_once()
+        self.client.synthesize_speech.assert_called_once_with(
+            OutputFormat="pcm",
+            Text="foo",
+            VoiceId=self.voice_id,
+            SampleRate="16000",
+            TextType="text",
+        )
+
+    def test_fingerprint_changes_with_settings(self):
+        fingerprint = self.tts.fingerprint()
+
+        self.assertEqual(fingerprint, AmazonPolly(Mock(), self.voice_id).fingerprint())
+
+        self.tts.engine = "neural"
+        self.assertNotEqual(fingerprint, self.tts.fingerprint())
@@ -1,13 +1,31 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Mapping
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import cachetools
+import numpy as np
 from parameterized import parameterized
 
 from unit.utils import assert_called_with_exactly, build_audio
 from voicebox.audio import Audio
-from voicebox.tts.cache import CachedTTS
+from voicebox.fingerprint import stable_repr
+from voicebox.ssml import SSML
+from voicebox.tts import ESpeakNG
+from voicebox.tts.cache import (
+    CachedTTS,
+    CacheStats,
+    DiskCache,
+    fingerprint_key,
+    text_key,
+)
 from voicebox.tts.cache import PrerecordedTTS
 
 
@@ -122,10 +140,436 @@ class CachedTTSTest(unittest.TestCase):
 
         self.assertRaises(ValueError, tts.get_speech, "foo")
 
+    def test_stream_speech_caches_full_audio_once_stream_completes(self):
+        chunks = [
+            Audio(np.float32([0.1, 0.2]), 1),
+            Audio(np.float32([0.3]), 1),
+        ]
+        self.mock_tts.stream_speech.return_value = iter(chunks)
+        cache = {}
+
+        tts = CachedTTS(self.mock_tts, cache)
+
+        stream = tts.stream_speech("foo")
+        first = next(stream)
+        self.assertIs(chunks[0], first)
+        self.assertDictEqual({}, cache)
+
+        # Chunks modified downstream must not affect the cached audio
+        first.signal *= 0
+        self.assertEqual([chunks[1]], list(stream))
+
+        expected = Audio(np.float32([0.1, 0.2, 0.3]), 1)
+        self.assertEqual({"foo": expected}, cache)
+
+        self.assertEqual([expected], list(tts.stream_speech("foo")))
+        self.mock_tts.stream_speech.assert_called_once_with("foo")
+
+    def test_build_with_key_func(self):
+        tts = CachedTTS.build(self.mock_tts, key_func=fingerprint_key)
+        self.assertIs(fingerprint_key, tts.key_func)
+
+    def test_key_func_defaults_to_text_key(self):
+        tts = CachedTTS(self.mock_tts, {})
+        self.assertIs(text_key, tts.key_func)
+
+    def test_get_speech_with_fingerprint_key(self):
+        foo_audio = build_audio(1)
+        self.setup_mock_tts({"foo": foo_audio})
+        self.mock_tts.fingerprint.return_value = "v1"
+        cache = {}
+
+        tts = CachedTTS(self.mock_tts, cache, key_func=fingerprint_key)
+
+        tts.get_speech("foo")
+        tts.get_speech("foo")
+        self.assertDictEqual({("v1", "foo"): foo_audio}, cache)
+        self.mock_tts.get_speech.assert_called_once_with("foo")
+
+        # A changed setting changes the fingerprint, so the cache is missed
+        self.mock_tts.fingerprint.return_value = "v2"
+        tts.get_speech("foo")
+        self.assertEqual({("v1", "foo"), ("v2", "foo")}, set(cache))
+        self.assertEqual(2, self.mock_tts.get_speech.call_count)
+
+    def test_fingerprint_delegates_to_tts(self):
+        self.mock_tts.fingerprint.return_value = "abc"
+        self.assertEqual("abc", CachedTTS(self.mock_tts, {}).fingerprint())
+
+    def test_stats_count_hits_and_misses(self):
+        self.setup_mock_tts({"foo": build_audio(1), "bar": build_audio(2)})
+        tts = CachedTTS(self.mock_tts, {})
+
+        tts.get_speech("foo")
+        tts.get_speech("foo")
+        tts.get_speech("bar")
+        list(tts.stream_speech("foo"))
+
+        self.assertEqual(CacheStats(hits=2, misses=2, coalesced=0), tts.stats)
+
     def setup_mock_tts(self, texts_to_audios: Mapping[str, Audio]) -> None:
         self.mock_tts.get_speech.side_effect = lambda text: texts_to_audios[text]
 
 
+class CachedTTSThreadSafeTest(unittest.TestCase):
+    def setUp(self):
+        self.audio = build_audio(10)
+        self.release = threading.Event()
+
+        def get_speech(text):
+            self.release.wait(timeout=5)
+            return self.audio
+
+        self.mock_tts = Mock()
+        self.mock_tts.get_speech.side_effect = get_speech
+
+        self.tts = CachedTTS(self.mock_tts, {}, thread_safe=True)
+
+    def test_build_with_thread_safe(self):
+        self.assertTrue(CachedTTS.build(Mock(), thread_safe=True).thread_safe)
+        self.assertFalse(CachedTTS.build(Mock()).thread_safe)
+
+    def test_concurrent_misses_for_same_key_call_tts_once(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self.tts.get_speech, "foo") for _ in range(8)]
+            self.wait_for_coalesced(7)
+            self.release.set()
+
+            results = [future.result() for future in futures]
+
+        for result in results:
+            self.assertIs(self.audio, result)
+
+        self.mock_tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual(CacheStats(hits=0, misses=1, coalesced=7), self.tts.stats)
+
+        self.tts.get_speech("foo")
+        self.assertEqual(1, self.tts.stats.hits)
+
+    def test_concurrent_misses_for_different_keys_are_not_coalesced(self):
+        self.release.set()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(self.tts.get_speech, ["a", "b", "c", "d"]))
+
+        self.assertEqual(4, self.mock_tts.get_speech.call_count)
+        self.assertEqual(CacheStats(hits=0, misses=4, coalesced=0), self.tts.stats)
+
+    def test_exception_is_shared_with_coalesced_requests(self):
+        def get_speech(text):
+            self.release.wait(timeout=5)
+            raise RuntimeError("Whoopsiedoodle!")
+
+        self.mock_tts.get_speech.side_effect = get_speech
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.tts.get_speech, "foo") for _ in range(3)]
+            self.wait_for_coalesced(2)
+            self.release.set()
+
+            for future in futures:
+                self.assertRaises(RuntimeError, future.result)
+
+        self.mock_tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual({}, self.tts.cache)
+        self.assertEqual({}, self.tts._in_flight)
+
+    def test_stream_speech_coalesces_with_get_speech(self):
+        chunks = [
+            Audio(np.float32([0.1, 0.2]), 1),
+            Audio(np.float32([0.3]), 1),
+        ]
+        self.mock_tts.stream_speech.return_value = iter(chunks)
+
+        stream = self.tts.stream_speech("foo")
+        self.assertIs(chunks[0], next(stream))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.tts.get_speech, "foo")
+            self.wait_for_coalesced(1)
+
+            self.assertEqual([chunks[1]], list(stream))
+            result = future.result()
+
+        self.assertEqual(Audio(np.float32([0.1, 0.2, 0.3]), 1), result)
+        self.mock_tts.get_speech.assert_not_called()
+
+    def test_stream_closed_early_lets_waiters_generate_audio(self):
+        self.release.set()
+        self.mock_tts.stream_speech.return_value = iter([build_audio(1)] * 2)
+
+        stream = self.tts.stream_speech("foo")
+        next(stream)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.tts.get_speech, "foo")
+            self.wait_for_coalesced(1)
+            stream.close()
+
+            self.assertIs(self.audio, future.result())
+
+        self.mock_tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual({"foo": self.audio}, self.tts.cache)
+
+    def test_thread_safe_cache_is_written_outside_lock(self):
+        writing = threading.Event()
+
+        class SlowCache(dict):
+            thread_safe = True
+
+            def __setitem__(cache, key, audio):
+                writing.set()
+                self.release.wait(timeout=5)
+                super().__setitem__(key, audio)
+
+        self.tts.cache = SlowCache(bar=self.audio)
+        self.mock_tts.get_speech.side_effect = lambda text: self.audio
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future = executor.submit(self.tts.get_speech, "foo")
+            writing.wait(timeout=5)
+            coalesced = executor.submit(self.tts.get_speech, "foo")
+            self.wait_for_coalesced(1)
+
+            # Not blocked by the write in progress
+            other = executor.submit(self.tts.get_speech, "bar")
+            self.assertIs(self.audio, other.result(timeout=1))
+
+            self.release.set()
+            self.assertIs(self.audio, future.result())
+            self.assertIs(self.audio, coalesced.result())
+
+        self.mock_tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual(CacheStats(hits=1, misses=1, coalesced=1), self.tts.stats)
+
+    def wait_for_coalesced(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while self.tts.stats.coalesced < count:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+
+class CachedTTSBuildOnDiskTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name)
+
+    def test_build_on_disk_defaults(self):
+        tts = ESpeakNG()
+
+        cached_tts = CachedTTS.build_on_disk(tts, self.path, max_bytes=1000)
+
+        self.assertIs(tts, cached_tts.tts)
+        self.assertIsInstance(cached_tts.cache, DiskCache)
+        self.assertEqual(self.path, cached_tts.cache.path)
+        self.assertEqual(1000, cached_tts.cache.max_bytes)
+        self.assertEqual("", cached_tts.cache.namespace)
+        self.assertIs(fingerprint_key, cached_tts.key_func)
+
+    def test_get_speech_persists_across_instances(self):
+        audio = Audio(np.float32([0.1, -0.2, 0.3]), 8000)
+        tts = Mock()
+        tts.fingerprint.return_value = "abc"
+        tts.get_speech.return_value = audio
+
+        CachedTTS.build_on_disk(tts, self.path).get_speech("foo")
+        result = CachedTTS.build_on_disk(tts, self.path).get_speech("foo")
+
+        self.assertEqual(audio, result)
+        tts.get_speech.assert_called_once_with("foo")
+
+    def test_tts_config_change_is_a_cache_miss(self):
+        tts = ESpeakNG()
+        cached_tts = CachedTTS.build_on_disk(tts, self.path)
+        cached_tts.cache[fingerprint_key(tts, "foo")] = build_audio(1)
+
+        tts.config.speed = 200
+
+        self.assertNotIn(fingerprint_key(tts, "foo"), cached_tts.cache)
+
+
+def set_disk_cache_items(path: str, worker: int) -> None:
+    cache = DiskCache(path, max_bytes=10 * 400)
+    for i in range(20):
+        cache[f"{worker}-{i}"] = Audio(np.full(100, worker, dtype=np.float32), 8000)
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "cache"
+
+        self.cache = DiskCache(self.path, max_bytes=1000)
+        self.audio = Audio(np.float32([0.1, -0.2, 0.3]), 8000)
+
+    def test_set_and_get(self):
+        self.cache["foo"] = self.audio
+
+        result = DiskCache(self.path)["foo"]
+
+        self.assertEqual(self.audio, result)
+        self.assertEqual(np.float32, result.signal.dtype)
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(["foo"], list(self.cache))
+
+    def test_get_returns_writable_copy_on_write_signal(self):
+        self.cache["foo"] = self.audio
+
+        result = self.cache["foo"]
+        result.signal *= 0
+
+        self.assertEqual(self.audio, self.cache["foo"])
+
+    def test_get_missing_key_raises_KeyError(self):
+        self.assertRaises(KeyError, self.cache.__getitem__, "foo")
+
+    def test_ssml_and_text_are_different_keys(self):
+        self.cache["foo"] = self.audio
+
+        self.assertNotIn(SSML("foo"), self.cache)
+
+        self.cache[SSML("foo")] = self.audio
+        self.assertEqual({"foo", SSML("foo")}, set(self.cache))
+        self.assertIn(SSML, {type(key) for key in self.cache})
+
+    def test_tuple_keys(self):
+        key = ("abc", SSML("foo"))
+        self.cache[key] = self.audio
+
+        self.assertEqual(self.audio, self.cache[key])
+        self.assertNotIn(("abc", "foo"), self.cache)
+        self.assertNotIn("foo", self.cache)
+        self.assertEqual([key], list(DiskCache(self.path)))
+        self.assertIsInstance(list(self.cache)[0][1], SSML)
+
+    def test_unsupported_key_raises_TypeError(self):
+        with self.assertRaises(TypeError):
+            self.cache[1] = self.audio
+
+    def test_namespaces_do_not_collide(self):
+        self.cache["foo"] = self.audio
+        other = DiskCache(self.path, namespace="other")
+
+        self.assertNotIn("foo", other)
+        self.assertEqual(0, len(other))
+
+    def test_empty_audio(self):
+        self.cache["foo"] = Audio(np.zeros(0, dtype=np.float32), 8000)
+        self.assertEqual(0, len(self.cache["foo"]))
+
+    def test_delete(self):
+        self.cache["foo"] = self.audio
+
+        del self.cache["foo"]
+
+        self.assertNotIn("foo", self.cache)
+        self.assertEqual(["index.sqlite"], [p.name for p in self.path.iterdir()])
+        self.assertRaises(KeyError, self.cache.__delitem__, "foo")
+
+    def test_set_too_large_raises_ValueError(self):
+        with self.assertRaises(ValueError) as context:
+            self.cache["foo"] = Audio(np.zeros(1000, dtype=np.float32), 8000)
+
+        self.assertEqual("value too large", str(context.exception))
+
+    def test_least_recently_used_clips_are_evicted(self):
+        audio = Audio(np.zeros(100, dtype=np.float32), 8000)
+
+        self.cache["a"] = audio
+        self.cache["b"] = audio
+        self.cache["a"]
+        self.cache["c"] = audio
+
+        self.assertEqual({"a", "c"}, set(self.cache))
+        self.assertEqual(800, self.cache.currsize)
+        self.assertEqual(3, len(list(self.path.iterdir())))
+
+    def test_missing_blob_is_treated_as_missing_key(self):
+        self.cache["foo"] = self.audio
+        for path in self.path.glob("*.npy"):
+            path.unlink()
+
+        self.assertRaises(KeyError, self.cache.__getitem__, "foo")
+        self.assertEqual(0, len(self.cache))
+
+    def test_get_does_not_wait_for_write_lock(self):
+        self.cache["foo"] = self.audio
+        self.cache.timeout = 0.1
+        other = sqlite3.connect(self.path / "index.sqlite", isolation_level=None)
+        self.addCleanup(other.close)
+
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            self.assertEqual(self.audio, self.cache["foo"])
+        finally:
+            other.execute("ROLLBACK")
+
+    def test_access_times_are_written_in_batches(self):
+        audio = Audio(np.zeros(100, dtype=np.float32), 8000)
+        self.cache["a"] = audio
+        self.cache["b"] = audio
+        self.cache.access_batch_size = 2
+
+        self.cache["a"]
+        # Not written yet, so another instance evicts "a"
+        other = DiskCache(self.path, max_bytes=1000)
+        other["c"] = audio
+        self.assertEqual({"b", "c"}, set(other))
+
+        # Written once the batch is full, so "c" is now the least recently used
+        self.cache["b"]
+        other["d"] = audio
+        self.assertEqual({"b", "d"}, set(other))
+
+    def test_flush_writes_access_times(self):
+        audio = Audio(np.zeros(100, dtype=np.float32), 8000)
+        self.cache["a"] = audio
+        self.cache["b"] = audio
+
+        self.cache["a"]
+        self.cache.flush()
+        DiskCache(self.path, max_bytes=1000)["c"] = audio
+
+        self.assertEqual({"a", "c"}, set(self.cache))
+
+    def test_old_orphaned_files_are_deleted_on_open(self):
+        self.cache["foo"] = self.audio
+        indexed = list(self.path.glob("*.npy"))
+        old_blob = self.path / ("0" * 64 + ".npy")
+        old_temp = self.path / "abc.tmp"
+        new_blob = self.path / ("1" * 64 + ".npy")
+        for path in [old_blob, old_temp, new_blob]:
+            path.write_bytes(b"")
+        old = time.time() - DiskCache.orphan_age - 1
+        for path in [old_blob, old_temp, *indexed]:
+            os.utime(path, (old, old))
+
+        DiskCache(self.path)
+
+        self.assertFalse(old_blob.exists())
+        self.assertFalse(old_temp.exists())
+        self.assertTrue(new_blob.exists())
+        self.assertEqual(self.audio, self.cache["foo"])
+
+    def test_concurrent_use_from_multiple_processes(self):
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(set_disk_cache_items, [str(self.path)] * 4, range(4)))
+
+        cache = DiskCache(self.path, max_bytes=10 * 400)
+        self.assertEqual(10, len(cache))
+        self.assertLessEqual(cache.currsize, cache.max_bytes)
+
+        for key in cache:
+            worker = int(key.split("-")[0])
+            np.testing.assert_array_equal(worker, cache[key].signal)
+
+        blobs = list(self.path.glob("*.npy"))
+        self.assertEqual(10, len(blobs))
+        self.assertEqual([], list(self.path.glob("*.tmp")))
+
+
 class PrerecordedTTSTest(unittest.TestCase):
     def setUp(self):
         self.foo_audio = build_audio(1)
@@ -164,6 +608,18 @@ class PrerecordedTTSTest(unittest.TestCase):
         self.assertIs(tts.get_speech("bar"), self.bar_audio)
         self.assertRaises(KeyError, tts.get_speech, "baz")
 
+    def test_stream_speech_with_fallback_tts(self):
+        self.fallback_tts.stream_speech.return_value = iter([self.baz_audio])
+
+        tts = PrerecordedTTS(
+            texts_to_audios={"foo": self.foo_audio},
+            fallback_tts=self.fallback_tts,
+        )
+
+        self.assertEqual([self.foo_audio], list(tts.stream_speech("foo")))
+        self.assertEqual([self.baz_audio], list(tts.stream_speech("baz")))
+        self.fallback_tts.stream_speech.assert_called_once_with("baz")
+
     @parameterized.expand([True, False])
     def test_from_tts(self, use_as_fallback: bool):
         self.setup_fallback_tts(
@@ -221,9 +677,111 @@ class PrerecordedTTSTest(unittest.TestCase):
             [call("foo.wav"), call("bar.wav")],
         )
 
+    def test_fingerprint(self):
+        tts = PrerecordedTTS({"foo": self.foo_audio})
+        same = PrerecordedTTS({"foo": self.foo_audio.copy()})
+        other_audio = PrerecordedTTS({"foo": self.bar_audio})
+        other_text = PrerecordedTTS({"bar": self.foo_audio})
+
+        self.fallback_tts.fingerprint.return_value = "abc"
+        with_fallback = PrerecordedTTS({"foo": self.foo_audio}, self.fallback_tts)
+
+        self.assertEqual(tts.fingerprint(), same.fingerprint())
+        self.assertNotEqual(tts.fingerprint(), other_audio.fingerprint())
+        self.assertNotEqual(tts.fingerprint(), other_text.fingerprint())
+        self.assertNotEqual(tts.fingerprint(), with_fallback.fingerprint())
+
+    def test_fingerprint_does_not_rehash_unchanged_clips(self):
+        tts = PrerecordedTTS({"foo": self.foo_audio})
+        expected = tts.fingerprint()
+
+        with patch("voicebox.fingerprint.stable_repr", wraps=stable_repr) as repr_:
+            self.assertEqual(expected, tts.fingerprint())
+
+        self.assertNotIn(call({"foo": self.foo_audio}), repr_.call_args_list)
+        for value in repr_.call_args_list:
+            self.assertNotIsInstance(value.args[0], Audio)
+
+    def test_fingerprint_changes_when_clips_are_replaced_or_added(self):
+        texts_to_audios = {"foo": self.foo_audio}
+        tts = PrerecordedTTS(texts_to_audios)
+        fingerprint = tts.fingerprint()
+
+        texts_to_audios["foo"] = self.bar_audio
+        replaced = tts.fingerprint()
+        self.assertNotEqual(fingerprint, replaced)
+        self.assertEqual(
+            PrerecordedTTS({"foo": self.bar_audio}).fingerprint(), replaced
+        )
+
+        texts_to_audios["bar"] = self.foo_audio
+        self.assertNotEqual(replaced, tts.fingerprint())
+
     def setup_fallback_tts(self, texts_to_audios: Mapping[str, Audio]) -> None:
         self.fallback_tts.get_speech.side_effect = lambda text: texts_to_audios[text]
 
 
+class CachedTTSAsyncTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.audio = build_audio(10)
+        self.release = asyncio.Event()
+
+        async def get_speech_async(text):
+            await self.release.wait()
+            return self.audio
+
+        self.mock_tts = Mock()
+        self.mock_tts.get_speech_async = AsyncMock(side_effect=get_speech_async)
+
+    async def test_get_speech_async_returns_cached_audio(self):
+        self.release.set()
+        tts = CachedTTS(self.mock_tts, {})
+
+        self.assertIs(self.audio, await tts.get_speech_async("foo"))
+        self.assertIs(self.audio, await tts.get_speech_async("foo"))
+
+        self.mock_tts.get_speech_async.assert_awaited_once_with("foo")
+        self.assertEqual(CacheStats(hits=1, misses=1), tts.stats)
+
+    async def test_thread_safe_get_speech_async_coalesces_concurrent_requests(self):
+        tts = CachedTTS(self.mock_tts, {}, thread_safe=True)
+
+        tasks = [asyncio.create_task(tts.get_speech_async("foo")) for _ in range(5)]
+        while tts.stats.coalesced < 4:
+            await asyncio.sleep(0)
+        self.release.set()
+
+        for result in await asyncio.gather(*tasks):
+            self.assertIs(self.audio, result)
+
+        self.mock_tts.get_speech_async.assert_awaited_once_with("foo")
+        self.assertEqual(CacheStats(hits=0, misses=1, coalesced=4), tts.stats)
+
+    async def test_cancelled_request_lets_waiters_generate_audio(self):
+        tts = CachedTTS(self.mock_tts, {}, thread_safe=True)
+
+        leader = asyncio.create_task(tts.get_speech_async("foo"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(tts.get_speech_async("foo"))
+        while tts.stats.coalesced < 1:
+            await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertIs(self.audio, await waiter)
+        self.assertEqual(2, self.mock_tts.get_speech_async.await_count)
+
+    async def test_prerecorded_get_speech_async_with_fallback_tts(self):
+        self.release.set()
+        foo_audio = build_audio(1)
+        tts = PrerecordedTTS({"foo": foo_audio}, fallback_tts=self.mock_tts)
+
+        self.assertIs(foo_audio, await tts.get_speech_async("foo"))
+        self.assertIs(self.audio, await tts.get_speech_async("bar"))
+        self.mock_tts.get_speech_async.assert_awaited_once_with("bar")
+
+
 if __name__ == "__main__":
     unittest.main()
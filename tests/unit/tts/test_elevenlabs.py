@@ -1,9 +1,11 @@
 import unittest
 from unittest.mock import Mock, patch
 
-from elevenlabs.client import ElevenLabs
+import numpy as np
+from elevenlabs.client import AsyncElevenLabs, ElevenLabs
 
 from unit.utils import build_audio
+from voicebox.audio import PcmAudio
 from voicebox.tts.elevenlabs import ElevenLabsTTS
 
 
@@ -89,3 +91,97 @@ class ElevenLabsTest(unittest.TestCase):
         )
 
         mock_get_audio_from_samples.assert_called_once()
+
+    def test_get_speech_with_lazy_audio_returns_PcmAudio(self):
+        samples = np.int16([0, 1024, -2048])
+        self.client.text_to_speech.convert.return_value = samples.tobytes()
+        self.tts.lazy_audio = True
+
+        result = self.tts.get_speech("hello world")
+
+        self.assertIsInstance(result, PcmAudio)
+        np.testing.assert_array_equal(samples, result.samples)
+
+    def test_stream_speech_yields_audio_per_chunk(self):
+        samples = np.int16([0, 1024, -2048]).astype("<i2").tobytes()
+        self.client.text_to_speech.convert.return_value = iter(
+            [samples[:3], samples[3:]]
+        )
+
+        result = list(self.tts.stream_speech("hello world"))
+
+        self.assertEqual([1, 2], [len(a) for a in result])
+        self.assertEqual({self.sample_rate}, {a.sample_rate for a in result})
+        np.testing.assert_allclose(
+            [0.0, 0.03125, -0.0625], np.concatenate([a.signal for a in result])
+        )
+
+        self.client.text_to_speech.convert.assert_called_once_with(
+            voice_id=self.voice_id,
+            text="hello world",
+            output_format="pcm_8000",
+            model_id="model-id",
+        )
+
+    def test_stream_speech_with_bytes_response(self):
+        self.client.text_to_speech.convert.return_value = b"\x00\x04"
+
+        result = list(self.tts.stream_speech("hello world"))
+
+        self.assertEqual(1, len(result))
+        np.testing.assert_allclose([0.03125], result[0].signal)
+
+    def test_fingerprint_changes_with_settings(self):
+        fingerprint = self.tts.fingerprint()
+
+        self.tts.convert_kwargs = dict(model_id="other-model-id")
+        self.assertNotEqual(fingerprint, self.tts.fingerprint())
+
+
+class ElevenLabsAsyncTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.async_client = Mock(AsyncElevenLabs)
+        self.async_client.text_to_speech = Mock()
+
+        async def convert(**kwargs):
+            yield b"\x00\x04"
+            yield b"\x00\x08"
+
+        self.async_client.text_to_speech.convert = Mock(side_effect=convert)
+
+        self.tts = ElevenLabsTTS(
+            voice_id="voice-id",
+            client=Mock(ElevenLabs),
+            async_client=self.async_client,
+            sample_rate=8000,
+            convert_kwargs=dict(model_id="model-id"),
+        )
+
+    async def test_get_speech_async(self):
+        result = await self.tts.get_speech_async("hello world")
+
+        self.assertEqual(8000, result.sample_rate)
+        np.testing.assert_allclose([0.03125, 0.0625], result.signal)
+
+        self.async_client.text_to_speech.convert.assert_called_once_with(
+            voice_id="voice-id",
+            text="hello world",
+            output_format="pcm_8000",
+            model_id="model-id",
+        )
+
+    async def test_get_speech_async_with_bytes_response(self):
+        async def convert(**kwargs):
+            return b"\x00\x04"
+
+        self.async_client.text_to_speech.convert.side_effect = convert
+
+        result = await self.tts.get_speech_async("hello world")
+
+        np.testing.assert_allclose([0.03125], result.signal)
+
+    def test_async_client_is_built_from_api_key(self):
+        tts = ElevenLabsTTS(voice_id="voice-id", api_key="api-key")
+
+        self.assertIsInstance(tts.async_client, AsyncElevenLabs)
+        self.assertIs(tts.async_client, tts.async_client)
@@ -1,12 +1,14 @@
+import asyncio
 import subprocess
+import threading
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from parameterized import parameterized
 
 from unit.utils import build_audio, assert_first_call
 from voicebox.ssml import SSML
-from voicebox.tts import ESpeakNG, ESpeakConfig
+from voicebox.tts import ESpeakNG, ESpeakConfig, PrewarmedESpeakNG
 
 
 class ESpeakNGTest(unittest.TestCase):
@@ -119,6 +121,70 @@ class ESpeakNGTest(unittest.TestCase):
 
         self.assertRaises(FileNotFoundError, tts.get_speech, "foo")
 
+    @patch("voicebox.tts.espeakng.iter_audio_from_wav_file")
+    @patch("subprocess.Popen")
+    def test_stream_speech(self, mock_Popen, mock_iter_audio_from_wav_file):
+        mock_Popen.return_value = self.mock_proc
+        chunks = [build_audio(), build_audio()]
+        mock_iter_audio_from_wav_file.return_value = iter(chunks)
+
+        config = ESpeakConfig(stream_chunk_size=512, timeout=7.8)
+        result = list(ESpeakNG(config).stream_speech("foo"))
+
+        self.assertEqual(chunks, result)
+        mock_iter_audio_from_wav_file.assert_called_once_with(
+            self.mock_proc.stdout, 512
+        )
+        self.mock_proc.kill.assert_not_called()
+        self.mock_proc.stdout.close.assert_called_once()
+        self.mock_proc.wait.assert_called_once_with(timeout=7.8)
+
+    @patch("voicebox.tts.espeakng.iter_audio_from_wav_file")
+    @patch("subprocess.Popen")
+    def test_stream_speech_kills_process_if_stream_is_closed_early(
+        self, mock_Popen, mock_iter_audio_from_wav_file
+    ):
+        mock_Popen.return_value = self.mock_proc
+        mock_iter_audio_from_wav_file.return_value = iter([build_audio()] * 3)
+
+        stream = ESpeakNG().stream_speech("foo")
+        next(stream)
+        stream.close()
+
+        self.mock_proc.kill.assert_called_once()
+        self.mock_proc.stdout.close.assert_called_once()
+        self.mock_proc.wait.assert_called_once()
+
+    @patch("voicebox.tts.espeakng.iter_audio_from_wav_file")
+    @patch("subprocess.Popen")
+    def test_stream_speech_kills_process_if_reading_fails(
+        self, mock_Popen, mock_iter_audio_from_wav_file
+    ):
+        mock_Popen.return_value = self.mock_proc
+        mock_iter_audio_from_wav_file.side_effect = ValueError("bad wav")
+
+        with self.assertRaises(ValueError):
+            list(ESpeakNG().stream_speech("foo"))
+
+        self.mock_proc.kill.assert_called_once()
+        self.mock_proc.stdout.close.assert_called_once()
+        self.mock_proc.wait.assert_called_once()
+
+    def test_fingerprint_changes_with_config(self):
+        tts = ESpeakNG()
+        fingerprint = tts.fingerprint()
+
+        self.assertEqual(fingerprint, ESpeakNG().fingerprint())
+
+        tts.config.voice = "en-us"
+        self.assertNotEqual(fingerprint, tts.fingerprint())
+
+    def test_fingerprint_ignores_timeout(self):
+        self.assertEqual(
+            ESpeakNG().fingerprint(),
+            ESpeakNG(ESpeakConfig(timeout=1.0)).fingerprint(),
+        )
+
     def _setup_mocks(
         self,
         mock_Popen,
@@ -145,3 +211,219 @@ class ESpeakNGTest(unittest.TestCase):
 
         self.mock_proc.wait.assert_called_once()
         self.mock_proc.wait.assert_called_once_with(timeout=config.timeout)
+
+
+class PrewarmedESpeakNGTest(unittest.TestCase):
+    def setUp(self):
+        self.procs = []
+        self.events = []
+
+        def Popen(args, **kwargs):
+            proc = Mock(args=args)
+            proc.poll.return_value = None
+            proc.stdin.write.side_effect = lambda data: self.events.append(data)
+            self.procs.append(proc)
+            self.events.append("start")
+            return proc
+
+        patcher = patch("subprocess.Popen", side_effect=Popen)
+        self.mock_Popen = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch("voicebox.tts.espeakng.get_audio_from_wav_file")
+        self.mock_get_audio_from_wav_file = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tts = PrewarmedESpeakNG()
+        self.addCleanup(self.tts.close)
+
+    def get_speech(self, tts: PrewarmedESpeakNG, text) -> None:
+        """Calls ``get_speech()``, and waits for the refill to finish."""
+
+        tts.get_speech(text)
+        tts._refill_future.result()
+
+    def test_get_speech_uses_prewarmed_process(self):
+        self.get_speech(self.tts, "foo")
+
+        self.assertEqual(2, len(self.procs))
+        first, prewarmed = self.procs
+        first.stdin.write.assert_called_once_with(b"foo")
+        prewarmed.stdin.write.assert_not_called()
+
+        self.get_speech(self.tts, "bar")
+
+        self.assertEqual(3, len(self.procs))
+        prewarmed.stdin.write.assert_called_once_with(b"bar")
+        prewarmed.stdin.close.assert_called_once()
+        self.mock_get_audio_from_wav_file.assert_called_with(prewarmed.stdout)
+
+    def test_refills_run_on_one_long_lived_thread(self):
+        thread_names = []
+        refill = self.tts._refill
+
+        def record_thread(args):
+            thread_names.append(threading.current_thread().name)
+            refill(args)
+
+        with patch.object(self.tts, "_refill", side_effect=record_thread):
+            for _ in range(3):
+                self.get_speech(self.tts, "foo")
+
+        self.assertEqual(3, len(thread_names))
+        self.assertEqual(1, len(set(thread_names)))
+        self.assertTrue(thread_names[0].startswith("PrewarmedESpeakNG"))
+
+    @patch("voicebox.tts.espeakng.iter_audio_from_wav_file")
+    def test_stream_speech_uses_prewarmed_process(self, mock_iter_audio_from_wav_file):
+        mock_iter_audio_from_wav_file.return_value = iter([build_audio()])
+        self.tts.warm_up()
+
+        list(self.tts.stream_speech("foo"))
+        self.tts._refill_future.result()
+
+        self.assertEqual(2, len(self.procs))
+        self.procs[0].stdin.write.assert_called_once_with(b"foo")
+        mock_iter_audio_from_wav_file.assert_called_once_with(
+            self.procs[0].stdout, self.tts.config.stream_chunk_size
+        )
+
+    def test_get_speech_async_uses_prewarmed_process(self):
+        self.tts.warm_up()
+
+        result = asyncio.run(self.tts.get_speech_async("foo"))
+        self.tts._refill_future.result()
+
+        self.assertIs(self.mock_get_audio_from_wav_file.return_value, result)
+        self.assertEqual(2, len(self.procs))
+        self.procs[0].stdin.write.assert_called_once_with(b"foo")
+
+    def test_text_is_sent_before_refill(self):
+        self.tts.warm_up()
+
+        self.get_speech(self.tts, "foo")
+
+        self.assertEqual(["start", b"foo", "start"], self.events)
+
+    def test_refill_is_discarded_if_closed_meanwhile(self):
+        start_proc = self.tts._start_proc
+
+        def start_and_close(args):
+            proc = start_proc(args)
+            self.tts.close()
+            return proc
+
+        with patch.object(self.tts, "_start_proc", side_effect=start_and_close):
+            self.tts.warm_up()
+
+        self.procs[0].kill.assert_called_once()
+        self.assertEqual({}, self.tts._procs)
+
+    def test_processes_run_same_command_as_ESpeakNG(self):
+        config = ESpeakConfig(speed=200, voice="en-us")
+        self.tts.config = config
+
+        self.get_speech(self.tts, "foo")
+
+        expected_args = ESpeakNG(config)._get_args("foo")
+        for proc in self.procs:
+            self.assertEqual(expected_args, proc.args)
+
+    def test_warm_up_starts_processes(self):
+        tts = PrewarmedESpeakNG(pool_size=2)
+
+        tts.warm_up()
+        tts.warm_up(ssml=True)
+
+        self.assertEqual(4, len(self.procs))
+        self.assertIn("-m", self.procs[-1].args)
+
+    def test_processes_of_outdated_config_are_killed(self):
+        self.get_speech(self.tts, "foo")
+        self.get_speech(self.tts, SSML("<speak>foo</speak>"))
+        old_prewarmed = self.procs[1], self.procs[3]
+
+        self.tts.config.speed = 200
+        self.get_speech(self.tts, "foo")
+
+        for proc in old_prewarmed:
+            proc.kill.assert_called_once()
+
+        self.assertIn("200", self.procs[-1].args)
+
+    def test_exited_prewarmed_process_is_replaced(self):
+        self.get_speech(self.tts, "foo")
+        self.procs[1].poll.return_value = 1
+
+        self.get_speech(self.tts, "foo")
+
+        self.procs[1].stdin.write.assert_not_called()
+        self.procs[2].stdin.write.assert_called_once_with(b"foo")
+
+    def test_close_kills_waiting_processes(self):
+        with self.tts as tts:
+            self.get_speech(tts, "foo")
+
+        self.procs[0].kill.assert_not_called()
+        self.procs[1].kill.assert_called_once()
+        self.assertEqual({}, self.tts._procs)
+        self.assertIsNone(self.tts._refill_executor)
+
+    def test_fingerprint_matches_ESpeakNG(self):
+        self.assertEqual(ESpeakNG().fingerprint(), self.tts.fingerprint())
+
+
+class ESpeakNGAsyncTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.audio = build_audio()
+
+        self.mock_proc = Mock(returncode=None)
+        self.mock_proc.communicate = AsyncMock(return_value=(b"wav data", None))
+        self.mock_proc.wait = AsyncMock()
+
+    @patch("voicebox.tts.espeakng.get_audio_from_wav_file")
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_speech_async(
+        self, mock_create_subprocess_exec, mock_get_audio_from_wav_file
+    ):
+        mock_create_subprocess_exec.return_value = self.mock_proc
+        mock_get_audio_from_wav_file.side_effect = lambda f: (
+            self.audio if f.read() == b"wav data" else None
+        )
+
+        tts = ESpeakNG(ESpeakConfig(speed=200))
+        result = await tts.get_speech_async(SSML("<speak>foo</speak>"))
+
+        self.assertIs(self.audio, result)
+        mock_create_subprocess_exec.assert_awaited_once_with(
+            *tts._get_args(SSML("")), stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        self.mock_proc.communicate.assert_awaited_once_with(b"<speak>foo</speak>")
+        self.mock_proc.kill.assert_not_called()
+
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_speech_async_kills_process_on_timeout(
+        self, mock_create_subprocess_exec
+    ):
+        async def communicate(input):
+            await asyncio.sleep(10)
+
+        self.mock_proc.communicate = communicate
+        mock_create_subprocess_exec.return_value = self.mock_proc
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await ESpeakNG(ESpeakConfig(timeout=0.01)).get_speech_async("foo")
+
+        self.mock_proc.kill.assert_called_once()
+        self.mock_proc.wait.assert_awaited_once()
+
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_speech_async_with_espeak_not_installed(
+        self, mock_create_subprocess_exec
+    ):
+        mock_create_subprocess_exec.side_effect = FileNotFoundError()
+
+        with self.assertRaises(FileNotFoundError) as context:
+            await ESpeakNG().get_speech_async("foo")
+
+        self.assertIn("is espeak-ng installed?", str(context.exception))
@@ -6,6 +6,7 @@ from google.cloud.texttospeech import (
     AudioConfig,
     AudioEncoding,
     SynthesisInput,
+    VoiceSelectionParams,
 )
 from parameterized import parameterized
 
@@ -74,3 +75,30 @@ class GoogleCloudTTSTest(unittest.TestCase):
             AudioEncoding.LINEAR16,
             self.tts.audio_config.audio_encoding,
         )
+
+    def test_fingerprint_changes_with_settings(self):
+        voice_params = VoiceSelectionParams(language_code="en-US")
+        tts = GoogleCloudTTS(self.client, voice_params)
+        fingerprint = tts.fingerprint()
+
+        self.assertEqual(
+            fingerprint,
+            GoogleCloudTTS(
+                Mock(), VoiceSelectionParams(language_code="en-US")
+            ).fingerprint(),
+        )
+
+        tts.audio_config.speaking_rate = 1.5
+        self.assertNotEqual(fingerprint, tts.fingerprint())
+
+    def test_fingerprint_does_not_modify_audio_config(self):
+        voice_params = VoiceSelectionParams(language_code="en-US")
+        audio_config = AudioConfig(audio_encoding=AudioEncoding.MP3)
+        tts = GoogleCloudTTS(self.client, voice_params, audio_config)
+
+        fingerprint = tts.fingerprint()
+
+        self.assertEqual(AudioEncoding.MP3, tts.audio_config.audio_encoding)
+        self.assertEqual(
+            fingerprint, GoogleCloudTTS(self.client, voice_params).fingerprint()
+        )
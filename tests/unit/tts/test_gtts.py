@@ -1,4 +1,7 @@
+import tempfile
 import unittest
+from io import BytesIO
+from pathlib import Path
 from unittest.mock import patch
 
 from unit.utils import assert_first_call, build_audio
@@ -15,11 +18,15 @@ class gTTSTest(unittest.TestCase):
         tts = gTTS(foo="bar", one=1)
         self.assertDictEqual(dict(foo="bar", one=1), tts.gtts_kwargs)
 
-    @patch("voicebox.tts.tts.get_audio_from_mp3")
+    @patch("voicebox.tts.tts.NamedTemporaryFile")
+    @patch("voicebox.tts.gtts.get_audio_from_mp3")
     @patch("voicebox.tts.gtts.gTTS_")
-    def test_get_speech(self, mock_gTTS, mock_get_audio_from_mp3):
+    def test_get_speech_decodes_mp3_in_memory(
+        self, mock_gTTS, mock_get_audio_from_mp3, mock_NamedTemporaryFile
+    ):
         audio = build_audio()
         mock_get_audio_from_mp3.return_value = audio
+        mock_gTTS.return_value.write_to_fp.side_effect = lambda f: f.write(b"mp3")
 
         tts = gTTS(key="value")
 
@@ -29,9 +36,31 @@ class gTTSTest(unittest.TestCase):
 
         assert_first_call(mock_gTTS, "foo", key="value")
         mock_gTTS.return_value.write_to_fp.assert_called_once()
-        mock_get_audio_from_mp3.assert_called_once()
+
+        (mp3_file,) = mock_get_audio_from_mp3.call_args.args
+        self.assertIsInstance(mp3_file, BytesIO)
+        self.assertEqual(b"mp3", mp3_file.read())
+
+        mock_NamedTemporaryFile.assert_not_called()
+
+    @patch("voicebox.tts.gtts.gTTS_")
+    def test_generate_speech_audio_file(self, mock_gTTS):
+        mock_gTTS.return_value.write_to_fp.side_effect = lambda f: f.write(b"mp3")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "speech.mp3"
+
+            gTTS().generate_speech_audio_file("foo", path)
+
+            self.assertEqual(b"mp3", path.read_bytes())
 
     def test_get_speech_with_SSML_raises_ValueError(self):
         tts = gTTS()
         with self.assertRaises(ValueError):
             tts.get_speech(SSML("<speak>foo</speak>"))
+
+    def test_fingerprint_changes_with_kwargs(self):
+        fingerprint = gTTS(lang="en", slow=False).fingerprint()
+
+        self.assertEqual(fingerprint, gTTS(slow=False, lang="en").fingerprint())
+        self.assertNotEqual(fingerprint, gTTS(lang="en", slow=True).fingerprint())
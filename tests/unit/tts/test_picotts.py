@@ -1,10 +1,12 @@
+import subprocess
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from unit.utils import assert_first_call, build_audio
 from voicebox.ssml import SSML
 from voicebox.tts.picotts import PicoTTS
+from voicebox.tts.tts import MEMORY_TEMP_FILE_DIR
 
 
 class PicoTTSTest(unittest.TestCase):
@@ -23,6 +25,11 @@ class PicoTTSTest(unittest.TestCase):
         self.assertIsNone(tts.temp_file_dir)
         self.assertEqual("voicebox-pico-tts-", tts.temp_file_prefix)
 
+    def test_temp_file_dir_can_be_kept_in_memory(self):
+        tts = PicoTTS(temp_file_dir=MEMORY_TEMP_FILE_DIR)
+
+        self.assertEqual(MEMORY_TEMP_FILE_DIR, tts.temp_file_dir)
+
     @patch("voicebox.tts.tts.NamedTemporaryFile")
     @patch("voicebox.tts.tts.get_audio_from_wav_file")
     @patch("subprocess.run")
@@ -84,6 +91,12 @@ class PicoTTSTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tts.get_speech(SSML("<speak>foo</speak>"))
 
+    def test_fingerprint_changes_with_language(self):
+        fingerprint = self.tts.fingerprint()
+
+        self.assertEqual(fingerprint, PicoTTS().fingerprint())
+        self.assertNotEqual(fingerprint, PicoTTS(language="de-DE").fingerprint())
+
     def _setup_mocks(
         self,
         mock_run,
@@ -108,3 +121,51 @@ class PicoTTSTest(unittest.TestCase):
         self.mock_get_audio_from_wav_file.assert_called_once_with(
             Path(self.tmp_file),
         )
+
+
+class PicoTTSAsyncTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.audio = build_audio()
+        self.tmp_file = "/some/tmp/file.wav"
+
+        self.mock_proc = Mock()
+        self.mock_proc.wait = AsyncMock(return_value=0)
+
+    @patch("voicebox.tts.tts.NamedTemporaryFile")
+    @patch("voicebox.tts.tts.get_audio_from_wav_file")
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_speech_async(
+        self,
+        mock_create_subprocess_exec,
+        mock_get_audio_from_wav_file,
+        mock_NamedTemporaryFile,
+    ):
+        mock_create_subprocess_exec.return_value = self.mock_proc
+        mock_get_audio_from_wav_file.return_value = self.audio
+        mock_NamedTemporaryFile.return_value.__enter__ = mock_NamedTemporaryFile
+        mock_NamedTemporaryFile.return_value.name = self.tmp_file
+
+        result = await PicoTTS(language="en-GB").get_speech_async("foo bar")
+
+        self.assertIs(self.audio, result)
+        mock_create_subprocess_exec.assert_awaited_once_with(
+            "pico2wave", "-w", self.tmp_file, "-l", "en-GB", "foo bar"
+        )
+        mock_get_audio_from_wav_file.assert_called_once_with(Path(self.tmp_file))
+
+    @patch("voicebox.tts.tts.NamedTemporaryFile")
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_speech_async_raises_if_pico2wave_fails(
+        self, mock_create_subprocess_exec, mock_NamedTemporaryFile
+    ):
+        self.mock_proc.wait.return_value = 1
+        mock_create_subprocess_exec.return_value = self.mock_proc
+        mock_NamedTemporaryFile.return_value.__enter__ = mock_NamedTemporaryFile
+        mock_NamedTemporaryFile.return_value.name = self.tmp_file
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            await PicoTTS().get_speech_async("foo bar")
+
+    async def test_get_speech_async_with_SSML_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            await PicoTTS().get_speech_async(SSML("<speak>foo</speak>"))
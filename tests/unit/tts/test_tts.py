@@ -1,10 +1,22 @@
+import os
+import tempfile
+import threading
+import time
+import traceback
 import unittest
-from unittest.mock import Mock, call
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, call, patch
 
 from parameterized import parameterized
 
 from unit.utils import assert_called_with_exactly, build_audio
-from voicebox.tts import TTS, FallbackTTS, RetryTTS
+from voicebox.sinks.wavefile import write_audio_to_wav
+from voicebox.tts import TTS, FallbackTTS, PooledTTS, RetryTTS, WavFileTTS
+from voicebox.tts.tts import (
+    MEMORY_TEMP_FILE_DIR,
+    TEMP_FILE_DIR_ENV_VAR,
+    resolve_temp_file_dir,
+)
 
 log = Mock()
 
@@ -27,6 +39,29 @@ class TTSTest(unittest.TestCase):
 
         tts.get_speech.assert_called_once_with("foo")
 
+    def test_stream_speech_yields_audio_from_get_speech(self):
+        audio = build_audio()
+
+        class TestTTS(TTS):
+            def get_speech(self, text):
+                return audio
+
+        self.assertEqual([audio], list(TestTTS().stream_speech("foo")))
+
+    def test_fingerprint_raises_NotImplementedError_by_default(self):
+        class TestTTS(TTS):
+            def get_speech(self, text):
+                return build_audio()
+
+        self.assertRaises(NotImplementedError, TestTTS().fingerprint)
+
+    def test_get_speech_batch_calls_get_speech_in_order(self):
+        class TestTTS(TTS):
+            def get_speech(self, text):
+                return text.upper()
+
+        self.assertEqual(["FOO", "BAR"], TestTTS().get_speech_batch(["foo", "bar"]))
+
 
 class FallbackTTSTest(unittest.TestCase):
     def test_get_speech_returns_first_good_tts_response(self):
@@ -69,6 +104,38 @@ class FallbackTTSTest(unittest.TestCase):
         tts = FallbackTTS([], log=log)
         self.assertRaises(ValueError, tts.get_speech, "foo")
 
+    def test_stream_speech_falls_back_if_stream_fails_to_start(self):
+        chunks = [build_audio(), build_audio()]
+
+        good_tts = Mock()
+        good_tts.stream_speech.return_value = iter(chunks)
+
+        tts = FallbackTTS([build_bad_stream_tts(), good_tts], log=log)
+
+        self.assertEqual(chunks, list(tts.stream_speech("foo")))
+        good_tts.stream_speech.assert_called_once_with("foo")
+
+    def test_stream_speech_does_not_fall_back_after_first_chunk(self):
+        other_tts = Mock()
+        tts = FallbackTTS([build_bad_stream_tts(chunks=1), other_tts], log=log)
+
+        stream = tts.stream_speech("foo")
+        next(stream)
+
+        self.assertRaises(Exception, next, stream)
+        other_tts.stream_speech.assert_not_called()
+
+    def test_fingerprint_depends_on_all_ttss(self):
+        tts_1, tts_2 = Mock(), Mock()
+        tts_1.fingerprint.return_value = "one"
+        tts_2.fingerprint.return_value = "two"
+
+        result = FallbackTTS([tts_1, tts_2]).fingerprint()
+
+        self.assertEqual(result, FallbackTTS([tts_1, tts_2]).fingerprint())
+        self.assertNotEqual(result, FallbackTTS([tts_2, tts_1]).fingerprint())
+        self.assertNotEqual(result, FallbackTTS([tts_1]).fingerprint())
+
 
 class RetryTTSTest(unittest.TestCase):
     def test_max_attempts_defaults_to_3(self):
@@ -118,6 +185,179 @@ class RetryTTSTest(unittest.TestCase):
         tts = RetryTTS(tts=Mock(), max_attempts=max_attempts, log=log)
         self.assertRaises(ValueError, tts.get_speech, "foo")
 
+    def test_stream_speech_retries_if_stream_fails_to_start(self):
+        chunks = [build_audio(), build_audio()]
+
+        mock_tts = Mock()
+        mock_tts.stream_speech.side_effect = [
+            build_bad_stream_tts().stream_speech("foo"),
+            iter(chunks),
+        ]
+
+        tts = RetryTTS(mock_tts, log=log)
+
+        self.assertEqual(chunks, list(tts.stream_speech("foo")))
+        assert_called_with_exactly(mock_tts.stream_speech, [call("foo")] * 2)
+
+    def test_stream_speech_does_not_retry_after_first_chunk(self):
+        mock_tts = build_bad_stream_tts(chunks=1)
+        tts = RetryTTS(mock_tts, log=log)
+
+        self.assertRaises(Exception, list, tts.stream_speech("foo"))
+        mock_tts.stream_speech.assert_called_once_with("foo")
+
+    def test_fingerprint_delegates_to_tts(self):
+        mock_tts = Mock()
+        mock_tts.fingerprint.return_value = "abc"
+
+        self.assertEqual("abc", RetryTTS(mock_tts).fingerprint())
+
+
+class PooledTTSTest(unittest.TestCase):
+    def test_get_speech_batch_returns_audio_in_order(self):
+        def get_speech(text):
+            # Finish the first texts last
+            time.sleep(0.01 * (5 - int(text)))
+            return text
+
+        tts = Mock()
+        tts.get_speech.side_effect = get_speech
+
+        with PooledTTS(tts, max_workers=5) as pooled_tts:
+            result = pooled_tts.get_speech_batch(map(str, range(5)))
+
+        self.assertEqual(["0", "1", "2", "3", "4"], result)
+
+    @parameterized.expand([(1,), (3,)])
+    def test_get_speech_batch_concurrency_is_bounded(self, max_workers: int):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def get_speech(text):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+
+            time.sleep(0.01)
+
+            with lock:
+                running -= 1
+
+            return text
+
+        tts = Mock()
+        tts.get_speech.side_effect = get_speech
+
+        with PooledTTS(tts, max_workers=max_workers) as pooled_tts:
+            pooled_tts.get_speech_batch(["foo"] * 10)
+
+        self.assertEqual(max_workers, max_running)
+
+    def test_get_speech_batch_raises_first_exception_and_cancels_rest(self):
+        started = []
+
+        def get_speech(text):
+            started.append(text)
+            if text == "bad":
+                raise ValueError("Whoopsiedoodle!")
+            time.sleep(0.01)
+            return text
+
+        tts = Mock()
+        tts.get_speech.side_effect = get_speech
+
+        with PooledTTS(tts, max_workers=1) as pooled_tts:
+            with self.assertRaises(ValueError):
+                pooled_tts.get_speech_batch(["foo", "bad"] + ["bar"] * 10)
+
+        self.assertLess(len(started), 12)
+
+    def test_other_calls_go_to_wrapped_tts(self):
+        tts = Mock()
+        pooled_tts = PooledTTS(tts)
+
+        self.assertEqual(tts.get_speech.return_value, pooled_tts.get_speech("foo"))
+        self.assertEqual(
+            tts.stream_speech.return_value, pooled_tts.stream_speech("foo")
+        )
+        self.assertEqual(tts.fingerprint.return_value, pooled_tts.fingerprint())
+        self.assertIsNone(pooled_tts._executor)
+
+    def test_close_shuts_down_executor(self):
+        pooled_tts = PooledTTS(Mock())
+        pooled_tts.get_speech_batch(["foo"])
+        executor = pooled_tts._executor
+
+        pooled_tts.close()
+
+        self.assertIsNone(pooled_tts._executor)
+        self.assertRaises(RuntimeError, executor.submit, print)
+
+
+class FakeWavFileTTS(WavFileTTS):
+    def __init__(self, temp_file_dir=None):
+        super().__init__(temp_file_dir, "voicebox-test-")
+        self.paths = []
+
+    def generate_speech_audio_file(self, text, audio_file_path):
+        self.paths.append(audio_file_path)
+        write_audio_to_wav(build_audio(), audio_file_path)
+
+
+class AudioFileTTSTest(unittest.TestCase):
+    def test_get_speech_deletes_temp_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tts = FakeWavFileTTS(temp_file_dir=temp_dir)
+
+            tts.get_speech("foo")
+
+            (path,) = tts.paths
+            self.assertEqual(Path(temp_dir), path.parent)
+            self.assertTrue(path.name.startswith("voicebox-test-"))
+            self.assertEqual(".wav", path.suffix)
+            self.assertEqual([], os.listdir(temp_dir))
+
+    def test_temp_audio_file_is_deleted_on_exception(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tts = FakeWavFileTTS(temp_file_dir=temp_dir)
+
+            with self.assertRaises(ValueError):
+                with tts.temp_audio_file() as path:
+                    self.assertTrue(path.exists())
+                    raise ValueError()
+
+            self.assertEqual([], os.listdir(temp_dir))
+
+
+class ResolveTempFileDirTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (None, {}, None),
+            ("/some/dir", {}, "/some/dir"),
+            (None, {TEMP_FILE_DIR_ENV_VAR: "/env/dir"}, "/env/dir"),
+            ("/some/dir", {TEMP_FILE_DIR_ENV_VAR: "/env/dir"}, "/some/dir"),
+            (None, {TEMP_FILE_DIR_ENV_VAR: ""}, None),
+        ]
+    )
+    def test(self, temp_file_dir, env, expected):
+        with patch.dict(os.environ, env, clear=True):
+            self.assertEqual(expected, resolve_temp_file_dir(temp_file_dir))
+
+    @parameterized.expand([(True, "/dev/shm"), (False, None)])
+    def test_memory(self, shm_is_usable: bool, expected):
+        env = {TEMP_FILE_DIR_ENV_VAR: MEMORY_TEMP_FILE_DIR}
+
+        with (
+            patch("os.path.isdir", return_value=shm_is_usable),
+            patch("os.access", return_value=True),
+        ):
+            self.assertEqual(expected, resolve_temp_file_dir(MEMORY_TEMP_FILE_DIR))
+
+            with patch.dict(os.environ, env):
+                self.assertEqual(expected, resolve_temp_file_dir(None))
+
 
 def build_bad_tts() -> TTS:
     def raise_exception(*unused):
@@ -127,3 +367,138 @@ def build_bad_tts() -> TTS:
     bad_tts.get_speech.side_effect = raise_exception
 
     return bad_tts
+
+
+def build_bad_stream_tts(chunks: int = 0) -> TTS:
+    def stream_speech(*unused):
+        for _ in range(chunks):
+            yield build_audio()
+
+        raise Exception("Whoopsiedoodle!")
+
+    bad_tts = Mock()
+    bad_tts.stream_speech.side_effect = stream_speech
+
+    return bad_tts
+
+
+class TTSAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_speech_async_runs_get_speech_in_executor(self):
+        audio = build_audio()
+        threads = []
+
+        class TestTTS(TTS):
+            def get_speech(self, text):
+                threads.append(threading.current_thread())
+                return audio
+
+        result = await TestTTS().get_speech_async("foo")
+
+        self.assertIs(audio, result)
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+    async def test_fallback_get_speech_async_returns_first_good_tts_response(self):
+        audio = build_audio()
+        bad_tts = build_bad_async_tts()
+        good_tts = Mock()
+        good_tts.get_speech_async = AsyncMock(return_value=audio)
+
+        tts = FallbackTTS([bad_tts, good_tts], log=log)
+
+        self.assertIs(audio, await tts.get_speech_async("foo"))
+        bad_tts.get_speech_async.assert_awaited_once_with("foo")
+        good_tts.get_speech_async.assert_awaited_once_with("foo")
+
+    async def test_fallback_get_speech_async_raises_last_exception(self):
+        tts = FallbackTTS([build_bad_async_tts(), build_bad_async_tts()], log=log)
+
+        with self.assertRaises(Exception):
+            await tts.get_speech_async("foo")
+
+    async def test_fallback_get_speech_async_does_not_catch_other_exceptions(self):
+        bad_tts = build_bad_async_tts(KeyboardInterrupt)
+        other_tts = build_bad_async_tts()
+
+        tts = FallbackTTS([bad_tts, other_tts], log=log)
+
+        with self.assertRaises(KeyboardInterrupt):
+            await tts.get_speech_async("foo")
+
+        other_tts.get_speech_async.assert_not_called()
+
+    async def test_retry_get_speech_async_returns_first_successful_attempt(self):
+        audio = build_audio()
+        mock_tts = Mock()
+        mock_tts.get_speech_async = AsyncMock(side_effect=[Exception(), audio])
+
+        tts = RetryTTS(mock_tts, log=log)
+
+        self.assertIs(audio, await tts.get_speech_async("foo"))
+        self.assertEqual(2, mock_tts.get_speech_async.await_count)
+
+    async def test_retry_get_speech_async_raises_after_max_attempts(self):
+        mock_tts = build_bad_async_tts()
+
+        tts = RetryTTS(mock_tts, max_attempts=2, log=log)
+
+        with self.assertRaises(Exception):
+            await tts.get_speech_async("foo")
+
+        self.assertEqual(2, mock_tts.get_speech_async.await_count)
+
+    @parameterized.expand(
+        [
+            ("fallback", lambda tts: FallbackTTS([tts], log=log)),
+            ("retry", lambda tts: RetryTTS(tts, max_attempts=1, log=log)),
+        ]
+    )
+    async def test_get_speech_async_reraises_original_exception(self, name, build):
+        bad_tts = build_bad_async_tts()
+        exception = bad_tts.get_speech_async.side_effect
+
+        with self.assertRaises(Exception) as context:
+            await build(bad_tts).get_speech_async("foo")
+
+        self.assertIs(exception, context.exception)
+        frames = traceback.extract_tb(context.exception.__traceback__)
+        self.assertNotIn("_handle", " ".join(frame.name for frame in frames))
+
+    async def test_retry_get_speech_async_with_no_attempts_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            await RetryTTS(Mock(), max_attempts=0).get_speech_async("foo")
+
+
+class AudioFileTTSAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_speech_async_reads_and_deletes_file_in_executor(self):
+        threads = []
+
+        class TestTTS(FakeWavFileTTS):
+            def get_audio_from_file(self, file_path):
+                threads.append(threading.current_thread())
+                return super().get_audio_from_file(file_path)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tts = TestTTS(temp_file_dir=temp_dir)
+
+            result = await tts.get_speech_async("foo")
+
+            self.assertEqual(build_audio(), result)
+            self.assertIsNot(threading.current_thread(), threads[0])
+            self.assertEqual([], os.listdir(temp_dir))
+
+    async def test_get_speech_async_deletes_temp_file_on_exception(self):
+        class TestTTS(FakeWavFileTTS):
+            def get_audio_from_file(self, file_path):
+                raise ValueError()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(ValueError):
+                await TestTTS(temp_file_dir=temp_dir).get_speech_async("foo")
+
+            self.assertEqual([], os.listdir(temp_dir))
+
+
+def build_bad_async_tts(exception=Exception) -> TTS:
+    tts = Mock()
+    tts.get_speech_async = AsyncMock(side_effect=exception("Whoopsiedoodle!"))
+    return tts
@@ -1,18 +1,137 @@
+import tempfile
 import unittest
 import wave
 from io import BytesIO
+from pathlib import Path
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 from parameterized import parameterized
 
+from pedalboard.io import AudioFile
+
+from voicebox.audio import PcmAudio
 from voicebox.tts.utils import (
     add_optional_items,
+    get_audio_from_mp3,
+    get_audio_from_mp3_audioread,
+    get_audio_from_samples,
     get_audio_from_wav_file,
+    iter_audio_from_pcm_chunks,
+    iter_audio_from_wav_file,
 )
 
 
+def build_mp3(signal: np.ndarray, sample_rate: int) -> bytes:
+    mp3_file = BytesIO()
+    with AudioFile(
+        mp3_file,
+        "w",
+        samplerate=sample_rate,
+        num_channels=len(signal),
+        format="mp3",
+    ) as f:
+        f.write(signal)
+
+    return mp3_file.getvalue()
+
+
+class GetAudioFromMp3Test(unittest.TestCase):
+    def setUp(self):
+        t = np.arange(24_000) / 24_000
+        self.signal = 0.5 * np.sin(2 * np.pi * 440 * t).astype(np.float32)
+
+    @parameterized.expand([(1,), (2,)])
+    def test_decodes_file_object_in_memory(self, channels: int):
+        mp3_file = BytesIO(build_mp3(np.tile(self.signal, (channels, 1)), 24_000))
+
+        audio = get_audio_from_mp3(mp3_file)
+
+        self.assert_audio_matches_signal(audio)
+
+    @patch("voicebox.tts.utils.get_audio_from_mp3_audioread")
+    def test_decodes_path_without_audioread(self, mock_audioread):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "audio.mp3"
+            path.write_bytes(build_mp3(self.signal[None], 24_000))
+
+            for file in (path, str(path)):
+                self.assert_audio_matches_signal(get_audio_from_mp3(file))
+
+        mock_audioread.assert_not_called()
+
+    @patch("voicebox.tts.utils.get_audio_from_mp3_audioread")
+    def test_falls_back_to_audioread_for_paths(self, mock_audioread):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "audio.mp3"
+            path.write_bytes(b"not an mp3")
+
+            result = get_audio_from_mp3(path)
+
+        self.assertIs(mock_audioread.return_value, result)
+        mock_audioread.assert_called_once_with(path)
+
+    def test_raises_ValueError_for_invalid_file_object(self):
+        with self.assertRaises(ValueError):
+            get_audio_from_mp3(BytesIO(b"not an mp3"))
+
+    def assert_audio_matches_signal(self, audio):
+        self.assertEqual(24_000, audio.sample_rate)
+        self.assertEqual(np.float32, audio.signal.dtype)
+        self.assertEqual(1, audio.signal.ndim)
+        self.assertGreaterEqual(len(audio), len(self.signal))
+        np.testing.assert_allclose(
+            np.abs(audio.signal).max(), np.abs(self.signal).max(), atol=0.05
+        )
+
+
+class GetAudioFromMp3AudioreadTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (1, [0, 16384, -16384, 0], [0.0, 0.5, -0.5, 0.0]),
+            (2, [0, 16384, -16384, 0], [0.25, -0.25]),
+        ]
+    )
+    @patch("audioread.audio_open")
+    def test(self, channels, samples, expected, mock_audio_open):
+        f = MagicMock(samplerate=24_000, channels=channels)
+        f.read_data.return_value = [np.int16(samples).tobytes()]
+        mock_audio_open.return_value.__enter__.return_value = f
+
+        audio = get_audio_from_mp3_audioread("audio.mp3")
+
+        self.assertEqual(24_000, audio.sample_rate)
+        np.testing.assert_array_equal(expected, audio.signal)
+
+
+class GetAudioFromSamplesTest(unittest.TestCase):
+    def setUp(self):
+        self.samples = np.int16([0, 16384, -32768])
+
+    def test_writes_signal_to_out(self):
+        out = np.empty(3, dtype=np.float32)
+
+        audio = get_audio_from_samples(self.samples, 8000, out=out)
+
+        self.assertIs(out, audio.signal)
+        np.testing.assert_array_equal([0.0, 0.5, -1.0], out)
+
+    def test_lazy_returns_PcmAudio(self):
+        audio = get_audio_from_samples(self.samples, 8000, lazy=True)
+
+        self.assertIsInstance(audio, PcmAudio)
+        self.assertIs(self.samples, audio.samples)
+        np.testing.assert_array_equal([0.0, 0.5, -1.0], audio.signal)
+
+    @parameterized.expand([(False,), (True,)])
+    def test_raises_ValueError_for_unsupported_dtype(self, lazy: bool):
+        with self.assertRaises(ValueError) as context:
+            get_audio_from_samples(np.int64([0]), 8000, lazy=lazy)
+
+        self.assertIn("int64", str(context.exception))
+
+
 class GetAudioFromWavFileTest(unittest.TestCase):
     @parameterized.expand(
         [
@@ -53,6 +172,16 @@ class GetAudioFromWavFileTest(unittest.TestCase):
         self.assertEqual(np.float32, result.signal.dtype)
         self.assertEqual(framerate, result.sample_rate)
 
+    def test_lazy_returns_PcmAudio(self):
+        frames = np.int16([0, 1024, -2048])
+        wav_file = self.build_wav(sampwidth=2, framerate=10_000, frames=frames)
+
+        result = get_audio_from_wav_file(wav_file, lazy=True)
+
+        self.assertIsInstance(result, PcmAudio)
+        np.testing.assert_array_equal(frames, result.samples)
+        self.assertEqual(10_000, result.sample_rate)
+
     def test_raises_KeyError_when_given_unsupported_sample_width(
         self,
         sampwidth: int = 3,
@@ -80,6 +209,43 @@ class GetAudioFromWavFileTest(unittest.TestCase):
         return wav_data
 
 
+class IterAudioFromWavFileTest(unittest.TestCase):
+    def test_yields_chunks_matching_whole_file(self):
+        frames = np.int16(np.arange(-500, 500) * 30)
+        build_wav = GetAudioFromWavFileTest.build_wav
+
+        result = list(iter_audio_from_wav_file(build_wav(2, 10_000, frames), 300))
+
+        self.assertEqual([300, 300, 300, 100], [len(a) for a in result])
+        self.assertEqual({10_000}, {a.sample_rate for a in result})
+
+        expected = get_audio_from_wav_file(build_wav(2, 10_000, frames))
+        np.testing.assert_array_equal(
+            expected.signal, np.concatenate([a.signal for a in result])
+        )
+
+
+class IterAudioFromPcmChunksTest(unittest.TestCase):
+    def test_carries_partial_samples_over_to_next_chunk(self):
+        data = np.int16([0, 1024, -2048, 32767, -32768]).astype("<i2").tobytes()
+        chunks = [data[:3], data[3:4], data[4:]]
+
+        result = list(iter_audio_from_pcm_chunks(chunks, 8000))
+
+        self.assertEqual([1, 1, 3], [len(a) for a in result])
+        np.testing.assert_allclose(
+            [0.0, 0.03125, -0.0625, 0.999969482, -1.0],
+            np.concatenate([a.signal for a in result]),
+        )
+        self.assertEqual({8000}, {a.sample_rate for a in result})
+
+    def test_drops_trailing_partial_sample(self):
+        result = list(iter_audio_from_pcm_chunks([b"\x00\x04\x00"], 8000))
+
+        self.assertEqual(1, len(result))
+        np.testing.assert_allclose([0.03125], result[0].signal)
+
+
 class AddOptionalItemsTest(unittest.TestCase):
     def test(self):
         d = {"foo": 1}
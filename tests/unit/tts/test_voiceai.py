@@ -1,10 +1,12 @@
+import json
 import unittest
 from unittest.mock import Mock, patch
 
+import httpx
 from requests import HTTPError
 
 from unit.utils import build_audio
-from voicebox.tts.voiceai import VoiceAiTTS
+from voicebox.tts.voiceai import VoiceAiTTS, _get_httpx_kwargs
 
 
 class VoiceAiTest(unittest.TestCase):
@@ -132,3 +134,116 @@ class VoiceAiTest(unittest.TestCase):
         self.assertRaises(HTTPError, self.tts.get_speech, "hello world")
 
         mock_requests.post.assert_called_once()
+
+    def test_fingerprint_ignores_api_key(self):
+        self.assertEqual(
+            VoiceAiTTS("key-1").fingerprint(), VoiceAiTTS("key-2").fingerprint()
+        )
+
+    def test_fingerprint_changes_with_settings(self):
+        tts = VoiceAiTTS(self.api_key)
+        fingerprint = tts.fingerprint()
+
+        tts.temperature = 0.5
+        self.assertNotEqual(fingerprint, tts.fingerprint())
+
+
+class VoiceAiAsyncTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.audio = build_audio()
+        self.requests = []
+
+    def build_client(self, status_code: int = 200) -> httpx.AsyncClient:
+        def handle(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(status_code, content=b"audio")
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+    @patch("voicebox.tts.voiceai.get_audio_from_wav_file")
+    async def test_get_speech_async(self, mock_get_audio_from_wav_file):
+        mock_get_audio_from_wav_file.side_effect = lambda f: (
+            self.audio if f.read() == b"audio" else None
+        )
+
+        async with self.build_client() as client:
+            tts = VoiceAiTTS(
+                "api-key",
+                voice_id="voice-id",
+                api_url="https://api.test/speech",
+                extra_headers={"Extra-Header": "EXTRA-HEADER"},
+                async_client=client,
+            )
+
+            result = await tts.get_speech_async("hello world")
+
+        self.assertIs(self.audio, result)
+
+        (request,) = self.requests
+        self.assertEqual("https://api.test/speech", str(request.url))
+        self.assertEqual("Bearer api-key", request.headers["Authorization"])
+        self.assertEqual("EXTRA-HEADER", request.headers["Extra-Header"])
+        self.assertEqual(
+            {"text": "hello world", "audio_format": "wav", "voice_id": "voice-id"},
+            json.loads(request.content),
+        )
+
+    @patch("voicebox.tts.voiceai.get_audio_from_wav_file")
+    async def test_get_speech_async_uses_request_kwargs(self, unused):
+        async with self.build_client() as client:
+            tts = VoiceAiTTS(
+                "api-key",
+                request_kwargs={"timeout": (1.0, 30.0), "params": {"a": "b"}},
+                async_client=client,
+            )
+
+            await tts.get_speech_async("hello world")
+
+        (request,) = self.requests
+        self.assertEqual("b", request.url.params["a"])
+        timeout = request.extensions["timeout"]
+        self.assertEqual(1.0, timeout["connect"])
+        self.assertEqual(30.0, timeout["read"])
+
+    @patch("voicebox.tts.voiceai.get_audio_from_wav_file")
+    async def test_get_speech_async_has_no_timeout_by_default(self, unused):
+        async with self.build_client() as client:
+            tts = VoiceAiTTS("api-key", async_client=client)
+
+            await tts.get_speech_async("hello world")
+
+        (request,) = self.requests
+        self.assertEqual(
+            {"connect": None, "read": None, "write": None, "pool": None},
+            request.extensions["timeout"],
+        )
+
+    def test_get_httpx_kwargs(self):
+        client_kwargs, post_kwargs = _get_httpx_kwargs(
+            {
+                "timeout": 5.0,
+                "verify": False,
+                "proxies": {"https": "http://proxy.test:8080"},
+                "allow_redirects": False,
+                "stream": True,
+            }
+        )
+
+        self.assertEqual({"timeout": 5.0, "follow_redirects": False}, post_kwargs)
+        self.assertFalse(client_kwargs["verify"])
+        self.assertEqual(["https://"], list(client_kwargs["mounts"]))
+
+    async def test_get_speech_async_raises_HTTPStatusError(self):
+        async with self.build_client(status_code=500) as client:
+            tts = VoiceAiTTS("api-key", async_client=client)
+
+            with self.assertRaises(httpx.HTTPStatusError):
+                await tts.get_speech_async("hello world")
+
+    @patch("voicebox.tts.voiceai.httpx", None)
+    async def test_get_speech_async_without_httpx_uses_get_speech(self):
+        tts = VoiceAiTTS("api-key")
+        tts.get_speech = Mock(return_value=self.audio)
+
+        self.assertIs(self.audio, await tts.get_speech_async("hello world"))
+        tts.get_speech.assert_called_once_with("hello world")
@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+from parameterized import parameterized
+
+from unit.utils import build_audio
+from voicebox.audio import Audio
+from voicebox.effects import Glitch, Normalize, RingMod, Vocoder
+from voicebox.effects.effect import Effect
+from voicebox.effects.vocoder import SawtoothWave
+from voicebox.tts.cache import CacheStats, fingerprint_key
+from voicebox.voiceboxes.cache import EffectsCache
+
+
+class EffectsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tts = Mock()
+        self.tts.get_speech.side_effect = lambda text: Audio(
+            np.float32([0.1, -0.2, 0.3]), 8000
+        )
+
+        self.effects = [Normalize(), RingMod()]
+        self.cache = EffectsCache({})
+
+    def test_build(self):
+        cache = EffectsCache.build(max_size=10, key_func=fingerprint_key)
+
+        self.assertEqual(10, cache.cache.maxsize)
+        self.assertEqual(1.0, cache.cache.getsizeof(build_audio(8000, 8000)))
+        self.assertIs(fingerprint_key, cache.key_func)
+
+    def test_get_speech_with_effects_caches_processed_audio(self):
+        result = self.cache.get_speech_with_effects(self.tts, self.effects, "foo")
+        cached = self.cache.get_speech_with_effects(self.tts, self.effects, "foo")
+
+        self.assertIs(result, cached)
+        expected = RingMod()(Normalize()(self.tts.get_speech("foo")))
+        self.assertEqual(expected, result)
+
+        self.tts.get_speech.assert_called_with("foo")
+        self.assertEqual(2, self.tts.get_speech.call_count)  # Including expected
+        self.assertEqual(CacheStats(hits=1, misses=1), self.cache.stats)
+
+    def test_effect_settings_are_part_of_key(self):
+        self.cache.get_speech_with_effects(self.tts, self.effects, "foo")
+        self.effects[0].max_amplitude = 0.5
+        self.cache.get_speech_with_effects(self.tts, self.effects, "foo")
+
+        self.assertEqual(2, len(self.cache.cache))
+        self.assertEqual(CacheStats(hits=0, misses=2), self.cache.stats)
+
+    @parameterized.expand(
+        [
+            ("carrier", lambda v: setattr(v.carrier_wave, "freq", 300.0)),
+            (
+                "filter builder",
+                lambda v: setattr(
+                    v.bandpass_filters[0].filter_param_builder, "order", 4
+                ),
+            ),
+        ]
+    )
+    def test_nested_effect_settings_are_part_of_key(self, name, mutate):
+        vocoder = Vocoder.build(
+            carrier_wave=SawtoothWave(160.0), bands=4, max_freq=3000
+        )
+        self.cache.get_speech_with_effects(self.tts, [vocoder], "foo")
+
+        mutate(vocoder)
+        self.cache.get_speech_with_effects(self.tts, [vocoder], "foo")
+
+        self.assertEqual(2, len(self.cache.cache))
+        self.assertEqual(CacheStats(hits=0, misses=2), self.cache.stats)
+
+    def test_get_key_includes_key_func(self):
+        self.tts.fingerprint.return_value = "abc"
+        cache = EffectsCache({}, key_func=fingerprint_key)
+
+        effects_fingerprint, tts_key = cache.get_key(self.tts, self.effects, "foo")
+
+        self.assertEqual(64, len(effects_fingerprint))
+        self.assertEqual(("abc", "foo"), tts_key)
+
+    def test_get_key_differs_for_streaming(self):
+        key = self.cache.get_key(self.tts, self.effects, "foo")
+
+        self.assertNotEqual(
+            key, self.cache.get_key(self.tts, self.effects, "foo", streaming=True)
+        )
+
+    def test_non_deterministic_effects_bypass_cache(self):
+        effects = [Normalize(), Glitch()]
+
+        self.assertIsNone(self.cache.get_key(self.tts, effects, "foo"))
+
+        self.cache.get_speech_with_effects(self.tts, effects, "foo")
+        self.cache.get_speech_with_effects(self.tts, effects, "foo")
+
+        self.assertEqual(2, self.tts.get_speech.call_count)
+        self.assertEqual({}, self.cache.cache)
+        self.assertEqual(CacheStats(), self.cache.stats)
+
+    def test_effects_that_cannot_be_fingerprinted_bypass_cache(self):
+        class UnsupportedEffect(Effect):
+            def __init__(self):
+                self.thing = object()
+
+            def apply(self, audio: Audio) -> Audio:
+                return audio
+
+        self.assertIsNone(self.cache.get_key(self.tts, [UnsupportedEffect()], "foo"))
+
+    def test_put_ignores_audio_too_large(self):
+        cache = EffectsCache.build(max_size=1, size_func="count")
+
+        cache.put("foo", build_audio())
+        cache.put("bar", build_audio())
+
+        self.assertEqual(1, len(cache.cache))
+
+        tiny_cache = EffectsCache.build(max_size=1, size_func="bytes")
+        tiny_cache.put("foo", build_audio(100))
+        self.assertEqual(0, len(tiny_cache.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,27 @@
 import unittest
+from threading import Event, Thread
 from time import sleep
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
+import numpy as np
 from parameterized import parameterized
 
-from unit.utils import assert_called_with_exactly
-from voicebox.effects import Normalize
+from unit.utils import assert_called_with_exactly, build_audio
+from voicebox.audio import Audio
+from voicebox.effects import Normalize, RingMod
+from voicebox.effects.effect import Effect
 from voicebox.sinks import SoundDevice
 from voicebox.tts import PicoTTS
-from voicebox.voiceboxes.parallel import ParallelVoicebox
+from voicebox.tts.cache import CacheStats
+from voicebox.voiceboxes.cache import EffectsCache
+from voicebox.voiceboxes.parallel import ParallelVoicebox, _AudioBlockStream
 from voicebox.voiceboxes.splitter import NoopSplitter
 
 
 class ParallelVoiceboxTest(unittest.TestCase):
     def setUp(self):
-        self.foo_audio = Mock()
-        self.bar_audio = Mock()
+        self.foo_audio = build_audio()
+        self.bar_audio = build_audio()
 
         self.tts = Mock()
         self.tts.get_speech.side_effect = lambda it: {
@@ -62,6 +68,10 @@ class ParallelVoiceboxTest(unittest.TestCase):
 
         self.assertIsInstance(voicebox.text_splitter, NoopSplitter)
 
+        self.assertFalse(voicebox.streaming)
+        self.assertIsNone(voicebox.effects_cache)
+        self.assertIsNone(voicebox.dtype)
+
     def test_property_setters(self):
         value = Mock()
 
@@ -77,6 +87,15 @@ class ParallelVoiceboxTest(unittest.TestCase):
         self.voicebox.text_splitter = value
         self.assertIs(self.voicebox.text_splitter, value)
 
+        self.voicebox.streaming = True
+        self.assertTrue(self.voicebox.streaming)
+
+        self.voicebox.effects_cache = value
+        self.assertIs(self.voicebox.effects_cache, value)
+
+        self.voicebox.dtype = np.float64
+        self.assertIs(self.voicebox.dtype, np.float64)
+
     def test_constructor_with_start_False(self):
         self.voicebox = ParallelVoicebox(start=False)
 
@@ -142,3 +161,214 @@ class ParallelVoiceboxTest(unittest.TestCase):
                 call(self.bar_audio),
             ],
         )
+
+
+class ParallelVoiceboxStreamingTest(unittest.TestCase):
+    def setUp(self):
+        self.chunks = [
+            Audio(np.float32([0.1, 0.2]), 4),
+            Audio(np.float32([0.3, 0.4]), 4),
+        ]
+
+        self.tts = Mock()
+        self.tts.stream_speech.side_effect = lambda text: iter(self.chunks)
+        self.tts.get_speech.side_effect = lambda text: Audio(
+            np.float32([0.1, 0.2, 0.3, 0.4]), 4
+        )
+
+        self.sink = Mock()
+        self.played_blocks = []
+        self.sink.play_stream.side_effect = lambda blocks: self.played_blocks.append(
+            list(blocks)
+        )
+
+    def build_voicebox(self, effects, streaming=True, **kwargs) -> ParallelVoicebox:
+        voicebox = ParallelVoicebox(
+            tts=self.tts,
+            effects=effects,
+            sink=self.sink,
+            queue_get_timeout=0.1,
+            streaming=streaming,
+            **kwargs,
+        )
+        self.addCleanup(voicebox.stop)
+        return voicebox
+
+    def test_say_streams_blocks_through_effects_to_sink(self):
+        effect = RingMod(carrier_freq=1.0)
+        voicebox = self.build_voicebox([effect])
+
+        voicebox.say("foo")
+        voicebox.say("bar")
+        voicebox.wait_until_done()
+
+        assert_called_with_exactly(self.tts.stream_speech, [call("foo"), call("bar")])
+        self.tts.get_speech.assert_not_called()
+        self.sink.play.assert_not_called()
+
+        expected = effect.apply(self.tts.get_speech("foo"))
+        self.assertEqual(2, len(self.played_blocks))
+        for blocks in self.played_blocks:
+            self.assertEqual(2, len(blocks))
+            np.testing.assert_allclose(
+                expected.signal, np.concatenate([b.signal for b in blocks])
+            )
+
+    def test_say_streams_blocks_in_dtype(self):
+        voicebox = self.build_voicebox([RingMod(carrier_freq=1.0)], dtype=np.float64)
+
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        (blocks,) = self.played_blocks
+        self.assertEqual([np.float64, np.float64], [b.dtype for b in blocks])
+
+    def test_say_falls_back_to_whole_audio_if_effects_cannot_stream(self):
+        class WholeAudioEffect(Effect):
+            def apply(self, audio: Audio) -> Audio:
+                return audio
+
+        voicebox = self.build_voicebox([WholeAudioEffect()])
+
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        self.tts.stream_speech.assert_not_called()
+        self.tts.get_speech.assert_called_once_with("foo")
+        self.sink.play.assert_called_once()
+        self.sink.play_stream.assert_not_called()
+
+    @patch("threading.excepthook")
+    def test_stream_is_closed_if_tts_fails(self, mock_excepthook):
+        def stream_speech(text):
+            yield self.chunks[0]
+            raise Exception("Whoopsiedoodle!")
+
+        self.tts.stream_speech.side_effect = stream_speech
+        voicebox = self.build_voicebox([])
+
+        voicebox.say("foo")
+        sleep(0.5)
+
+        self.assertEqual([[self.chunks[0]]], self.played_blocks)
+        mock_excepthook.assert_called_once()
+
+    def test_streamed_audio_is_cached_and_played_whole(self):
+        effects_cache = EffectsCache({})
+        voicebox = self.build_voicebox(
+            [RingMod(carrier_freq=1.0)], effects_cache=effects_cache
+        )
+
+        voicebox.say("foo")
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        self.tts.stream_speech.assert_called_once_with("foo")
+        self.assertEqual(1, len(self.played_blocks))
+
+        played_signal = np.concatenate([b.signal for b in self.played_blocks[0]])
+        self.sink.play.assert_called_once()
+        (audio,) = self.sink.play.call_args.args
+        np.testing.assert_array_equal(played_signal, audio.signal)
+        self.assertEqual(CacheStats(hits=1, misses=1), effects_cache.stats)
+
+    def test_cached_stream_is_not_modified_by_sink(self):
+        block_modified = Event()
+
+        def stream_speech(text):
+            yield self.chunks[0]
+            block_modified.wait(timeout=5)
+            yield self.chunks[1]
+
+        def play_stream(blocks):
+            played = []
+            for block in blocks:
+                played.append(block.copy())
+                block.signal[:] = 0
+                block_modified.set()
+
+            self.played_blocks.append(played)
+
+        self.tts.stream_speech.side_effect = stream_speech
+        self.sink.play_stream.side_effect = play_stream
+        effects_cache = EffectsCache({})
+        voicebox = self.build_voicebox(
+            [RingMod(carrier_freq=1.0)], effects_cache=effects_cache
+        )
+
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        (audio,) = effects_cache.cache.values()
+        played_signal = np.concatenate([b.signal for b in self.played_blocks[0]])
+        np.testing.assert_array_equal(played_signal, audio.signal)
+
+    def test_streamed_audio_is_cached_apart_from_whole_audio(self):
+        effects_cache = EffectsCache({})
+        effects = [RingMod(carrier_freq=1.0)]
+        streaming_voicebox = self.build_voicebox(effects, effects_cache=effects_cache)
+        voicebox = self.build_voicebox(
+            effects, effects_cache=effects_cache, streaming=False
+        )
+
+        streaming_voicebox.say("foo")
+        streaming_voicebox.wait_until_done()
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        self.tts.stream_speech.assert_called_once_with("foo")
+        self.tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual(2, len(effects_cache.cache))
+        self.assertEqual(CacheStats(hits=0, misses=2), effects_cache.stats)
+
+
+class AudioBlockStreamTest(unittest.TestCase):
+    def test_iteration_ends_when_closed(self):
+        blocks = _AudioBlockStream()
+        audios = [build_audio(), build_audio()]
+        for audio in audios:
+            blocks.put(audio)
+        blocks.close()
+
+        self.assertEqual(audios, list(blocks))
+
+    def test_iteration_ends_if_producer_dies_without_closing(self):
+        audio = build_audio()
+        streams = []
+
+        def produce():
+            streams.append(_AudioBlockStream(get_timeout=0.01))
+            streams[0].put(audio)
+
+        producer = Thread(target=produce)
+        producer.start()
+        producer.join()
+
+        self.assertEqual([audio], list(streams[0]))
+
+
+class ParallelVoiceboxEffectsCacheTest(unittest.TestCase):
+    def test_say_plays_cached_audio(self):
+        tts = Mock()
+        tts.get_speech.side_effect = lambda text: Audio(np.float32([0.1, 0.2]), 4)
+        sink = Mock()
+        effects_cache = EffectsCache({})
+
+        voicebox = ParallelVoicebox(
+            tts=tts,
+            effects=[Normalize()],
+            sink=sink,
+            queue_get_timeout=0.1,
+            effects_cache=effects_cache,
+        )
+        self.addCleanup(voicebox.stop)
+
+        voicebox.say("foo")
+        voicebox.say("foo")
+        voicebox.wait_until_done()
+
+        tts.get_speech.assert_called_once_with("foo")
+        self.assertEqual(2, sink.play.call_count)
+        first, second = (c.args[0] for c in sink.play.call_args_list)
+        self.assertIs(first, second)
+        self.assertEqual(CacheStats(hits=1, misses=1), effects_cache.stats)